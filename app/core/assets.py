@@ -0,0 +1,209 @@
+# core/assets.py
+"""Fingerprinted, precompressed JS/CSS.
+
+`build_assets()` (also `python script.py build-assets`) copies every file
+under app/templates/js and app/templates/css to ASSET_BUILD_DIR with a hash
+of its content in the name (js/main.js -> js/main.3f2a9c1b04de.js), writes
+.gz and, when the `brotli` package is installed, .br variants next to it,
+and records the mapping in manifest.json. Templates emit URLs with
+
+    <script src="{{ asset_url('js/main.js') }}"></script>
+
+so a changed file gets a new URL and every URL can be cached forever.
+Files from earlier builds are left in place, so pages rendered before a
+deploy keep working.
+
+`AssetFiles` serves the build directory: the .br or .gz variant when the
+client accepts it, with `Cache-Control: immutable` for fingerprinted names.
+With template auto-reload on (dev), a source file edited after the build is
+rebuilt the next time its URL is asked for.
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+from typing import Optional
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+
+from app.core.config import settings
+
+import logging
+logger = logging.getLogger(__name__)
+
+ASSET_SOURCE_DIR = "app/templates"
+ASSET_DIRS = ("js", "css")
+MANIFEST_NAME = "manifest.json"
+IMMUTABLE_CACHE_CONTROL = f"public, max-age={365 * 24 * 3600}, immutable"
+
+# (Content-Encoding, file suffix), best first
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def _fingerprint(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def _write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+def build_asset(name: str, source_dir: str = ASSET_SOURCE_DIR, build_dir: Optional[str] = None) -> str:
+    """Fingerprint and compress one source file; returns its built name."""
+    build_dir = build_dir or settings.ASSET_BUILD_DIR
+    with open(os.path.join(source_dir, name), "rb") as fh:
+        data = fh.read()
+    stem, ext = os.path.splitext(name)
+    built = f"{stem}.{_fingerprint(data)}{ext}"
+    target = os.path.join(build_dir, built)
+    if not os.path.exists(target):
+        _write(target, data)
+        variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+        brotli = _brotli()
+        if brotli is not None:
+            variants[".br"] = brotli.compress(data, quality=11)
+        for suffix, compressed in variants.items():
+            # tiny files can grow when compressed; those are only served as-is
+            if len(compressed) < len(data):
+                _write(target + suffix, compressed)
+    return built
+
+
+def build_assets(source_dir: str = ASSET_SOURCE_DIR, build_dir: Optional[str] = None) -> dict:
+    """Build every asset and write the manifest; returns {source name: built name}."""
+    build_dir = build_dir or settings.ASSET_BUILD_DIR
+    if _brotli() is None:
+        logger.info("brotli not installed; building gzip variants only")
+    manifest = {}
+    for directory in ASSET_DIRS:
+        for root, _, files in os.walk(os.path.join(source_dir, directory)):
+            for filename in sorted(files):
+                name = os.path.relpath(os.path.join(root, filename), source_dir).replace(os.sep, "/")
+                manifest[name] = build_asset(name, source_dir, build_dir)
+    _write(os.path.join(build_dir, MANIFEST_NAME), json.dumps(manifest, indent=2, sort_keys=True).encode())
+    logger.info("Built %d assets into %s", len(manifest), build_dir)
+    return manifest
+
+
+class AssetManifest:
+    """Source name -> fingerprinted URL, loaded from the build's manifest.json."""
+
+    def __init__(self, build_dir: str, url_prefix: str, source_dir: str = ASSET_SOURCE_DIR, auto_rebuild: bool = False):
+        self.build_dir = build_dir
+        self.url_prefix = url_prefix.rstrip("/")
+        self.source_dir = source_dir
+        self.auto_rebuild = auto_rebuild
+        self._lock = threading.Lock()
+        self._entries: dict = {}
+        self._mtimes: dict = {}
+        self.load()
+
+    def load(self) -> None:
+        path = os.path.join(self.build_dir, MANIFEST_NAME)
+        try:
+            with open(path) as fh:
+                self._entries = json.load(fh)
+        except FileNotFoundError:
+            self._entries = {}
+
+    def _refresh(self, name: str) -> None:
+        try:
+            mtime = os.stat(os.path.join(self.source_dir, name)).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if self._mtimes.get(name) != mtime:
+            with self._lock:
+                self._entries[name] = build_asset(name, self.source_dir, self.build_dir)
+                self._mtimes[name] = mtime
+
+    def url(self, name: str) -> str:
+        if self.auto_rebuild:
+            self._refresh(name)
+        built = self._entries.get(name)
+        if built is None:
+            raise KeyError(f"Unknown asset {name!r}; run `python script.py build-assets`")
+        return f"{self.url_prefix}/{built}"
+
+
+def accepted_encodings(scope) -> set:
+    """Content codings the client accepts (q > 0), lower-cased."""
+    accepted = set()
+    for item in Headers(scope=scope).get("accept-encoding", "").split(","):
+        coding, _, params = item.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class AssetFiles(StaticFiles):
+    """StaticFiles for the build directory with Accept-Encoding negotiation and immutable caching."""
+
+    async def get_response(self, path: str, scope):
+        accepted = accepted_encodings(scope)
+        for coding, suffix in ENCODINGS:
+            if coding in accepted or "*" in accepted:
+                _, stat_result = self.lookup_path(path + suffix)
+                if stat_result is not None:
+                    response = await super().get_response(path + suffix, scope)
+                    response.headers["content-encoding"] = coding
+                    response.headers["content-type"] = self._media_type(path)
+                    break
+        else:
+            response = await super().get_response(path, scope)
+        # every built file except the manifest has its content hash in the name
+        if os.path.basename(path) == MANIFEST_NAME:
+            response.headers["cache-control"] = "no-cache"
+        elif response.status_code in (200, 304):
+            response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        response.headers["vary"] = "Accept-Encoding"
+        return response
+
+    @staticmethod
+    def _media_type(path: str) -> str:
+        # what FileResponse would have sent for the uncompressed file
+        media_type = mimetypes.guess_type(path)[0] or "text/plain"
+        return f"{media_type}; charset=utf-8" if media_type.startswith("text/") else media_type
+
+
+_assets: Optional[AssetManifest] = None
+_assets_lock = threading.Lock()
+
+
+def get_assets() -> AssetManifest:
+    """The process's manifest; builds the assets first if there is no manifest yet."""
+    global _assets
+    if _assets is None:
+        with _assets_lock:
+            if _assets is None:
+                build_dir = settings.ASSET_BUILD_DIR
+                if settings.ASSET_BUILD_ON_STARTUP or not os.path.exists(os.path.join(build_dir, MANIFEST_NAME)):
+                    build_assets(build_dir=build_dir)
+                _assets = AssetManifest(build_dir, settings.ASSET_URL_PREFIX, auto_rebuild=settings.template_auto_reload())
+    return _assets
+
+
+def asset_url(name: str) -> str:
+    """Fingerprinted URL of a file under app/templates/js or app/templates/css."""
+    return get_assets().url(name)
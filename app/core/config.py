@@ -1,10 +1,77 @@
 # core/config.py
 import os
 from datetime import timedelta
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Named engine profiles; any DB_* / SQLITE_* setting that is set explicitly wins.
+DB_PROFILES = {
+    "dev": {
+        "echo": True,
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "statement_timeout_ms": None,
+        "sqlite_journal_mode": "WAL",
+        "sqlite_synchronous": "NORMAL",
+        "sqlite_mmap_size": 0,
+    },
+    "bench": {
+        "echo": False,
+        "pool_size": 20,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_pre_ping": False,
+        "pool_recycle": 3600,
+        "statement_timeout_ms": None,
+        "sqlite_journal_mode": "WAL",
+        "sqlite_synchronous": "OFF",
+        "sqlite_mmap_size": 268435456,
+    },
+    "prod": {
+        "echo": False,
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "statement_timeout_ms": 15000,
+        "sqlite_journal_mode": "WAL",
+        "sqlite_synchronous": "NORMAL",
+        "sqlite_mmap_size": 268435456,
+    },
+}
+
 class Settings(BaseSettings):
     DATABASE_URL: str
+
+    # Database engine (see db.py)
+    DB_PROFILE: str = "dev"  # dev | bench | prod
+    DB_ECHO: Optional[bool] = None
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[int] = None
+    DB_POOL_PRE_PING: Optional[bool] = None
+    DB_POOL_RECYCLE: Optional[int] = None
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None
+    SQLITE_JOURNAL_MODE: Optional[str] = None
+    SQLITE_SYNCHRONOUS: Optional[str] = None
+    SQLITE_MMAP_SIZE: Optional[int] = None
+    # Serve the hot read endpoints (task lists, dashboards) from the AsyncSession path
+    DB_ASYNC_READS: bool = False
+    # Per-request statement counting (see core/query_stats.py)
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_REPEAT_WARN_THRESHOLD: int = 10  # warn when one statement shape repeats more often; 0 disables
+    # Slow-query log (see core/slow_queries.py); SLOW_QUERY_MS=0 disables it
+    SLOW_QUERY_MS: float = 500
+    SLOW_QUERY_EXPLAIN: bool = True
+    SLOW_QUERY_EXPLAIN_ANALYZE: bool = False  # Postgres only; re-executes the SELECT
+    SLOW_QUERY_LOG_FILE: str = "logs/slow_queries.log"
+    SLOW_QUERY_LOG_MAX_BYTES: int = 5 * 1024 * 1024
+    SLOW_QUERY_LOG_BACKUPS: int = 3
+
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your-secret-key")
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
@@ -16,7 +83,77 @@ class Settings(BaseSettings):
     
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+    # Authenticated-principal cache (see core/security.py)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+
+    # Password hashing executor: "thread" or "process", bounded to PASSWORD_HASH_WORKERS
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+
+    # Rate limiting and load shedding (see core/rate_limit.py)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_STORE: str = "memory"  # "memory" or "redis" (uses REDIS_URL)
+    RATE_LIMIT_TRUST_FORWARDED: bool = False  # key on X-Forwarded-For behind a trusted proxy
+    LOGIN_RATE_LIMIT_PER_IP: int = 20
+    LOGIN_RATE_LIMIT_PER_ACCOUNT: int = 10  # failed logins only
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 60
+    PASSWORD_RESET_RATE_LIMIT: int = 5
+    PASSWORD_RESET_RATE_LIMIT_WINDOW_SECONDS: int = 300
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # Shared Jinja2 environment (see core/templates.py)
+    TEMPLATE_AUTO_RELOAD: Optional[bool] = None  # default: on for DB_PROFILE=dev only
+    TEMPLATE_BYTECODE_CACHE_DIR: str = ".cache/jinja2"  # "" keeps compiled templates in memory only
+    TEMPLATE_PRECOMPILE: bool = False  # compile every template at startup
+
+    # Fingerprinted JS/CSS (see core/assets.py)
+    ASSET_BUILD_DIR: str = ".cache/assets"
+    ASSET_URL_PREFIX: str = "/assets"
+    ASSET_BUILD_ON_STARTUP: bool = False  # rebuild at startup even when a manifest exists
+
+    # Read-through cache for list payloads (see utils/cache_utils.py)
+    CACHE_BACKEND: str = "memory"  # "memory", "redis" (uses REDIS_URL) or "none"
+    CACHE_DEFAULT_TTL_SECONDS: int = 60
+    CACHE_MAX_ENTRIES: int = 10000  # memory backend only
+    CACHE_LOCK_TIMEOUT_SECONDS: float = 5  # how long concurrent misses wait for the one building the value
+    CACHE_KEY_PREFIX: str = "tms:"  # redis backend only
+    FRAGMENT_CACHE_TTL_SECONDS: int = 300  # rendered dashboard widgets; writes invalidate them sooner
+
+    # Streaming exports (see routers/exports.py)
+    EXPORT_BATCH_SIZE: int = 2000  # rows fetched per round trip from the server-side cursor
+    EXPORT_CHUNK_BYTES: int = 64 * 1024  # serialized bytes buffered before each write
+
+    # Bulk endpoints (task batches, status transitions, onboarding)
+    BULK_MAX_ITEMS: int = 1000  # items accepted in one request
+    BULK_HASH_WORKERS: int = 0  # processes hashing passwords for employee onboarding; 0 = every core
+
     # Link with .env
     model_config = SettingsConfigDict(env_file="./.env", extra="ignore")
 
+    def db_engine_config(self) -> dict:
+        """Resolve DB_PROFILE plus explicit overrides into one engine config dict."""
+        if self.DB_PROFILE not in DB_PROFILES:
+            raise ValueError(f"Unknown DB_PROFILE {self.DB_PROFILE!r}, expected one of {sorted(DB_PROFILES)}")
+        config = dict(DB_PROFILES[self.DB_PROFILE])
+        overrides = {
+            "echo": self.DB_ECHO,
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_timeout": self.DB_POOL_TIMEOUT,
+            "pool_pre_ping": self.DB_POOL_PRE_PING,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "statement_timeout_ms": self.DB_STATEMENT_TIMEOUT_MS,
+            "sqlite_journal_mode": self.SQLITE_JOURNAL_MODE,
+            "sqlite_synchronous": self.SQLITE_SYNCHRONOUS,
+            "sqlite_mmap_size": self.SQLITE_MMAP_SIZE,
+        }
+        config.update({k: v for k, v in overrides.items() if v is not None})
+        return config
+
+    def template_auto_reload(self) -> bool:
+        if self.TEMPLATE_AUTO_RELOAD is not None:
+            return self.TEMPLATE_AUTO_RELOAD
+        return self.DB_PROFILE == "dev"
+
 settings = Settings()
@@ -0,0 +1,131 @@
+# core/query_stats.py
+"""Per-request SQL statement counting and N+1 detection.
+
+Engine events count every statement executed while a request is in flight
+and add up the time spent in the database. The middleware reports both on
+the response:
+
+    Server-Timing: db;dur=12.41;desc="7 queries"
+    X-Query-Count: 7
+
+When one statement shape (the SQL text with IN-lists collapsed) runs more
+than QUERY_REPEAT_WARN_THRESHOLD times in a request, a warning names it;
+that is almost always a query inside a Python loop.
+
+Tests can hold an endpoint to a budget:
+
+    response = client.get("/manager/dashboard")
+    assert_query_budget(response, 10)
+
+or wrap any block, including TestClient calls (the request inherits the
+test's context):
+
+    with query_budget(3):
+        _manager_dashboard_context(db, manager)
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import event
+
+from app.core.config import settings
+
+import logging
+logger = logging.getLogger(__name__)
+
+_IN_LIST = re.compile(r"\bIN \([^()]*\)", re.IGNORECASE)
+
+
+def statement_shape(statement: str) -> str:
+    """SQL text with expanded IN-lists collapsed, so batches of any size compare equal."""
+    return _IN_LIST.sub("IN (...)", " ".join(statement.split()))
+
+
+class QueryStats:
+    def __init__(self, route: str = "", parent: Optional["QueryStats"] = None):
+        self.route = route
+        self.parent = parent  # an enclosing tracker also sees these statements
+        self.count = 0
+        self.total_seconds = 0.0
+        self.shapes = Counter()
+        self._warned = set()
+
+    def record(self, statement: str, elapsed: float):
+        if self.parent is not None:
+            self.parent.record(statement, elapsed)
+        self.count += 1
+        self.total_seconds += elapsed
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        threshold = settings.QUERY_REPEAT_WARN_THRESHOLD
+        if threshold and self.shapes[shape] > threshold and shape not in self._warned:
+            self._warned.add(shape)
+            logger.warning("Possible N+1 on %s: statement repeated more than %d times: %s", self.route or "<no route>", threshold, shape[:300])
+
+    def repeated(self, min_count: int = 2) -> list:
+        """(shape, count) pairs that ran at least `min_count` times, most frequent first."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= min_count]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def install_query_stats(engine):
+    """Attach the counting listeners to a (sync) engine; pass `async_engine.sync_engine` for async."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start"].pop()
+        stats = _current.get()
+        if stats is not None:
+            stats.record(statement, time.perf_counter() - started)
+
+
+@contextmanager
+def track_queries(route: str = ""):
+    """Collect statements executed in this context (and threads/tasks it starts)."""
+    stats = QueryStats(route, parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int):
+    with track_queries() as stats:
+        yield stats
+    assert stats.count <= max_queries, (
+        f"{stats.count} queries, budget {max_queries}; repeated: {stats.repeated()[:5]}"
+    )
+
+
+def assert_query_budget(response, max_queries: int):
+    """Check the X-Query-Count header of a TestClient/httpx response."""
+    count = int(response.headers["X-Query-Count"])
+    assert count <= max_queries, f"{response.request.method} {response.request.url.path}: {count} queries, budget {max_queries}"
+
+
+async def query_stats_middleware(request: Request, call_next):
+    if not settings.QUERY_STATS_ENABLED:
+        return await call_next(request)
+    with track_queries(f"{request.method} {request.url.path}") as stats:
+        response = await call_next(request)
+    db_ms = stats.total_seconds * 1000
+    response.headers.append("Server-Timing", f'db;dur={db_ms:.2f};desc="{stats.count} queries"')
+    response.headers["X-Query-Count"] = str(stats.count)
+    return response
@@ -0,0 +1,248 @@
+# core/rate_limit.py
+"""Rate limiting and load shedding for the CPU-expensive (bcrypt) routes.
+
+Limits use a sliding-window counter: the previous fixed window's count is
+weighted by how much of it still overlaps the sliding window. That keeps one
+small record per key, in process or in Redis.
+
+Limiters are FastAPI dependencies, so a limited request is rejected with 429
+before the handler starts any hashing work:
+
+    @router.post("/login", dependencies=[Depends(login_ip_limit), Depends(shed_hash_load)])
+"""
+import math
+import threading
+import time
+from typing import Callable, Optional, Protocol
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+from app.core.security import hash_jobs_pending
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class RateLimitStore(Protocol):
+    def hit(self, key: str, limit: int, window_seconds: int) -> tuple[bool, float]:
+        """Count one request for `key`; return (allowed, retry_after_seconds)."""
+
+    def peek(self, key: str, limit: int, window_seconds: int) -> tuple[bool, float]:
+        """Whether one more request for `key` would be allowed, without counting it."""
+
+
+def _sliding_window(previous: int, current: int, window_start: float, now: float, limit: int, window_seconds: int) -> tuple[bool, float]:
+    elapsed = now - window_start
+    weight = max(0.0, 1.0 - elapsed / window_seconds)
+    estimated = previous * weight + current
+    if estimated <= limit:
+        return True, 0.0
+    # time until the previous window has decayed enough to admit one more request
+    if previous:
+        needed = (estimated - limit) / previous * window_seconds
+        return False, max(1.0, min(window_seconds - elapsed, needed))
+    return False, max(1.0, window_seconds - elapsed)
+
+
+class InMemoryStore:
+    """Per-process store. Limits are per worker when running several workers."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._windows: dict[str, list] = {}  # key -> [window_index, previous, current]
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, limit: int, window_seconds: int) -> tuple[bool, float]:
+        now = time.time()
+        index = int(now // window_seconds)
+        with self._lock:
+            entry = self._windows.get(key)
+            if entry is None:
+                if len(self._windows) >= self.max_keys:
+                    self._evict(index, window_seconds)
+                entry = self._windows[key] = [index, 0, 0]
+            elif entry[0] != index:
+                entry[1] = entry[2] if entry[0] == index - 1 else 0
+                entry[2] = 0
+                entry[0] = index
+            entry[2] += 1
+            allowed, retry_after = _sliding_window(entry[1], entry[2], index * window_seconds, now, limit, window_seconds)
+            if not allowed:
+                # rejected requests should not keep extending the penalty
+                entry[2] -= 1
+            return allowed, retry_after
+
+    def peek(self, key: str, limit: int, window_seconds: int) -> tuple[bool, float]:
+        now = time.time()
+        index = int(now // window_seconds)
+        with self._lock:
+            entry = self._windows.get(key)
+            if entry is None:
+                previous, current = 0, 0
+            elif entry[0] == index:
+                previous, current = entry[1], entry[2]
+            else:
+                previous, current = (entry[2] if entry[0] == index - 1 else 0), 0
+        return _sliding_window(previous, current + 1, index * window_seconds, now, limit, window_seconds)
+
+    def _evict(self, index: int, window_seconds: int) -> None:
+        stale = [k for k, (i, _, _) in self._windows.items() if i < index - 1]
+        for k in stale:
+            del self._windows[k]
+        if len(self._windows) >= self.max_keys:
+            # everything is hot; drop the oldest half rather than grow unbounded
+            for k in list(self._windows)[: self.max_keys // 2]:
+                del self._windows[k]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._windows.clear()
+
+
+class RedisStore:
+    """Shared store so limits hold across workers and hosts.
+
+    Fails open: while Redis is unreachable requests are allowed (and logged)
+    rather than turning every login into a 500.
+    """
+
+    def __init__(self, url: str):
+        import redis  # optional dependency, only needed for RATE_LIMIT_STORE=redis
+        self._errors = redis.RedisError
+        # short timeouts: a limiter that hangs is worse than one that lets a request through
+        self._client = redis.from_url(url, socket_connect_timeout=1, socket_timeout=1)
+        self._client.ping()  # from_url() does not connect; fail here so get_store() can fall back
+
+    def hit(self, key: str, limit: int, window_seconds: int) -> tuple[bool, float]:
+        now = time.time()
+        index = int(now // window_seconds)
+        current_key = f"{key}:{index}"
+        try:
+            pipe = self._client.pipeline()
+            pipe.incr(current_key)
+            pipe.expire(current_key, window_seconds * 2)
+            pipe.get(f"{key}:{index - 1}")
+            current, _, previous = pipe.execute()
+            allowed, retry_after = _sliding_window(int(previous or 0), int(current), index * window_seconds, now, limit, window_seconds)
+            if not allowed:
+                self._client.decr(current_key)
+        except self._errors as e:
+            logger.warning("Redis rate-limit store unavailable, allowing %s: %s", key, e)
+            return True, 0.0
+        return allowed, retry_after
+
+    def peek(self, key: str, limit: int, window_seconds: int) -> tuple[bool, float]:
+        now = time.time()
+        index = int(now // window_seconds)
+        try:
+            current, previous = self._client.mget(f"{key}:{index}", f"{key}:{index - 1}")
+        except self._errors as e:
+            logger.warning("Redis rate-limit store unavailable, allowing %s: %s", key, e)
+            return True, 0.0
+        return _sliding_window(int(previous or 0), int(current or 0) + 1, index * window_seconds, now, limit, window_seconds)
+
+_store: Optional[RateLimitStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> RateLimitStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                if settings.RATE_LIMIT_STORE == "redis":
+                    try:
+                        _store = RedisStore(settings.REDIS_URL)
+                    except Exception:
+                        logger.exception("Redis rate-limit store unavailable, falling back to in-memory store")
+                        _store = InMemoryStore()
+                else:
+                    _store = InMemoryStore()
+    return _store
+
+
+def set_store(store: RateLimitStore) -> None:
+    """Swap the backing store (e.g. a shared store configured at startup)."""
+    global _store
+    _store = store
+
+
+def client_ip(request: Request) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def _too_many(retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many requests, try again later",
+        headers={"Retry-After": str(math.ceil(retry_after))},
+    )
+
+
+class RateLimit:
+    """Allow `limit` requests per `window_seconds` for each key.
+
+    Used as a dependency it keys on `key_func(request)` (client IP by default).
+    Handlers that only learn the key from the body (e.g. the login email) call
+    `check(identity)` before doing any expensive work.
+    """
+
+    def __init__(self, scope: str, limit: int, window_seconds: int, key_func: Callable[[Request], str] = client_ip):
+        self.scope = scope
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.key_func = key_func
+
+    def check(self, identity: str, count: bool = True) -> None:
+        """Reject `identity` with 429 when over the limit. With `count=False`
+        the request is not counted; call `hit()` later for the ones that
+        should be (e.g. only failed logins)."""
+        if not settings.RATE_LIMIT_ENABLED or self.limit <= 0:
+            return
+        store = get_store()
+        key = f"rl:{self.scope}:{identity}"
+        allowed, retry_after = (store.hit if count else store.peek)(key, self.limit, self.window_seconds)
+        if not allowed:
+            logger.warning("Rate limit %s exceeded for %s", self.scope, identity)
+            raise _too_many(retry_after)
+
+    def hit(self, identity: str) -> None:
+        """Count one request for `identity` without rejecting it."""
+        if settings.RATE_LIMIT_ENABLED and self.limit > 0:
+            get_store().hit(f"rl:{self.scope}:{identity}", self.limit, self.window_seconds)
+
+    def __call__(self, request: Request) -> None:
+        self.check(self.key_func(request))
+
+
+def shed_hash_load() -> None:
+    """Reject with 503 when the password-hashing pool is already backed up.
+
+    A queued bcrypt job only adds latency for everyone behind it, so past
+    PASSWORD_HASH_MAX_PENDING we refuse new work instead of queueing it.
+    """
+    if settings.RATE_LIMIT_ENABLED and hash_jobs_pending() >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server busy, try again shortly",
+            headers={"Retry-After": "1"},
+        )
+
+
+def _path_user(request: Request) -> str:
+    # reset endpoints are /{role}/{user_id}/reset_password
+    for name in ("admin_id", "manager_id", "employee_id"):
+        if name in request.path_params:
+            return request.path_params[name]
+    return client_ip(request)
+
+
+login_ip_limit = RateLimit("login:ip", settings.LOGIN_RATE_LIMIT_PER_IP, settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS)
+login_account_limit = RateLimit("login:account", settings.LOGIN_RATE_LIMIT_PER_ACCOUNT, settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS)
+password_reset_ip_limit = RateLimit("reset:ip", settings.PASSWORD_RESET_RATE_LIMIT, settings.PASSWORD_RESET_RATE_LIMIT_WINDOW_SECONDS)
+password_reset_account_limit = RateLimit("reset:account", settings.PASSWORD_RESET_RATE_LIMIT, settings.PASSWORD_RESET_RATE_LIMIT_WINDOW_SECONDS, key_func=_path_user)
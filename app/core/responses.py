@@ -0,0 +1,42 @@
+# core/responses.py
+"""orjson-backed JSON responses, the app-wide default response class.
+
+    from app.core.responses import JSONResponse
+    return JSONResponse(status_code=200, content={"message": "...", "data": rows})
+
+Drop-in for starlette's JSONResponse. UUID, datetime, date, Enum and
+dataclass values are serialized natively by orjson (no `str()` /
+`.isoformat()` in handlers); Decimal becomes a float, and SQLAlchemy result
+rows (`select(Task.id, Task.title)` rows, `db.query(...).all()` of columns)
+become objects keyed by column name, so handlers can return typed rows as
+they come from the database.
+"""
+from decimal import Decimal
+
+import orjson
+from fastapi.responses import JSONResponse as _StarletteJSONResponse
+from sqlalchemy.engine import Row
+
+OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    if isinstance(obj, Row):
+        return dict(obj._mapping)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(content) -> bytes:
+    return orjson.dumps(content, default=_default, option=OPTIONS)
+
+
+json_loads = orjson.loads
+
+
+class JSONResponse(_StarletteJSONResponse):
+    def render(self, content) -> bytes:
+        return json_dumps(content)
@@ -3,22 +3,226 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
 from typing import Optional
+from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+import uuid
 from passlib.context import CryptContext
 from app.core.config import settings
-from app.db import get_db
-from sqlalchemy.orm import Session
-from app.models.user import User
+from app.db import get_db, get_async_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.models.user import User, UserRole
 from app.schemas.user import UserResponse
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-def hash_password(password: str) -> str:
+class TTLCache:
+    """Bounded LRU cache keyed by user id, with a TTL.
+
+    Used for authenticated principals and token versions. Entries hold plain
+    values (column snapshots, tuples) rather than ORM instances, so a cached
+    principal never drags one request's session into another. Routes that
+    change who a user is (profile edits, password resets, (de)activation)
+    must call ``invalidate_principal`` after committing.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[uuid.UUID, tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: uuid.UUID):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return value
+
+    def set(self, user_id: uuid.UUID, value) -> None:
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+principal_cache = TTLCache(settings.PRINCIPAL_CACHE_MAX_SIZE, settings.PRINCIPAL_CACHE_TTL_SECONDS)
+# user id -> (token_version, is_active); all that claim-based auth needs from the DB
+token_version_cache = TTLCache(settings.PRINCIPAL_CACHE_MAX_SIZE, settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+def invalidate_principal(user_id) -> None:
+    """Drop a user from the principal caches so the next request re-reads the DB."""
+    try:
+        user_uuid = user_id if isinstance(user_id, uuid.UUID) else uuid.UUID(str(user_id))
+    except ValueError:
+        return
+    principal_cache.invalidate(user_uuid)
+    token_version_cache.invalidate(user_uuid)
+
+
+def bump_token_version(user: User) -> None:
+    """Revoke every token issued to `user` so far. Caller commits."""
+    user.token_version = (user.token_version or 0) + 1
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated caller as described by the token claims.
+
+    Mirrors the User attributes the ownership checks use (`id`, `role`,
+    `created_by`), so routes that only authorize can depend on
+    `get_current_principal` instead of loading the full User row.
+    """
+    id: uuid.UUID
+    role: UserRole
+    created_by: Optional[uuid.UUID]
+    token_version: int
+
+
+def _user_snapshot(user: User) -> dict:
+    return {column.key: getattr(user, column.key) for column in User.__table__.columns}
+
+
+# ---------- Password hashing executor ----------
+# bcrypt is deliberately slow (~250 ms per call). All hashing goes through one
+# bounded pool so it never runs on the event loop and cannot use more than
+# PASSWORD_HASH_WORKERS cores at once.
+_hash_executor: Optional[Executor] = None
+_hash_executor_lock = threading.Lock()
+
+
+def _bcrypt_hash(password: str) -> str:
     return pwd_context.hash(password)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+
+def _bcrypt_verify(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+
+def get_hash_executor() -> Executor:
+    global _hash_executor
+    if _hash_executor is None:
+        with _hash_executor_lock:
+            if _hash_executor is None:
+                workers = max(1, settings.PASSWORD_HASH_WORKERS)
+                if settings.PASSWORD_HASH_EXECUTOR == "process":
+                    _hash_executor = ProcessPoolExecutor(max_workers=workers)
+                else:
+                    _hash_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pwhash")
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    global _hash_executor
+    with _hash_executor_lock:
+        if _hash_executor is not None:
+            _hash_executor.shutdown(wait=False, cancel_futures=True)
+            _hash_executor = None
+
+
+_hash_jobs_pending = 0
+_hash_jobs_lock = threading.Lock()
+
+
+def _hash_job_done(_future) -> None:
+    global _hash_jobs_pending
+    with _hash_jobs_lock:
+        _hash_jobs_pending -= 1
+
+
+def _submit_hash_job(fn, *args):
+    global _hash_jobs_pending
+    with _hash_jobs_lock:
+        _hash_jobs_pending += 1
+    try:
+        future = get_hash_executor().submit(fn, *args)
+    except BaseException:
+        # never queued, so the done callback will not run
+        _hash_job_done(None)
+        raise
+    future.add_done_callback(_hash_job_done)
+    return future
+
+
+def hash_jobs_pending() -> int:
+    """Hashing jobs queued or running; used by load shedding in core/rate_limit.py."""
+    return _hash_jobs_pending
+
+
+def hash_password(password: str) -> str:
+    return _submit_hash_job(_bcrypt_hash, password).result()
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return _submit_hash_job(_bcrypt_verify, plain_password, hashed_password).result()
+
+async def hash_password_async(password: str) -> str:
+    return await asyncio.wrap_future(_submit_hash_job(_bcrypt_hash, password))
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await asyncio.wrap_future(_submit_hash_job(_bcrypt_verify, plain_password, hashed_password))
+
+def hash_passwords(passwords: list, workers: Optional[int] = None, progress=None) -> list:
+    """Hash many passwords for a bulk import, in input order.
+
+    Runs on its own process pool with `workers` processes (default
+    BULK_HASH_WORKERS, 0 = every core), not on the request-path executor
+    above. `progress(done, total)` is called as hashes come back.
+    """
+    total = len(passwords)
+    workers = max(1, min(workers or settings.BULK_HASH_WORKERS or os.cpu_count() or 1, total or 1))
+    if workers == 1:
+        results = map(_bcrypt_hash, passwords)
+        chunksize, pool = 1, None
+    else:
+        # a few chunks per worker: little pickling overhead, even load
+        chunksize = max(1, min(64, total // (workers * 4)))
+        # spawn, not fork: the caller may be a threaded server process
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        results = pool.map(_bcrypt_hash, passwords, chunksize=chunksize)
+    step = max(chunksize, total // 20)
+    hashes = []
+    try:
+        for hashed in results:
+            hashes.append(hashed)
+            if progress and (len(hashes) % step == 0 or len(hashes) == total):
+                progress(len(hashes), total)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return hashes
+
+def token_claims_for(user: User) -> dict:
+    return {
+        "sub": str(user.id),
+        "role": user.role.value,
+        "mgr": str(user.created_by) if user.created_by else None,
+        "ver": user.token_version or 0,
+    }
+
 def create_access_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
     expire = datetime.now() + (expires_delta or timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES))
@@ -33,7 +237,7 @@ def decode_access_token(token: str):
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token invalid or expired")
 
-def get_current_user(access_token: str = Cookie(None), db: Session = Depends(get_db)) -> User:
+def _token_subject(access_token: Optional[str]) -> tuple[uuid.UUID, dict]:
     # Decode token
     if not access_token:
         raise HTTPException(status_code=401, detail="Not authenticated")
@@ -52,27 +256,102 @@ def get_current_user(access_token: str = Cookie(None), db: Session = Depends(get
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token missing subject (sub)",
         )
+    try:
+        return uuid.UUID(user_uuid), payload
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token subject is not a valid user id",
+        )
 
-    # Fetch user from DB
-    user = db.query(User).filter(User.id == user_uuid).first()
-    if not user:
+def _check_token_version(payload: dict, token_version: int) -> None:
+    # tokens issued before the `ver` claim existed count as version 0
+    if payload.get("ver", 0) != (token_version or 0):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked, login again",
         )
 
+def get_current_user(access_token: str = Cookie(None), db: Session = Depends(get_db)) -> User:
+    user_uuid, payload = _token_subject(access_token)
+
+    # Serve from the principal cache when possible, otherwise fetch user from DB
+    snapshot = principal_cache.get(user_uuid)
+    if snapshot is not None:
+        # attach the cached copy to this request's session as a persistent row (no SELECT),
+        # so lazy loads, db.add() and db.merge() behave as for a queried user
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        user = db.merge(user, load=False)
+    else:
+        user = db.query(User).filter(User.id == user_uuid).first()
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+        principal_cache.set(user_uuid, _user_snapshot(user))
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user, access denied",
         )
 
+    _check_token_version(payload, user.token_version)
     return user
 
+def get_current_principal(access_token: str = Cookie(None), db: Session = Depends(get_db)) -> Principal:
+    """Authorize from the token claims plus the user's current token_version.
+
+    Only (token_version, is_active) is read from the DB, and that is cached.
+    Tokens minted before role/ver claims existed fall back to get_current_user.
+    """
+    user_uuid, payload = _token_subject(access_token)
+    if "role" not in payload or "ver" not in payload:
+        user = get_current_user(access_token, db)
+        return Principal(id=user.id, role=user.role, created_by=user.created_by, token_version=user.token_version or 0)
+
+    cached = token_version_cache.get(user_uuid)
+    if cached is None:
+        row = db.query(User.token_version, User.is_active).filter(User.id == user_uuid).first()
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+        cached = (row.token_version or 0, row.is_active)
+        token_version_cache.set(user_uuid, cached)
+
+    token_version, is_active = cached
+    if not is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user, access denied",
+        )
+    _check_token_version(payload, token_version)
+
+    try:
+        role = UserRole(payload["role"])
+        manager_id = uuid.UUID(payload["mgr"]) if payload.get("mgr") else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token claims are malformed",
+        )
+    return Principal(id=user_uuid, role=role, created_by=manager_id, token_version=token_version)
+
+async def get_current_user_async(access_token: str = Cookie(None), adb: AsyncSession = Depends(get_async_db)) -> User:
+    # same logic on the async connection; a principal-cache hit does no I/O at all
+    return await adb.run_sync(lambda db: get_current_user(access_token, db))
+
+async def get_current_principal_async(access_token: str = Cookie(None), adb: AsyncSession = Depends(get_async_db)) -> Principal:
+    return await adb.run_sync(lambda db: get_current_principal(access_token, db))
+
 def get_optional_user(access_token: Optional[str] = Cookie(None), db: Session = Depends(get_db)) -> Optional[User]:
     try:
         if access_token:
             return get_current_user(access_token, db)  # reuse your existing logic
         return None
     except HTTPException:
-        return None
\ No newline at end of file
+        return None
@@ -0,0 +1,163 @@
+# core/slow_queries.py
+"""Slow-query recorder.
+
+Statements slower than SLOW_QUERY_MS are written as JSON lines to a rotating
+file (SLOW_QUERY_LOG_FILE) with the SQL, the types of its parameters (never
+the values: they include password hashes, emails and task text), the route
+that ran it (from core/query_stats.py), the elapsed time and the query plan. The plan
+is captured on the same connection right after the statement finishes:
+EXPLAIN QUERY PLAN on SQLite, EXPLAIN on Postgres, or EXPLAIN ANALYZE for
+SELECTs when SLOW_QUERY_EXPLAIN_ANALYZE is set (that re-runs the query).
+
+`top_offenders()` aggregates the log files by statement shape; the admin
+endpoint GET /admin/db/slow-queries serves it.
+"""
+import json
+import os
+import time
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.query_stats import current_query_stats, statement_shape
+
+import logging
+logger = logging.getLogger(__name__)
+
+_slow_log = logging.getLogger("app.slow_queries.file")
+_slow_log.propagate = False
+_slow_log.setLevel(logging.INFO)
+
+
+def _ensure_handler():
+    if _slow_log.handlers:
+        return
+    directory = os.path.dirname(settings.SLOW_QUERY_LOG_FILE)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    handler = RotatingFileHandler(
+        settings.SLOW_QUERY_LOG_FILE,
+        maxBytes=settings.SLOW_QUERY_LOG_MAX_BYTES,
+        backupCount=settings.SLOW_QUERY_LOG_BACKUPS,
+        encoding="utf-8",
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    _slow_log.addHandler(handler)
+
+
+_EXPLAINABLE = {"SELECT", "WITH", "INSERT", "UPDATE", "DELETE"}
+
+
+def _explain(conn, statement: str, parameters) -> list:
+    """Plan lines for `statement`, run on the statement's own DBAPI connection."""
+    dialect = conn.dialect.name
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    if keyword not in _EXPLAINABLE:
+        return []
+    is_select = keyword in ("SELECT", "WITH")
+    if dialect == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN "
+    elif dialect == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) " if settings.SLOW_QUERY_EXPLAIN_ANALYZE and is_select else "EXPLAIN "
+    else:
+        return []
+
+    cursor = conn.connection.dbapi_connection.cursor()
+    savepoint = dialect == "postgresql" and conn.in_transaction()
+    try:
+        # a failing EXPLAIN must not abort the caller's Postgres transaction
+        if savepoint:
+            cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        except Exception:
+            if savepoint:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            raise
+        if savepoint:
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        return [str(row[-1]) for row in rows]
+    finally:
+        cursor.close()
+
+
+def _param_types(parameters):
+    """Parameter type names, keyed like the DBAPI parameters (dict or sequence)."""
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    return [type(value).__name__ for value in parameters or ()]
+
+
+def _record(conn, statement: str, parameters, elapsed: float, executemany: bool):
+    stats = current_query_stats()
+    entry = {
+        "at": datetime.now(timezone.utc).isoformat(),
+        "route": stats.route if stats is not None and stats.route else None,
+        "elapsed_ms": round(elapsed * 1000, 2),
+        "sql": statement,
+        "param_types": _param_types(parameters) if not executemany else f"<executemany: {len(parameters)} rows>",
+        "plan": None,
+    }
+    if settings.SLOW_QUERY_EXPLAIN and not executemany:
+        try:
+            entry["plan"] = _explain(conn, statement, parameters)
+        except Exception as exc:
+            entry["plan"] = [f"EXPLAIN failed: {exc}"]
+    _ensure_handler()
+    _slow_log.info(json.dumps(entry, default=str))
+    logger.warning("Slow query (%.0f ms) on %s: %s", entry["elapsed_ms"], entry["route"] or "<no route>", statement_shape(statement)[:200])
+
+
+def install_slow_query_log(engine):
+    """Attach the recorder to a (sync) engine; pass `async_engine.sync_engine` for async."""
+    if not settings.SLOW_QUERY_MS:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["slow_query_start"].pop()
+        if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+            try:
+                _record(conn, statement, parameters, elapsed, executemany)
+            except Exception:
+                logger.exception("Could not record slow query")
+
+
+def top_offenders(limit: int = 20) -> list:
+    """Slow statements grouped by shape, ordered by total time across the log files."""
+    paths = [settings.SLOW_QUERY_LOG_FILE] + [f"{settings.SLOW_QUERY_LOG_FILE}.{i}" for i in range(1, settings.SLOW_QUERY_LOG_BACKUPS + 1)]
+    groups = {}
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                shape = statement_shape(entry["sql"])
+                group = groups.setdefault(shape, {
+                    "sql": shape, "count": 0, "total_ms": 0.0, "max_ms": 0.0, "routes": set(), "slowest": None,
+                })
+                group["count"] += 1
+                group["total_ms"] += entry["elapsed_ms"]
+                if entry["route"]:
+                    group["routes"].add(entry["route"])
+                if entry["elapsed_ms"] >= group["max_ms"]:
+                    group["max_ms"] = entry["elapsed_ms"]
+                    group["slowest"] = {k: entry.get(k) for k in ("at", "route", "elapsed_ms", "plan")}
+
+    offenders = sorted(groups.values(), key=lambda g: g["total_ms"], reverse=True)[:limit]
+    for group in offenders:
+        group["total_ms"] = round(group["total_ms"], 2)
+        group["avg_ms"] = round(group["total_ms"] / group["count"], 2)
+        group["routes"] = sorted(group["routes"])
+    return offenders
@@ -0,0 +1,67 @@
+# core/templates.py
+"""The one Jinja2 environment shared by main.py and every router.
+
+    from app.core.templates import templates
+    return templates.TemplateResponse("manager/dashboard.html", {...})
+
+Each template is parsed and compiled once per process, not once per module
+that renders it. Compiled bytecode is also written to
+TEMPLATE_BYTECODE_CACHE_DIR, so a restarted worker loads it instead of
+compiling again. With TEMPLATE_PRECOMPILE=true every template is compiled at
+startup, before the first request arrives. `auto_reload` (re-stat the
+source on every render) is only on for the dev profile unless
+TEMPLATE_AUTO_RELOAD says otherwise. Dashboard widgets are wrapped in
+`{% cache %}` blocks whose rendered HTML is cached per user.
+"""
+import os
+import time
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from app.core.assets import asset_url
+from app.core.config import settings
+from app.utils.fragment_cache import FragmentCacheExtension
+
+import logging
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = "app/templates"
+
+
+def _bytecode_cache():
+    directory = settings.TEMPLATE_BYTECODE_CACHE_DIR
+    if not directory:
+        return None
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        logger.warning("Template bytecode cache dir %s is not writable; compiling in memory only", directory)
+        return None
+    return FileSystemBytecodeCache(directory)
+
+
+def build_environment() -> Environment:
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=True,
+        auto_reload=settings.template_auto_reload(),
+        bytecode_cache=_bytecode_cache(),
+        cache_size=-1,  # never evict; the template set is small and fixed
+        extensions=[FragmentCacheExtension],  # {% cache "name" %} blocks, see utils/fragment_cache.py
+    )
+    env.globals["asset_url"] = asset_url
+    return env
+
+
+templates = Jinja2Templates(env=build_environment())
+
+
+def precompile_templates() -> int:
+    """Load every HTML template into the shared environment; returns how many."""
+    start = time.perf_counter()
+    names = templates.env.list_templates(filter_func=lambda name: name.endswith(".html"))
+    for name in names:
+        templates.env.get_template(name)
+    logger.info("Precompiled %d templates in %.0f ms", len(names), (time.perf_counter() - start) * 1000)
+    return len(names)
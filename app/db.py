@@ -1,17 +1,168 @@
+import threading
+import time
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
 from app.core.config import settings
+from app.core.query_stats import install_query_stats
+from app.core.slow_queries import install_slow_query_log
+
+
+# ---------- Pool monitoring ----------
+class PoolMetrics:
+    """Counters for connection checkouts, exposed via `pool_stats()`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.saturated_checkouts = 0  # checkouts that found every connection busy
+            self.timeouts = 0
+            self.total_wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def record(self, waited: float, saturated: bool, timed_out: bool):
+        with self._lock:
+            self.checkouts += 1
+            self.saturated_checkouts += int(saturated)
+            self.timeouts += int(timed_out)
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "saturated_checkouts": self.saturated_checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": (self.total_wait_seconds / self.checkouts * 1000) if self.checkouts else 0.0,
+                "max_wait_ms": self.max_wait_seconds * 1000,
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class MonitoredQueuePool(QueuePool):
+    """QueuePool that records checkout wait time and saturation."""
+
+    def _do_get(self):
+        saturated = self._max_overflow > -1 and self.checkedout() >= self.size() + self._max_overflow
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            pool_metrics.record(time.perf_counter() - start, saturated, timed_out)
 
 
 # ---------- SQLAlchemy Setup ----------
-engine = create_engine(settings.DATABASE_URL, echo=True, future=True)
+def _engine_kwargs(url, config: dict) -> dict:
+    kwargs = {
+        "echo": config["echo"],
+        "future": True,
+        "pool_pre_ping": config["pool_pre_ping"],
+        "pool_recycle": config["pool_recycle"],
+    }
+    # in-memory SQLite uses a per-thread pool; sizing options don't apply there
+    if not (url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")):
+        kwargs.update(
+            poolclass=MonitoredQueuePool,
+            pool_size=config["pool_size"],
+            max_overflow=config["max_overflow"],
+            pool_timeout=config["pool_timeout"],
+        )
+    if url.get_backend_name() == "postgresql" and config["statement_timeout_ms"] and url.get_driver_name() == "psycopg2":
+        kwargs["connect_args"] = {"options": f"-c statement_timeout={int(config['statement_timeout_ms'])}"}
+    return kwargs
+
+
+def _install_sqlite_pragmas(engine, config: dict):
+    # for an async engine pass `async_engine.sync_engine`
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if config["sqlite_journal_mode"]:
+            cursor.execute(f"PRAGMA journal_mode={config['sqlite_journal_mode']}")
+        if config["sqlite_synchronous"]:
+            cursor.execute(f"PRAGMA synchronous={config['sqlite_synchronous']}")
+        if config["sqlite_mmap_size"]:
+            cursor.execute(f"PRAGMA mmap_size={int(config['sqlite_mmap_size'])}")
+        cursor.close()
+
+
+engine_config = settings.db_engine_config()
+_url = make_url(settings.DATABASE_URL)
+engine = create_engine(_url, **_engine_kwargs(_url, engine_config))
+if _url.get_backend_name() == "sqlite":
+    _install_sqlite_pragmas(engine, engine_config)
+install_query_stats(engine)
+install_slow_query_log(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
+# ---------- Async engine (DB_ASYNC_READS) ----------
+# Built lazily so asyncpg/aiosqlite are only required when the async path is used.
+_ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+async_engine = None
+AsyncSessionLocal = None
+_async_lock = threading.Lock()
+
+
+def get_async_engine():
+    global async_engine, AsyncSessionLocal
+    if async_engine is None:
+        with _async_lock:
+            if async_engine is None:
+                backend = _url.get_backend_name()
+                if backend not in _ASYNC_DRIVERS:
+                    raise RuntimeError(f"No async driver configured for {backend!r}")
+                url = _url.set(drivername=_ASYNC_DRIVERS[backend])
+                kwargs = {
+                    "echo": engine_config["echo"],
+                    "pool_pre_ping": engine_config["pool_pre_ping"],
+                    "pool_recycle": engine_config["pool_recycle"],
+                }
+                if backend == "postgresql":
+                    kwargs.update(
+                        pool_size=engine_config["pool_size"],
+                        max_overflow=engine_config["max_overflow"],
+                        pool_timeout=engine_config["pool_timeout"],
+                    )
+                    if engine_config["statement_timeout_ms"]:
+                        kwargs["connect_args"] = {"server_settings": {"statement_timeout": str(int(engine_config["statement_timeout_ms"]))}}
+                new_engine = create_async_engine(url, **kwargs)
+                if backend == "sqlite":
+                    _install_sqlite_pragmas(new_engine.sync_engine, engine_config)
+                install_query_stats(new_engine.sync_engine)
+                install_slow_query_log(new_engine.sync_engine)
+                AsyncSessionLocal = async_sessionmaker(new_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+                async_engine = new_engine
+    return async_engine
+
+
+def pool_stats() -> dict:
+    """Current pool occupancy plus checkout wait/saturation counters."""
+    pool = engine.pool
+    stats = {"profile": settings.DB_PROFILE, "pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(size=pool.size(), checked_out=pool.checkedout(), overflow=pool.overflow(), idle=pool.checkedin())
+    stats.update(pool_metrics.snapshot())
+    return stats
+
+
 # ---------- Dependency ----------
 def get_db():
     db = SessionLocal()
@@ -20,4 +171,9 @@ def get_db():
     finally:
         db.close()
 
-# Base.metadata.create_all(bind=engine)
\ No newline at end of file
+async def get_async_db():
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# Base.metadata.create_all(bind=engine)
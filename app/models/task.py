@@ -2,6 +2,7 @@ from sqlalchemy import Column, String, Text, DateTime, Enum, ForeignKey, Date, I
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
+from datetime import datetime, timezone
 import uuid
 import enum
 from app.db import Base
@@ -26,6 +27,19 @@ class Task(Base):
     start_date = Column(DateTime(timezone=True))
     due_date = Column(Date)
     completed_at = Column(DateTime(timezone=True))
+    # set from Python rather than the server so it has sub-second precision on every backend;
+    # the task list ETags (routers/tasks.py) are built from it
+    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+                        onupdate=lambda: datetime.now(timezone.utc), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_tasks_created_by_created_at", "created_by", "created_at"),
+        Index("ix_tasks_assigned_to_created_at", "assigned_to", "created_at"),
+        Index("ix_tasks_assigned_to_status", "assigned_to", "status"),
+        Index("ix_tasks_created_at", "created_at"),
+        Index("ix_tasks_created_by_updated_at", "created_by", "updated_at"),
+        Index("ix_tasks_assigned_to_updated_at", "assigned_to", "updated_at"),
+    )
 
     def __repr__(self):
         return f"<Task(uuid={self.uuid}, title={self.title}, status={self.status}, assigned_to={self.assigned_to})>"
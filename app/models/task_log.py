@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, BigInteger, Index
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, BigInteger, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -15,11 +15,17 @@ class TaskStatus(enum.Enum):
 class TaskLog(Base):
     __tablename__ = "task_logs"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # SQLite only autoincrements INTEGER primary keys
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
     task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
     status = Column(Enum(TaskStatus, name="tasklogstatus_enum", values_callable=lambda obj: [e.value for e in obj]), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
+    __table_args__ = (
+        Index("ix_task_logs_task_id_created_at", "task_id", "created_at"),
+        Index("ix_task_logs_created_at", "created_at"),
+    )
+
     def __repr__(self):
         return f"<TaskLog(id={self.id}, task_id={self.task_id}, action={self.action})>"
 
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from app.db import Base
+
+
+class UserTaskStats(Base):
+    """Per-assignee task counters, kept in step with `tasks` by app/utils/task_stats.py."""
+    __tablename__ = "user_task_stats"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    total = Column(Integer, default=0, server_default="0", nullable=False)
+    pending = Column(Integer, default=0, server_default="0", nullable=False)
+    in_progress = Column(Integer, default=0, server_default="0", nullable=False)
+    completed = Column(Integer, default=0, server_default="0", nullable=False)
+    # open tasks past their due date as of the last write or rebuild
+    overdue = Column(Integer, default=0, server_default="0", nullable=False)
+    last_activity_at = Column(DateTime(timezone=True))
+
+    def __repr__(self):
+        return f"<UserTaskStats(user_id={self.user_id}, total={self.total}, overdue={self.overdue})>"
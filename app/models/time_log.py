@@ -17,5 +17,9 @@ class TimeLog(Base):
     notes = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
+    __table_args__ = (
+        Index("ix_time_logs_user_id_date", "user_id", "date"),
+    )
+
     def __repr__(self):
         return f"<TimeLog(id={self.id}, task_id={self.task_id}, user_id={self.user_id}, duration={self.duration_minutes})>"
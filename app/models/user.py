@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Enum, ForeignKey, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
@@ -24,6 +24,12 @@ class User(Base):
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
+    # bumped on password reset / deactivation to revoke outstanding tokens
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
+
+    __table_args__ = (
+        Index("ix_users_created_by_role_is_active", "created_by", "role", "is_active"),
+    )
 
     def __repr__(self):
         return f"<User(uuid={self.id}, username={self.username}, email={self.email}, role={self.role}, active={self.is_active})>"
@@ -1,51 +1,40 @@
 # app/routers/manager.py
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Form, Request
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import JSONResponse,HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse
+from starlette.background import BackgroundTask
 from pydantic import EmailStr, BaseModel
 # import uuid
-from datetime import datetime
+from datetime import date, datetime
+from typing import Optional
 
-from sqlalchemy import func, asc, desc
+from sqlalchemy import func, asc, desc, and_, exists, select
 from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, aliased
 
 from passlib.context import CryptContext
 
-# from core.config import settings
-from app.db import get_db
+from app.core.config import settings
+from app.db import get_db, get_async_db, pool_stats
 from app.models.user import User, UserRole
 from app.models.task import Task, TaskStatus as ts
-from app.models.task_log import TaskLog, TaskStatus
-from app.core.security import hash_password,verify_password, get_current_user
+from app.models.task_log import TaskLog
+from app.models.task_stats import UserTaskStats
+from app.core.security import hash_password,verify_password, get_current_user, get_current_user_async, get_current_principal, Principal, invalidate_principal, bump_token_version
+from app.core.templates import templates
+from app.core.responses import JSONResponse
 from app.utils.email_utils import send_email
 from app.utils.validators import validate_uuid
-
-# Optional Redis (for cache invalidation). If not configured, functions will be no-ops.
-# try:
-#     import redis
-#     _redis_client = redis.from_url(settings.redis_url) if getattr(settings, "redis_url", None) else None
-# except Exception:
-#     _redis_client = None
+from app.core.rate_limit import password_reset_ip_limit, password_reset_account_limit, shed_hash_load
+from app.core.slow_queries import top_offenders
+from app.utils.pagination import KeysetPager, page_response_fields
+from app.utils.cache_utils import get_cache, request_cache_key, admin_managers_tag, manager_employees_tag, manager_tasks_tag, invalidate_admin_cache
+from app.utils.fragment_cache import Fragments
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
-templates = Jinja2Templates(directory="app/templates")
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 creator = aliased(User)
 
-# def _invalidate_manager_cache(manager_uuid: UUID):
-#     """Invalidate Redis keys used for manager employee lists. Implement key naming consistently with your cache usage."""
-#     if not _redis_client:
-#         return
-#     try:
-#         # example key patterns
-#         keys = [f"manager:{manager_uuid}:employees", f"manager:{manager_uuid}:employees:active"]
-#         for k in keys:
-#             _redis_client.delete(k)
-#     except Exception:
-#         # don't crash the request if cache invalidation fails
-#         pass
-
 # ----------------- Endpoints -----------------
 
 @router.post("/{admin_id}/profile")
@@ -101,6 +90,7 @@ def update_admin_profile(
         db.add(admin_row)
         db.commit()
         db.refresh(admin_row)
+        invalidate_principal(admin_uuid)
 
     except OperationalError:
         db.rollback()
@@ -131,7 +121,7 @@ def admin_profile(request: Request, admin_id: str, db: Session = Depends(get_db)
     return templates.TemplateResponse("admin/profile.html", {"request": request, "current_user": current_user, "user": user})
 
 
-@router.post("/{admin_id}/managers")
+@router.post("/{admin_id}/managers", dependencies=[Depends(shed_hash_load)])
 def create_manager(
     admin_id: str = Path(..., description="Admin UUID"),
     username: str = Form(...),
@@ -184,7 +174,7 @@ def create_manager(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
     # Invalidate cache
-    # _invalidate_manager_cache(manager_uuid)
+    invalidate_admin_cache(admin_uuid)
 
     # Send welcome email in background
     # if background_tasks is not None and getattr(settings, "smtp_host", None):
@@ -209,11 +199,13 @@ def create_manager(
 
 @router.get("/{admin_id}/managers")
 def list_managers(
+    request: Request,
     admin_id: str = Path(..., description="Admin UUID"),
     limit: int = Query(40, ge=1),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     admin_uuid = validate_uuid(admin_id)
 
@@ -223,40 +215,58 @@ def list_managers(
     if current_user.id != admin_uuid and current_user.role != UserRole.admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to view these managers")
 
-    managers = db.query(User).filter(
-        User.created_by == admin_uuid,
-        User.role == UserRole.manager,
-        User.is_active == True
-    ).order_by(User.username).limit(limit).offset(offset).all()
-
-    data=[]
-    for m in managers:
-        employees = db.query(User).filter(
-            User.created_by == m.id,
-            User.role == UserRole.employee,
+    def build():
+        pager = KeysetPager(db, [User.username, User.id], direction="asc", cursor=cursor, limit=limit, offset=offset, scope="managers")
+        page = pager.page(pager.apply(db.query(User).filter(
+            User.created_by == admin_uuid,
+            User.role == UserRole.manager,
             User.is_active == True
-        ).order_by(User.username).all()
-        data.append({
-            "uuid": str(m.id),
-            "username": m.username,
-            "email": m.email,
-            "full_name": m.full_name,
-            "role": "manager",
-            "employees": [
-                {
-                    "uuid": str(e.id),
-                    "username": e.username,
-                    "email": e.email,
-                    "full_name": e.full_name,
-                    "role": "employee"
-                } for e in employees
-            ]
-        })
+        )).all())
+        managers = page.items
+
+        # employees of every manager on this page in one query
+        employees_by_manager = {m.id: [] for m in managers}
+        if managers:
+            for e in db.query(User).filter(
+                User.created_by.in_(list(employees_by_manager)),
+                User.role == UserRole.employee,
+                User.is_active == True
+            ).order_by(User.username).all():
+                employees_by_manager[e.created_by].append(e)
+
+        data=[]
+        for m in managers:
+            employees = employees_by_manager[m.id]
+            data.append({
+                "uuid": m.id,
+                "username": m.username,
+                "email": m.email,
+                "full_name": m.full_name,
+                "role": "manager",
+                "employees": [
+                    {
+                        "uuid": e.id,
+                        "username": e.username,
+                        "email": e.email,
+                        "full_name": e.full_name,
+                        "role": "employee"
+                    } for e in employees
+                ]
+            })
 
-    resp = {
-        "message": "Managers fetched successfully",
-        "data": data
-    }
+        return {
+            "message": "Managers fetched successfully",
+            "data": data,
+            **page_response_fields(request, page),
+        }
+
+    # the page embeds each listed manager's employees, so it is also tagged with their lists
+    resp = get_cache().get_or_set(
+        request_cache_key(request, "admin", admin_uuid, "managers"),
+        build,
+        tags=lambda resp: [admin_managers_tag(admin_uuid)] + [manager_employees_tag(m["uuid"]) for m in resp["data"]],
+        namespace="admin:managers",
+    )
     return JSONResponse(status_code=status.HTTP_200_OK, content=resp)
 
 
@@ -323,7 +333,7 @@ def get_manager(
     )
 
 
-@router.post("/{admin_id}/reset_password")
+@router.post("/{admin_id}/reset_password", dependencies=[Depends(password_reset_ip_limit), Depends(password_reset_account_limit), Depends(shed_hash_load)])
 def reset_admin_password(
     admin_id: str = Path(...),
     payload: dict = None,
@@ -356,9 +366,11 @@ def reset_admin_password(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Admin not found")
 
         admin_row.password_hash = hash_password(new_password)
+        bump_token_version(admin_row)
         db.add(admin_row)
         db.commit()
         db.refresh(admin_row)
+        invalidate_principal(admin_uuid)
     except OperationalError:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Database busy")
@@ -366,8 +378,7 @@ def reset_admin_password(
         db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not reset password")
 
-    # Invalidate caches and (optionally) revoke tokens via token_version bump (not implemented here)
-    # _invalidate_manager_cache(manager_uuid)
+    # Outstanding tokens were revoked by the token_version bump above; no cached list shows passwords
 
     resp = {"message": "Password updated successfully. Login again.", "data": {"uuid": str(admin_uuid)}}
     return JSONResponse(status_code=status.HTTP_200_OK, content=resp)
@@ -379,7 +390,7 @@ def deactivate_manager(
     manager_id: str = Path(...),
     # payload: dict = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     admin_uuid = validate_uuid(admin_id)
     manager_uuid = validate_uuid(manager_id)
@@ -402,13 +413,16 @@ def deactivate_manager(
 
     try:
         manager.is_active = False
+        bump_token_version(manager)
         db.add(manager)
         db.commit()
     except Exception:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to deactivate manager")
 
-    # _invalidate_manager_cache(manager_uuid)
+    invalidate_principal(manager_uuid)
+
+    invalidate_admin_cache(admin_uuid)
 
     resp = {
         "message": "Employee deactivated successfully",
@@ -422,7 +436,7 @@ def activate_manager(
     manager_id: str = Path(...),
     # payload: dict = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     admin_uuid = validate_uuid(admin_id)
     manager_uuid = validate_uuid(manager_id)
@@ -451,7 +465,9 @@ def activate_manager(
         db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to activate manager")
 
-    # _invalidate_manager_cache(manager_uuid)
+    invalidate_principal(manager_uuid)
+
+    invalidate_admin_cache(admin_uuid)
 
     resp = {
         "message": "Employee activated successfully",
@@ -460,7 +476,141 @@ def activate_manager(
     return JSONResponse(status_code=status.HTTP_200_OK, content=resp)
 
 
-@router.get("/dashboard", response_class=HTMLResponse)
+@router.get("/db/pool")
+def db_pool_stats(current_user: Principal = Depends(get_current_principal)):
+    if current_user.role != UserRole.admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    resp = {"message": "Pool stats fetched successfully", "data": pool_stats()}
+    return JSONResponse(status_code=status.HTTP_200_OK, content=resp)
+
+
+@router.get("/db/slow-queries")
+def db_slow_queries(
+    limit: int = Query(20, ge=1, le=100),
+    current_user: Principal = Depends(get_current_principal),
+):
+    if current_user.role != UserRole.admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    resp = {"message": "Slow queries fetched successfully", "data": top_offenders(limit)}
+    return JSONResponse(status_code=status.HTTP_200_OK, content=resp)
+
+
+@router.get("/cache/stats")
+def cache_stats(current_user: Principal = Depends(get_current_principal)):
+    if current_user.role != UserRole.admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    resp = {"message": "Cache stats fetched successfully", "data": get_cache().stats()}
+    return JSONResponse(status_code=status.HTTP_200_OK, content=resp)
+
+
+DASHBOARD_LOG_PAGE_SIZE = 50
+
+
+def _admin_manager_ids(admin_id):
+    return (
+        select(User.id)
+        .where(User.created_by == admin_id, User.role == UserRole.manager)
+        .scalar_subquery()
+    )
+
+
+def _recent_task_logs(db: Session, admin_id, limit: int, offset: int = 0) -> list:
+    """Newest task_logs for tasks created by this admin's managers, with the task title."""
+    # A correlated EXISTS (rather than IN over the manager ids) keeps the plan
+    # walking ix_task_logs_created_at newest-first and stopping after `limit` rows.
+    manager = aliased(User)
+    owned_by_admin = exists().where(
+        manager.id == Task.created_by,
+        manager.created_by == admin_id,
+        manager.role == UserRole.manager,
+    )
+    rows = (
+        db.query(TaskLog.id, TaskLog.task_id, TaskLog.status, TaskLog.created_at, Task.title)
+        .join(Task, Task.id == TaskLog.task_id)
+        .filter(owned_by_admin)
+        .order_by(desc(TaskLog.created_at), desc(TaskLog.id))
+        .limit(limit)
+        .offset(offset)
+        .all()
+    )
+    return [
+        {
+            "log_id": str(r.id),
+            "task_id": str(r.task_id),
+            "task_name": r.title,
+            "status": r.status.value,
+            "timestamp": r.created_at.isoformat(),
+        }
+        for r in rows
+    ]
+
+
+def _admin_dashboard_fragments(admin_id) -> Fragments:
+    # the per-manager tags are attached once the manager ids are known
+    tag = admin_managers_tag(admin_id)
+    return Fragments("admin/dashboard", admin_id).add("summary", tag).add("task_log", tag)
+
+
+def _admin_dashboard_context(db: Session, current_user: User, fragments: Fragments) -> dict:
+    # Three statements regardless of data size: managers with employee counts,
+    # employee/task totals, and one page of the newest task logs. Widgets still
+    # cached from an earlier render are skipped.
+    stale = [name for name in ("summary", "task_log") if fragments.stale(name)]
+    if not stale:
+        return {"current_user": current_user, "log_page_size": DASHBOARD_LOG_PAGE_SIZE, "fragments": fragments}
+
+    employee = aliased(User)
+    manager_rows = (
+        db.query(User, func.count(employee.id))
+        .outerjoin(employee, and_(employee.created_by == User.id, employee.role == UserRole.employee))
+        .filter(User.created_by == current_user.id, User.role == UserRole.manager)
+        .group_by(User.id)
+        .order_by(asc(User.username))
+        .all()
+    )
+    managers = [
+        {
+            "uuid": str(m.id),
+            "username": m.username,
+            "email": m.email,
+            "full_name": m.full_name,
+            "role": "manager",
+            "employee_count": employee_count,
+            "is_active": m.is_active,
+        }
+        for m, employee_count in manager_rows
+    ]
+    # both widgets summarise every manager's employees and tasks
+    manager_tags = [tag for m, _ in manager_rows for tag in (manager_employees_tag(m.id), manager_tasks_tag(m.id))]
+    for name in stale:
+        fragments.tag(name, *manager_tags)
+
+    employee_total = task_total = 0
+    if fragments.stale("summary"):
+        manager_ids = _admin_manager_ids(current_user.id)
+        employee_total, task_total = db.query(
+            select(func.count()).select_from(User).where(User.created_by.in_(manager_ids), User.role == UserRole.employee).scalar_subquery(),
+            select(func.count()).select_from(Task).where(Task.created_by.in_(manager_ids)).scalar_subquery(),
+        ).one()
+
+    task_log = []
+    if fragments.stale("task_log"):
+        task_log = _recent_task_logs(db, current_user.id, DASHBOARD_LOG_PAGE_SIZE)
+
+    return {
+        "managers": managers,
+        "employee_count": employee_total,
+        "task_count": task_total,
+        "task_log": task_log,
+        "log_page_size": DASHBOARD_LOG_PAGE_SIZE,
+        "current_user": current_user,
+        "fragments": fragments,
+    }
+
+
 def admin_dashboard(
     request: Request,
     db: Session = Depends(get_db),
@@ -470,80 +620,42 @@ def admin_dashboard(
     if current_user.role != UserRole.admin:
         return HTMLResponse("<h3>Access Denied</h3>", status_code=403)
 
-    # Fetch managers (same logic you had in /{admin_id}/managers)
-    managers = db.query(User).filter(
-        User.created_by == current_user.id,
-        User.role == UserRole.manager
-    ).order_by(asc(User.username)).all()
+    # Render the dashboard template
+    fragments = _admin_dashboard_fragments(current_user.id).load()
+    context = _admin_dashboard_context(db, current_user, fragments)
+    return templates.TemplateResponse("admin/dashboard.html", {"request": request, **context}, background=BackgroundTask(fragments.save))
 
-    data = []
-    all_employees = []
-    all_tasks = []
-    logs_list = []
-    for m in managers:
-        employees = db.query(User).filter(
-        User.created_by == m.id,
-        User.role == UserRole.employee,
-    ).order_by(asc(User.username)).all()
 
-        data.append({
-        "uuid": str(m.id),
-        "username": m.username,
-        "email": m.email,
-        "full_name": m.full_name,
-        "role": "manager",
-        "employee_count": len(employees),  # 🔹 only count
-        "is_active": m.is_active,
-        })
+async def admin_dashboard_async(
+    request: Request,
+    adb: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    if current_user.role != UserRole.admin:
+        return HTMLResponse("<h3>Access Denied</h3>", status_code=403)
 
-        for emp in employees:
-            t = db.query(Task).filter(Task.assigned_to == emp.id).count()
-            all_employees.append({
-            "uuid": str(emp.id),
-            "username": emp.username,
-            "email": emp.email,
-            "full_name": emp.full_name,
-            "role": "employee",
-            "task_count": t,
-            "manager_id": str(m.id),  # optional: to know which manager they belong to
-        })
-        ts_map ={
-            ts.pending: "pending",
-            ts.in_progress: "in progress",
-            ts.completed: "completed"
-        }
-        tasks = db.query(Task).filter(Task.created_by == m.id).all()
-        task_id=[]
-        for t in tasks:
-            task_id.append(t.id)
-            all_tasks.append({
-            "uuid": str(t.id),
-            "title": t.title,           # adjust field names as per your Task model
-            "description": t.description,
-            "created_by_id": str(t.created_by),
-            "created_by_name": m.username,
-            "status": ts_map[t.status],
-        })
-            log_status_map = {
-                TaskStatus.pending: "pending",
-                TaskStatus.in_progress: "in progress",
-                TaskStatus.completed: "completed"
-            }
-            task_logs = db.query(TaskLog).filter(TaskLog.task_id.in_(task_id)).order_by(TaskLog.created_at.desc()).all()
-            for log in task_logs:
-                logs_list.append({
-                "log_id": str(log.id),
-                "task_id": str(log.task_id),
-                "task_name": t.title,
-                "status": log_status_map[log.status],
-                "timestamp": log.created_at.isoformat()
-            })
+    fragments = await _admin_dashboard_fragments(current_user.id).load_async()
+    context = await adb.run_sync(_admin_dashboard_context, current_user, fragments)
+    return templates.TemplateResponse("admin/dashboard.html", {"request": request, **context}, background=BackgroundTask(fragments.save))
+
+
+router.get("/dashboard", response_class=HTMLResponse)(admin_dashboard_async if settings.DB_ASYNC_READS else admin_dashboard)
 
-    # Render the dashboard template
-    return templates.TemplateResponse(
-        "admin/dashboard.html",
-        {"request": request, "managers": data, "employees": all_employees, "tasks": all_tasks, "task_log": logs_list, "current_user": current_user}
-    )
+
+@router.get("/task-logs")
+def admin_task_logs(
+    limit: int = Query(DASHBOARD_LOG_PAGE_SIZE, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """Older dashboard task history, loaded on demand by the "Load more" button."""
+    if current_user.role != UserRole.admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    logs = _recent_task_logs(db, current_user.id, limit, offset)
+    resp = {"message": "Task logs fetched successfully", "data": logs, "has_more": len(logs) == limit}
+    return JSONResponse(status_code=status.HTTP_200_OK, content=resp)
 
 @router.get("/{admin_id}/create-manager")
 def create_manager_page(
@@ -571,25 +683,25 @@ def managers_table(
         return HTMLResponse("<h3>Access Denied</h3>", status_code=403)
 
     # Fetch managers (same logic you had in /{admin_id}/managers)
-    managers = db.query(User).filter(
-        User.created_by == current_user.id,
-        User.role == UserRole.manager
-    ).order_by(asc(User.username)).all()
+    employee = aliased(User)
+    managers = (
+        db.query(User, func.count(employee.id))
+          .outerjoin(employee, and_(employee.created_by == User.id, employee.role == UserRole.employee))
+          .filter(User.created_by == current_user.id, User.role == UserRole.manager)
+          .group_by(User.id)
+          .order_by(asc(User.username))
+          .all()
+    )
 
     data = []
-    for m in managers:
-        employees = db.query(User).filter(
-        User.created_by == m.id,
-        User.role == UserRole.employee,
-    ).order_by(asc(User.username)).all()
-
+    for m, employee_count in managers:
         data.append({
         "uuid": str(m.id),
         "username": m.username,
         "email": m.email,
         "full_name": m.full_name,
         "role": "manager",
-        "employee_count": len(employees),  # 🔹 only count
+        "employee_count": employee_count,  # 🔹 only count
         "is_active": m.is_active,
         })
 
@@ -621,8 +733,12 @@ def employees(
     if not manager_ids:
         employees = []
     else:
+        # manager names and task counts (user_task_stats) joined in the same query
+        manager = aliased(User)
         employees = (
-        db.query(User)
+        db.query(User, manager.username, func.coalesce(UserTaskStats.total, 0))
+          .outerjoin(manager, manager.id == User.created_by)
+          .outerjoin(UserTaskStats, UserTaskStats.user_id == User.id)
           .filter(
               User.role == UserRole.employee,
               User.is_active == True,
@@ -632,10 +748,8 @@ def employees(
           .all())
 
     data = []
-    for emp in employees:
-        manager = db.query(User).filter(User.id == emp.created_by, User.role == UserRole.manager).first()
-        t = db.query(Task).filter(Task.assigned_to == emp.id).count()
-        manager_name = manager.username if manager else "N/A"
+    for emp, manager_name, t in employees:
+        manager_name = manager_name or "N/A"
         data.append({
             "uuid": str(emp.id),
             "username": emp.username,
@@ -654,63 +768,171 @@ def employees(
         {"request": request, "employees": data, "current_user": current_user}
     )
 
+# ---------- Task explorer ----------
+EXPLORER_PAGE_SIZE = 25
+# sort key -> column expression; NULL due dates sort as the far future
+EXPLORER_SORTS = {
+    "created_at": Task.created_at,
+    "due_date": func.coalesce(Task.due_date, date(9999, 12, 31)),
+    "title": Task.title,
+}
+
+
+def _parse_task_status(value: Optional[str]):
+    if not value:
+        return None
+    for member in ts:
+        if value in (member.name, member.value):
+            return member
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status")
+
+
+def _task_explorer_page(
+    db: Session,
+    admin_id,
+    status_filter=None,
+    manager_id=None,
+    assignee_id=None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    sort: str = "created_at",
+    direction: str = "desc",
+    cursor: Optional[str] = None,
+    limit: int = EXPLORER_PAGE_SIZE,
+) -> dict:
+    """One page of tasks created by this admin's active managers, in a single joined query."""
+    if sort not in EXPLORER_SORTS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"sort must be one of {sorted(EXPLORER_SORTS)}")
+    if direction not in ("asc", "desc"):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="direction must be asc or desc")
+
+    manager = aliased(User)
+    assignee = aliased(User)
+    owner = aliased(User)
+    # ownership as a correlated EXISTS so the planner can walk the sort index
+    # and stop after one page instead of sorting every task of every manager
+    owned_by_admin = exists().where(
+        owner.id == Task.created_by,
+        owner.created_by == admin_id,
+        owner.role == UserRole.manager,
+        owner.is_active == True,
+    )
+    query = (
+        db.query(Task, manager.username, assignee.username)
+        .outerjoin(manager, manager.id == Task.created_by)
+        .outerjoin(assignee, assignee.id == Task.assigned_to)
+        .filter(owned_by_admin)
+    )
+    if status_filter is not None:
+        query = query.filter(Task.status == status_filter)
+    if manager_id is not None:
+        query = query.filter(Task.created_by == manager_id)
+    if assignee_id is not None:
+        query = query.filter(Task.assigned_to == assignee_id)
+    if due_from is not None:
+        query = query.filter(Task.due_date >= due_from)
+    if due_to is not None:
+        query = query.filter(Task.due_date <= due_to)
+
+    # keyset pagination on (sort value, id) so deep pages cost the same as the first
+    pager = KeysetPager(db, [EXPLORER_SORTS[sort], Task.id], direction=direction, cursor=cursor, limit=limit, scope=f"explorer:{sort}")
+    page = pager.page(pager.apply(query).all())
+    items = [
+        {
+            "uuid": str(t.id),
+            "title": t.title,
+            "description": t.description,
+            "status": t.status.value,
+            "due_date": t.due_date.isoformat() if t.due_date else None,
+            "created_at": t.created_at.isoformat(),
+            "created_by_id": str(t.created_by),
+            "created_by_name": manager_name,
+            "assigned_to_id": str(t.assigned_to) if t.assigned_to else None,
+            "assigned_to_name": assignee_name or "Unassigned",
+        }
+        for t, manager_name, assignee_name in page.items
+    ]
+    return {"items": items, "page": page}
+
+
+def _explorer_filters(
+    status_filter: Optional[str] = Query(None, alias="status"),
+    manager_id: Optional[str] = Query(None),
+    assignee_id: Optional[str] = Query(None),
+    due_from: Optional[date] = Query(None),
+    due_to: Optional[date] = Query(None),
+    sort: str = Query("created_at"),
+    direction: str = Query("desc"),
+) -> dict:
+    return {
+        "status_filter": _parse_task_status(status_filter),
+        "manager_id": validate_uuid(manager_id) if manager_id else None,
+        "assignee_id": validate_uuid(assignee_id) if assignee_id else None,
+        "due_from": due_from,
+        "due_to": due_to,
+        "sort": sort,
+        "direction": direction,
+    }
+
+
 @router.get("/tasks", response_class=HTMLResponse)
 def tasks(
     request: Request,
+    filters: dict = Depends(_explorer_filters),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)  # validate token
-): 
+):
     # ✅ ensure only admin can access
     if current_user.role != UserRole.admin:
         return HTMLResponse("<h3>Access Denied</h3>", status_code=403)
 
-    # Fetch all tasks created by this admin or their managers
-    manager_ids = [
-        mid for (mid,) in db.query(User.id)
-                          .filter(
-                              User.created_by == current_user.id,
-                              User.role == UserRole.manager,
-                              User.is_active == True
-                          ).all()
-    ]
-    if not manager_ids:
-        tasks = []
-    else:
-        tasks = (
-            db.query(Task)
-              .filter(
-                  Task.created_by.in_(manager_ids)
-              )
-              .order_by(desc(Task.created_at))
+    # First page rendered server-side; the template pages on through /admin/tasks/data
+    page = _task_explorer_page(db, current_user.id, **filters)
+
+    managers = (
+        db.query(User.id, User.username)
+          .filter(User.created_by == current_user.id, User.role == UserRole.manager, User.is_active == True)
+          .order_by(asc(User.username))
+          .all()
+    )
+    employees = []
+    if filters["manager_id"] is not None:
+        employees = (
+            db.query(User.id, User.username)
+              .filter(User.created_by == filters["manager_id"], User.role == UserRole.employee)
+              .order_by(asc(User.username))
               .all()
         )
 
-    ts_map ={
-            ts.pending: "pending",
-            ts.in_progress: "in progress",
-            ts.completed: "completed"
-        }
-    data = []
-    for t in tasks:
-        creator = db.query(User).filter(User.id == t.created_by).first()
-        assignee = db.query(User).filter(User.id == t.assigned_to).first()
-        creator_name = creator.username if creator else "N/A"
-        assignee_name = assignee.username if assignee else "Unassigned"
-        data.append({
-            "uuid": str(t.id),
-            "title": t.title,
-            "description": t.description,
-            "status": ts_map[t.status],
-            "due_date": t.due_date.isoformat() if t.due_date else None,
-            "created_at": t.created_at.isoformat(),
-            "created_by_id": str(t.created_by),
-            "created_by_name": creator_name,
-            "assigned_to_id": str(t.assigned_to) if t.assigned_to else None,
-            "assigned_to_name": assignee_name,
-        })
-
     # Render the tasks template
     return templates.TemplateResponse(
         "admin/tasks.html",
-        {"request": request, "tasks": data, "current_user": current_user}
-    )
\ No newline at end of file
+        {
+            "request": request,
+            "tasks": page["items"],
+            "next_cursor": page["page"].next_cursor,
+            "filters": filters,
+            "statuses": list(ts),
+            "sorts": sorted(EXPLORER_SORTS),
+            "managers": managers,
+            "employees": employees,
+            "current_user": current_user,
+        }
+    )
+
+
+@router.get("/tasks/data")
+def tasks_data(
+    request: Request,
+    filters: dict = Depends(_explorer_filters),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(EXPLORER_PAGE_SIZE, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    if current_user.role != UserRole.admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    page = _task_explorer_page(db, current_user.id, cursor=cursor, limit=limit, **filters)
+    resp = {"message": "Tasks fetched successfully", "data": page["items"], **page_response_fields(request, page["page"])}
+    return JSONResponse(status_code=status.HTTP_200_OK, content=resp)
@@ -1,16 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Form
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from fastapi.responses import HTMLResponse, RedirectResponse
 import logging
-from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.schemas.auth import LoginRequest, LoginResponse, TokenData
-from app.core.security import verify_password, create_access_token
+from app.core.security import verify_password_async, create_access_token, token_claims_for
+from app.core.templates import templates
+from app.core.responses import JSONResponse
+from app.core.rate_limit import login_ip_limit, login_account_limit, shed_hash_load
 from app.models.user import User, UserRole  # SQLAlchemy user model
 from app.db import get_db
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-templates = Jinja2Templates(directory="app/templates")
 
 @router.get("/login", response_class=HTMLResponse)
 def login(request: Request):
@@ -19,7 +21,11 @@ def login(request: Request):
 logger = logging.getLogger(__name__)
 
 
-@router.post("/login")
+def _find_user_by_email(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+
+@router.post("/login", dependencies=[Depends(login_ip_limit), Depends(shed_hash_load)])
 async def login(request: Request, email: str = Form(None), password: str = Form(None), db: Session = Depends(get_db)):
     """Accept form (browser) and JSON (API) logins.
 
@@ -42,10 +48,16 @@ async def login(request: Request, email: str = Form(None), password: str = Form(
             return templates.TemplateResponse("login.html", {"request": request, "error": "Missing credentials"})
 
     email = (email or "").strip().lower()
-    user = db.query(User).filter(User.email == email).first()
+    # only failed attempts count against the account, so normal logins never lock it
+    # (in the threadpool: with RATE_LIMIT_STORE=redis this is a network round-trip)
+    await run_in_threadpool(login_account_limit.check, email, count=False)
+
+    # Keep the DB lookup and bcrypt off the event loop
+    user = await run_in_threadpool(_find_user_by_email, db, email)
 
-    if not user or not verify_password(password, user.password_hash):
+    if not user or not await verify_password_async(password, user.password_hash):
         logger.warning("Failed login attempt for %s", email)
+        await run_in_threadpool(login_account_limit.hit, email)
         if is_json:
             return JSONResponse(status_code=status.HTTP_401_UNAUTHORIZED, content={"message": "Invalid credentials"})
         return templates.TemplateResponse("login.html", {"request": request, "error": "Invalid credentials"})
@@ -56,7 +68,7 @@ async def login(request: Request, email: str = Form(None), password: str = Form(
             return JSONResponse(status_code=status.HTTP_403_FORBIDDEN, content={"message": "User inactive"})
         return templates.TemplateResponse("login.html", {"request": request, "error": "User inactive"})
 
-    access_token = create_access_token({"sub": str(user.id)})
+    access_token = create_access_token(token_claims_for(user))
     # choose redirect target based on role
     if user.role == UserRole.admin:
         redirect_url = f"/admin/dashboard?token={access_token}"
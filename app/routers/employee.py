@@ -1,7 +1,7 @@
 # app/routers/manager.py
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body, Request, Form
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import JSONResponse, HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse
+from starlette.background import BackgroundTask
 from pydantic import EmailStr, BaseModel
 # import uuid
 from datetime import datetime
@@ -9,44 +9,32 @@ from decimal import Decimal, InvalidOperation
 
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from passlib.context import CryptContext
 
-# from core.config import settings
-from app.db import get_db
+from app.core.config import settings
+from app.db import get_db, get_async_db
 from app.models.user import User, UserRole
-from app.core.security import hash_password,verify_password, get_current_user
+from app.core.security import hash_password,verify_password, get_current_user, get_current_user_async, invalidate_principal, bump_token_version
+from app.core.templates import templates
+from app.core.responses import JSONResponse
 from app.utils.email_utils import send_email
 from app.utils.validators import validate_uuid
+from app.core.rate_limit import password_reset_ip_limit, password_reset_account_limit, shed_hash_load
 from app.models.time_log import TimeLog
 from app.models.task import Task, TaskStatus
+from app.models.task_stats import UserTaskStats
+from app.utils.task_stats import stats_dict
+from app.utils.loaders import user_loader
+from app.utils.cache_utils import employee_tasks_tag, employee_time_logs_tag, manager_profile_tag, invalidate_manager_cache, invalidate_time_logs
+from app.utils.fragment_cache import Fragments
 from app.models.time_log import TimeLog
 
-# Optional Redis (for cache invalidation). If not configured, functions will be no-ops.
-# try:
-#     import redis
-#     _redis_client = redis.from_url(settings.redis_url) if getattr(settings, "redis_url", None) else None
-# except Exception:
-#     _redis_client = None
-
 router = APIRouter(prefix="/employee", tags=["Employee"])
-templates = Jinja2Templates(directory="app/templates")
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-# def _invalidate_manager_cache(manager_uuid: UUID):
-#     """Invalidate Redis keys used for manager employee lists. Implement key naming consistently with your cache usage."""
-#     if not _redis_client:
-#         return
-#     try:
-#         # example key patterns
-#         keys = [f"manager:{manager_uuid}:employees", f"manager:{manager_uuid}:employees:active"]
-#         for k in keys:
-#             _redis_client.delete(k)
-#     except Exception:
-#         # don't crash the request if cache invalidation fails
-#         pass
-
 # ----------------- Endpoints -----------------
 
 @router.post("/{employee_id}/profile")
@@ -104,6 +92,7 @@ def update_employee_profile(
         db.add(employee_row)
         db.commit()
         db.refresh(employee_row)
+        invalidate_principal(employee_uuid)
 
     except OperationalError:
         db.rollback()
@@ -117,12 +106,12 @@ def update_employee_profile(
         db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
-    # Invalidate redis cache for this manager
-    # _invalidate_manager_cache(manager_uuid)
+    # the manager's employee list shows username/email/full_name
+    invalidate_manager_cache(current_user.created_by)
 
     return RedirectResponse(url=f"/employee/dashboard", status_code=303)
 
-@router.post("/{employee_id}/reset_password")
+@router.post("/{employee_id}/reset_password", dependencies=[Depends(password_reset_ip_limit), Depends(password_reset_account_limit), Depends(shed_hash_load)])
 def reset_employee_password(
     employee_id: str = Path(...),
     payload: dict = None,
@@ -155,9 +144,11 @@ def reset_employee_password(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Employee not found")
 
         employee_row.password_hash = hash_password(new_password)
+        bump_token_version(employee_row)
         db.add(employee_row)
         db.commit()
         db.refresh(employee_row)
+        invalidate_principal(employee_uuid)
     except OperationalError:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Database busy")
@@ -165,8 +156,7 @@ def reset_employee_password(
         db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not reset password")
 
-    # Invalidate caches and (optionally) revoke tokens via token_version bump (not implemented here)
-    # _invalidate_manager_cache(manager_uuid)
+    # Outstanding tokens were revoked by the token_version bump above; no cached list shows passwords
 
     resp = {"message": "Password updated successfully. Login again.", "data": {"uuid": str(employee_uuid)}}
     return JSONResponse(status_code=status.HTTP_200_OK, content=resp)
@@ -232,7 +222,7 @@ def create_log(
         db.add(log_data)
         db.commit()
         db.refresh(log_data)
-        # invalidate_employee_cache(employee_uuid)
+        invalidate_time_logs(employee_uuid)
 
     except OperationalError:
         db.rollback()
@@ -250,11 +240,20 @@ def create_log(
             "notes": log_data.notes
         }
     })
-@router.get("/dashboard", response_class=HTMLResponse)
-def employee_dashboard(request: Request, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    # Only employees should access this dashboard
-    if current_user.role != UserRole.employee:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+def _employee_dashboard_fragments(employee_id, manager_id) -> Fragments:
+    tasks = employee_tasks_tag(employee_id)
+    return (
+        Fragments("employee/dashboard", employee_id)
+        .add("summary", tasks)
+        .add("tasks", tasks, manager_profile_tag(manager_id))  # creator (manager) names
+        .add("time_logs", employee_time_logs_tag(employee_id), tasks)  # task titles
+    )
+
+
+def _employee_dashboard_context(db: Session, current_user: User, fragments: Fragments) -> dict:
+    # widgets still cached from an earlier render are skipped
+    # status counts are kept in user_task_stats; one primary-key lookup
+    stats = stats_dict(db.get(UserTaskStats, current_user.id) if fragments.stale("summary") else None)
 
     # Show only the logged-in employee's info
     employees_data = [{
@@ -263,18 +262,15 @@ def employee_dashboard(request: Request, db: Session = Depends(get_db), current_
         "username": current_user.username,
         "email": current_user.email,
         "full_name": current_user.full_name,
-        "task_count": db.query(func.count(Task.id)).filter(Task.assigned_to == current_user.id).scalar() or 0,
+        "task_count": stats["total"],
         "manager_id": current_user.created_by,
         "is_active": current_user.is_active,
     }]
 
     # Fetch tasks assigned to this employee (most recent first)
-    tasks = db.query(Task).filter(Task.assigned_to == current_user.id).order_by(Task.created_at.desc()).all()
-
-    # Compute status counts for this employee
-    pending_count = db.query(func.count(Task.id)).filter(Task.assigned_to == current_user.id, Task.status == TaskStatus.pending).scalar() or 0
-    in_progress_count = db.query(func.count(Task.id)).filter(Task.assigned_to == current_user.id, Task.status == TaskStatus.in_progress).scalar() or 0
-    completed_count = db.query(func.count(Task.id)).filter(Task.assigned_to == current_user.id, Task.status == TaskStatus.completed).scalar() or 0
+    tasks = []
+    if fragments.stale("tasks"):
+        tasks = db.query(Task).filter(Task.assigned_to == current_user.id).order_by(Task.created_at.desc()).all()
 
     status_map = {
         TaskStatus.pending: "pending",
@@ -282,14 +278,14 @@ def employee_dashboard(request: Request, db: Session = Depends(get_db), current_
         TaskStatus.completed: "completed"
     }
 
+    # tasks are assigned to this employee; creators are resolved in one batch
+    users = user_loader(db).prime(current_user)
+    users.want(*(t.created_by for t in tasks))
+
     tasks_data = []
     for t in tasks:
-        assigned_user = None
-        if t.assigned_to:
-            assigned_user = db.query(User).filter(User.id == t.assigned_to).first()
-        assigned_to_name = assigned_user.username if assigned_user else None
-        creator = db.query(User).filter(User.id == t.created_by).first()
-        created_by_name = creator.username if creator else None
+        assigned_to_name = users.name(t.assigned_to)
+        created_by_name = users.name(t.created_by)
 
         tasks_data.append({
             "id": t.id,
@@ -304,23 +300,26 @@ def employee_dashboard(request: Request, db: Session = Depends(get_db), current_
         })
 
     task_counts = {
-        "pending": pending_count,
-        "in_progress": in_progress_count,
-        "completed": completed_count,
-        "total": pending_count + in_progress_count + completed_count
+        "pending": stats["pending"],
+        "in_progress": stats["in_progress"],
+        "completed": stats["completed"],
+        "overdue": stats["overdue"],
+        "total": stats["total"]
     }
 
     # --- Time Log extraction for the current employee ---
-    time_logs = db.query(TimeLog).filter(TimeLog.user_id == current_user.id).order_by(TimeLog.date.desc(), TimeLog.created_at.desc()).all()
+    time_logs = []
+    if fragments.stale("time_logs"):
+        time_logs = db.query(TimeLog).filter(TimeLog.user_id == current_user.id).order_by(TimeLog.date.desc(), TimeLog.created_at.desc()).all()
+
+    # task titles for all logs in one query
+    log_task_ids = {l.task_id for l in time_logs if l.task_id}
+    titles = dict(db.query(Task.id, Task.title).filter(Task.id.in_(log_task_ids)).all()) if log_task_ids else {}
 
     time_logs_data = []
     total_logged_hours = 0
     for l in time_logs:
-        # fetch task title if available
-        task_obj = None
-        if l.task_id:
-            task_obj = db.query(Task).filter(Task.id == l.task_id).first()
-        task_title = task_obj.title if task_obj else None
+        task_title = titles.get(l.task_id)
 
         time_logs_data.append({
             "id": l.id,
@@ -337,18 +336,37 @@ def employee_dashboard(request: Request, db: Session = Depends(get_db), current_
         except Exception:
             pass
 
-    return templates.TemplateResponse(
-        "employee/dashboard.html",
-        {
-            "request": request,
-            "current_user": current_user,
-            "employees": employees_data,
-            "tasks": tasks_data,
-            "task_counts": task_counts,
-            "time_logs": time_logs_data,
-            "total_logged_hours": total_logged_hours,
-        },
-    )
+    return {
+        "current_user": current_user,
+        "employees": employees_data,
+        "tasks": tasks_data,
+        "task_counts": task_counts,
+        "time_logs": time_logs_data,
+        "total_logged_hours": total_logged_hours,
+        "fragments": fragments,
+    }
+
+
+def employee_dashboard(request: Request, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    # Only employees should access this dashboard
+    if current_user.role != UserRole.employee:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    fragments = _employee_dashboard_fragments(current_user.id, current_user.created_by).load()
+    context = _employee_dashboard_context(db, current_user, fragments)
+    return templates.TemplateResponse("employee/dashboard.html", {"request": request, **context}, background=BackgroundTask(fragments.save))
+
+
+async def employee_dashboard_async(request: Request, adb: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user_async)):
+    if current_user.role != UserRole.employee:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    fragments = await _employee_dashboard_fragments(current_user.id, current_user.created_by).load_async()
+    context = await adb.run_sync(_employee_dashboard_context, current_user, fragments)
+    return templates.TemplateResponse("employee/dashboard.html", {"request": request, **context}, background=BackgroundTask(fragments.save))
+
+
+router.get("/dashboard", response_class=HTMLResponse)(employee_dashboard_async if settings.DB_ASYNC_READS else employee_dashboard)
 
 @router.get("/{employee_id}/tasks/{task_id}/log-hours", response_class=HTMLResponse)
 def log_hours_page(request: Request, employee_id: str = Path(...), task_id: str = Path(...), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
@@ -432,6 +450,7 @@ def log_hours_submit(request: Request, employee_id: str = Path(...), task_id: st
         db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
+    invalidate_time_logs(employee_uuid)
     return RedirectResponse(url=f"/employee/dashboard", status_code=303)
 
 @router.get("/{employee_id}/time-logs/{log_id}", response_class=HTMLResponse)
@@ -542,6 +561,7 @@ def edit_time_log_submit(
         db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
+    invalidate_time_logs(employee_uuid)
     return RedirectResponse(url=f"/employee/dashboard", status_code=303)
 
 
@@ -573,6 +593,7 @@ def delete_time_log(
         db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
+    invalidate_time_logs(employee_uuid)
     return JSONResponse(status_code=200, content={
         "message": "Time Log deleted successfully",
         "data": {"uuid": str(log_uuid)}
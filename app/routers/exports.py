@@ -0,0 +1,243 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session, aliased
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Optional
+import csv
+import enum
+import io
+import uuid
+import zlib
+
+from app.core.config import settings
+from app.core.assets import accepted_encodings
+from app.core.responses import json_dumps
+from app.db import SessionLocal, get_db
+from app.models.user import User, UserRole
+from app.models.task import Task
+from app.models.task_log import TaskLog
+from app.models.time_log import TimeLog
+from app.core.security import get_current_principal, Principal
+from app.utils.validators import validate_uuid
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Streaming exports for managers and admins.
+#
+# The response body is produced after the request's dependencies (and so the
+# `get_db` session) have been torn down, so each generator opens its own
+# SessionLocal. Rows are read with `yield_per`, which streams from a
+# server-side cursor on Postgres, and written out in chunks, optionally
+# gzip-compressed on the fly, so memory stays flat however many rows match.
+
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+}
+
+
+def _export_value(value):
+    if value is None:
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _encode_rows(rows, columns: list, fmt: str):
+    """Serialized rows, batched into chunks of about EXPORT_CHUNK_BYTES."""
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow([_export_value(v) for v in row])
+            if buffer.tell() >= settings.EXPORT_CHUNK_BYTES:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+        return
+
+    # NDJSON lines use the API's orjson serializer, so values look the same as in JSON responses
+    buffer = bytearray()
+    for row in rows:
+        buffer += json_dumps(dict(zip(columns, row)))
+        buffer += b"\n"
+        if len(buffer) >= settings.EXPORT_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+def _gzip(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _stream_export(stmt, columns: list, fmt: str):
+    # own session: the request's session is closed before the body is sent
+    db = SessionLocal()
+    try:
+        result = db.execute(stmt.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        yield from _encode_rows(result, columns, fmt)
+    except Exception:
+        # headers are already sent; all we can do is log and cut the body short
+        logger.exception("Export failed mid-stream")
+        raise
+    finally:
+        db.close()
+
+
+def _export_response(request: Request, stmt, columns: list, fmt: str, name: str, compress: Optional[bool]):
+    media_type, extension = EXPORT_FORMATS[fmt]
+    if compress is None:
+        compress = "gzip" in accepted_encodings(request.scope)
+    body = _stream_export(stmt, columns, fmt)
+    headers = {"Content-Disposition": f'attachment; filename="{name}-{date.today().isoformat()}.{extension}"'}
+    if compress:
+        body = _gzip(body)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+def _export_filters(
+    fmt: str = Query("csv", alias="format"),
+    manager_id: Optional[str] = Query(None),
+    employee_id: Optional[str] = Query(None),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    compress: Optional[bool] = Query(None, alias="gzip"),
+) -> dict:
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"format must be one of {sorted(EXPORT_FORMATS)}")
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="date_from must not be after date_to")
+    return {
+        "fmt": fmt,
+        "manager_id": validate_uuid(manager_id) if manager_id else None,
+        "employee_id": validate_uuid(employee_id) if employee_id else None,
+        "date_from": date_from,
+        "date_to": date_to,
+        "compress": compress,
+    }
+
+
+def _task_scope(db: Session, current_user: Principal, manager_id):
+    """WHERE clause limiting tasks to what the caller may export."""
+    if current_user.role == UserRole.manager:
+        if manager_id is not None and manager_id != current_user.id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+        return Task.created_by == current_user.id
+    if current_user.role == UserRole.admin:
+        if manager_id is not None:
+            manager = db.query(User.id).filter(User.id == manager_id, User.role == UserRole.manager, User.created_by == current_user.id).first()
+            if not manager:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Manager not found")
+            return Task.created_by == manager_id
+        owner = aliased(User)
+        return exists().where(owner.id == Task.created_by, owner.created_by == current_user.id, owner.role == UserRole.manager)
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+
+def _between(column, date_from: Optional[date], date_to: Optional[date]) -> list:
+    # timestamps: date_to is inclusive, so compare against the start of the next day
+    clauses = []
+    if date_from:
+        clauses.append(column >= datetime.combine(date_from, time.min))
+    if date_to:
+        clauses.append(column < datetime.combine(date_to + timedelta(days=1), time.min))
+    return clauses
+
+
+TASK_COLUMNS = [
+    "uuid", "title", "description", "status", "assigned_to", "assigned_to_name",
+    "created_by", "created_by_name", "created_at", "start_date", "due_date", "completed_at",
+]
+
+
+@router.get("/tasks")
+def export_tasks(
+    request: Request,
+    filters: dict = Depends(_export_filters),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    assignee = aliased(User)
+    manager = aliased(User)
+    stmt = (
+        select(
+            Task.id, Task.title, Task.description, Task.status, Task.assigned_to, assignee.username,
+            Task.created_by, manager.username, Task.created_at, Task.start_date, Task.due_date, Task.completed_at,
+        )
+        .outerjoin(assignee, assignee.id == Task.assigned_to)
+        .outerjoin(manager, manager.id == Task.created_by)
+        .where(_task_scope(db, current_user, filters["manager_id"]), *_between(Task.created_at, filters["date_from"], filters["date_to"]))
+        .order_by(Task.created_at, Task.id)
+    )
+    if filters["employee_id"] is not None:
+        stmt = stmt.where(Task.assigned_to == filters["employee_id"])
+    return _export_response(request, stmt, TASK_COLUMNS, filters["fmt"], "tasks", filters["compress"])
+
+
+TASK_LOG_COLUMNS = ["id", "task_id", "task_title", "status", "created_at", "assigned_to", "created_by"]
+
+
+@router.get("/task-logs")
+def export_task_logs(
+    request: Request,
+    filters: dict = Depends(_export_filters),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    stmt = (
+        select(TaskLog.id, TaskLog.task_id, Task.title, TaskLog.status, TaskLog.created_at, Task.assigned_to, Task.created_by)
+        .join(Task, Task.id == TaskLog.task_id)
+        .where(_task_scope(db, current_user, filters["manager_id"]), *_between(TaskLog.created_at, filters["date_from"], filters["date_to"]))
+        .order_by(TaskLog.created_at, TaskLog.id)
+    )
+    if filters["employee_id"] is not None:
+        stmt = stmt.where(Task.assigned_to == filters["employee_id"])
+    return _export_response(request, stmt, TASK_LOG_COLUMNS, filters["fmt"], "task-logs", filters["compress"])
+
+
+TIME_LOG_COLUMNS = ["uuid", "task_id", "task_title", "user_id", "username", "date", "hours", "notes", "created_at"]
+
+
+@router.get("/time-logs")
+def export_time_logs(
+    request: Request,
+    filters: dict = Depends(_export_filters),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    stmt = (
+        select(TimeLog.id, TimeLog.task_id, Task.title, TimeLog.user_id, User.username, TimeLog.date, TimeLog.hours, TimeLog.notes, TimeLog.created_at)
+        .join(Task, Task.id == TimeLog.task_id)
+        .outerjoin(User, User.id == TimeLog.user_id)
+        .where(_task_scope(db, current_user, filters["manager_id"]))
+        .order_by(TimeLog.date, TimeLog.id)
+    )
+    # time logs are per day, so the range applies to the logged date
+    if filters["date_from"]:
+        stmt = stmt.where(TimeLog.date >= filters["date_from"])
+    if filters["date_to"]:
+        stmt = stmt.where(TimeLog.date <= filters["date_to"])
+    if filters["employee_id"] is not None:
+        stmt = stmt.where(TimeLog.user_id == filters["employee_id"])
+    return _export_response(request, stmt, TIME_LOG_COLUMNS, filters["fmt"], "time-logs", filters["compress"])
@@ -1,69 +1,90 @@
 # app/routers/manager.py
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Request, Form
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import JSONResponse, HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse
+from starlette.background import BackgroundTask
 from pydantic import EmailStr, BaseModel
 # import uuid
 from datetime import datetime
+from typing import Optional
 
 from sqlalchemy import func, desc
 from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from passlib.context import CryptContext
 
-# from core.config import settings
-from app.db import get_db
+from app.core.config import settings
+from app.db import get_db, get_async_db
 from app.models.user import User, UserRole
 from app.models.task import Task, TaskStatus
 from app.models.task_log import TaskLog, TaskStatus as log
 from app.models.time_log import TimeLog
-from app.core.security import hash_password,verify_password, get_current_user
+from app.models.task_stats import UserTaskStats
+from app.core.security import hash_password, verify_password, get_current_user, get_current_user_async, get_current_principal, Principal, invalidate_principal, bump_token_version
+from app.core.templates import templates
+from app.core.responses import JSONResponse
 from app.utils.email_utils import send_email
 from app.utils.validators import validate_uuid
-
-# Optional Redis (for cache invalidation). If not configured, functions will be no-ops.
-# try:
-#     import redis
-#     _redis_client = redis.from_url(settings.redis_url) if getattr(settings, "redis_url", None) else None
-# except Exception:
-#     _redis_client = None
+from app.utils.request_utils import json_payload, bulk_items
+from app.utils.task_stats import task_snapshot, record_task_change
+from app.utils.loaders import user_loader
+from app.utils.pagination import KeysetPager, page_response_fields
+from app.utils.cache_utils import get_cache, request_cache_key, manager_employees_tag, manager_tasks_tag, invalidate_manager_cache, invalidate_admin_cache, invalidate_manager_profile, invalidate_task_lists
+from app.utils.fragment_cache import Fragments
+from app.utils.onboarding import validate_employees, create_employees, import_slot
+from app.core.rate_limit import password_reset_ip_limit, password_reset_account_limit, shed_hash_load
 
 router = APIRouter(prefix="/manager", tags=["Manager"])
-templates = Jinja2Templates(directory="app/templates")
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 import logging
 logger = logging.getLogger(__name__)
 
 
-@router.get("/dashboard", response_class=HTMLResponse)
-def manager_dashboard(request: Request, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    # Render manager dashboard using current_user; fetch employees and tasks overview
-    employees = db.query(User).filter(User.created_by == current_user.id, User.role == UserRole.employee).order_by(User.username).all()
-    tasks = db.query(Task).filter(Task.created_by == current_user.id).order_by(Task.created_at.desc()).limit(50).all()
+def _manager_dashboard_fragments(manager_id) -> Fragments:
+    # task counts and assignee names cross the two widgets, so both carry both tags
+    tags = (manager_employees_tag(manager_id), manager_tasks_tag(manager_id))
+    return Fragments("manager/dashboard", manager_id).add("employees", *tags).add("tasks", *tags)
+
+
+def _manager_dashboard_context(db: Session, current_user: User, fragments: Fragments) -> dict:
+    # fetch employees and tasks overview for the manager dashboard; widgets
+    # still cached from an earlier render are skipped
+    # task counts come from user_task_stats in the same query
+    employees = []
+    if fragments.stale("employees"):
+        employees = (
+            db.query(User, UserTaskStats.total)
+              .outerjoin(UserTaskStats, UserTaskStats.user_id == User.id)
+              .filter(User.created_by == current_user.id, User.role == UserRole.employee)
+              .order_by(User.username)
+              .all()
+        )
+    tasks = []
+    if fragments.stale("tasks"):
+        tasks = db.query(Task).filter(Task.created_by == current_user.id).order_by(Task.created_at.desc()).limit(50).all()
 
     employees_data = []
-    for e in employees:
-        tcount = db.query(Task).filter(Task.assigned_to == e.id).count()
+    for e, tcount in employees:
         employees_data.append({
             "id": e.id,
             "uuid": str(e.id),
             "username": e.username,
             "email": e.email,
             "full_name": e.full_name,
-            "task_count": tcount,
+            "task_count": tcount or 0,
             "manager_id": e.created_by,
             "is_active": e.is_active,
         })
 
+    # assignees are resolved in one batch; the creator is always this manager
+    users = user_loader(db).prime(current_user, *(e for e, _ in employees))
+    users.want(*(t.assigned_to for t in tasks))
+
     tasks_data = []
     for t in tasks:
-        assigned_user = None
-        if t.assigned_to:
-            assigned_user = db.query(User).filter(User.id == t.assigned_to).first()
-        assigned_to_name = assigned_user.username if assigned_user else None
-        creator = db.query(User).filter(User.id == t.created_by).first()
-        created_by_name = creator.username if creator else None
+        assigned_to_name = users.name(t.assigned_to)
+        created_by_name = users.name(t.created_by)
         status_map = {
             TaskStatus.pending: "pending",
             TaskStatus.in_progress: "in progress",
@@ -80,10 +101,22 @@ def manager_dashboard(request: Request, db: Session = Depends(get_db), current_u
             "created_by_name": created_by_name,
         })
 
-    return templates.TemplateResponse(
-        "manager/dashboard.html",
-        {"request": request, "current_user": current_user, "employees": employees_data, "tasks": tasks_data},
-    )
+    return {"current_user": current_user, "employees": employees_data, "tasks": tasks_data, "fragments": fragments}
+
+
+def manager_dashboard(request: Request, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    fragments = _manager_dashboard_fragments(current_user.id).load()
+    context = _manager_dashboard_context(db, current_user, fragments)
+    return templates.TemplateResponse("manager/dashboard.html", {"request": request, **context}, background=BackgroundTask(fragments.save))
+
+
+async def manager_dashboard_async(request: Request, adb: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user_async)):
+    fragments = await _manager_dashboard_fragments(current_user.id).load_async()
+    context = await adb.run_sync(_manager_dashboard_context, current_user, fragments)
+    return templates.TemplateResponse("manager/dashboard.html", {"request": request, **context}, background=BackgroundTask(fragments.save))
+
+
+router.get("/dashboard", response_class=HTMLResponse)(manager_dashboard_async if settings.DB_ASYNC_READS else manager_dashboard)
 
 @router.get("/employees/new", response_class=HTMLResponse)
 def new_employee_form_noid(request: Request, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
@@ -106,12 +139,10 @@ def get_employee_noid(request: Request, employee_id: str, db: Session = Depends(
 
     # fetch tasks
     tasks = db.query(Task).filter(Task.assigned_to == employee_uuid).order_by(Task.created_at.desc()).all()
+    users = user_loader(db).prime(employee)
     tasks_data = []
     for t in tasks:
-        assigned_user = None
-        if t.assigned_to:
-            assigned_user = db.query(User).filter(User.id == t.assigned_to).first()
-        assigned_to_name = assigned_user.username if assigned_user else None
+        assigned_to_name = users.name(t.assigned_to)
         status_map = {
             TaskStatus.pending: "pending",
             TaskStatus.in_progress: "in progress",
@@ -131,16 +162,15 @@ def get_employee_noid(request: Request, employee_id: str, db: Session = Depends(
     time_logs_data = []
     try:
         time_logs = db.query(TimeLog).filter(TimeLog.user_id == employee_uuid).order_by(TimeLog.created_at.desc()).all()
+        # task titles for all logs in one query
+        log_task_ids = {tl.task_id for tl in time_logs if tl.task_id}
+        titles = dict(db.query(Task.id, Task.title).filter(Task.id.in_(log_task_ids)).all()) if log_task_ids else {}
         for tl in time_logs:
-            task_id_val = tl.task_id
-            if task_id_val:
-                task_row = db.query(Task).filter(Task.id == task_id_val).first()
-
             time_logs_data.append({
                 "id": tl.id,
                 "uuid": str(tl.id),
                 "user_id": tl.user_id,
-                "task": task_row.title,
+                "task": titles.get(tl.task_id),
                 "date": tl.date,
                 "duration": tl.hours,
                 "notes": tl.notes,
@@ -188,10 +218,7 @@ def get_task_noid(request: Request, task_id: str, db: Session = Depends(get_db),
     if current_user.role == UserRole.manager and current_user.id != task.created_by and current_user.role != UserRole.admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
 
-    assigned_user = None
-    if task.assigned_to:
-        assigned_user = db.query(User).filter(User.id == task.assigned_to).first()
-    assigned_to_name = assigned_user.username if assigned_user else None
+    assigned_to_name = user_loader(db).prime(current_user).name(task.assigned_to)
     return templates.TemplateResponse("task_detail.html", {"request": request, "task": task, "assigned_to_name": assigned_to_name, "current_user": current_user})
 
 
@@ -207,19 +234,6 @@ def manager_profile(request: Request, manager_id: str, db: Session = Depends(get
 
     return templates.TemplateResponse("manager/profile.html", {"request": request, "current_user": current_user, "user": user})
 
-# def _invalidate_manager_cache(manager_uuid: UUID):
-#     """Invalidate Redis keys used for manager employee lists. Implement key naming consistently with your cache usage."""
-#     if not _redis_client:
-#         return
-#     try:
-#         # example key patterns
-#         keys = [f"manager:{manager_uuid}:employees", f"manager:{manager_uuid}:employees:active"]
-#         for k in keys:
-#             _redis_client.delete(k)
-#     except Exception:
-#         # don't crash the request if cache invalidation fails
-#         pass
-
 # ----------------- Endpoints -----------------
 
 @router.post("/{manager_id}/profile", summary="Update manager profile")
@@ -274,6 +288,9 @@ def update_manager_profile(
         db.add(manager_row)
         db.commit()
         db.refresh(manager_row)
+        invalidate_principal(manager_uuid)
+        invalidate_admin_cache(manager_row.created_by)
+        invalidate_manager_profile(manager_uuid)
 
     except OperationalError:
         db.rollback()
@@ -291,14 +308,15 @@ def update_manager_profile(
     return RedirectResponse(url=f"/manager/dashboard", status_code=303)
 
 
-@router.post("/{manager_id}/employees", summary="Create a new employee under manager")
-async def create_employee(
+@router.post("/{manager_id}/employees", summary="Create a new employee under manager", dependencies=[Depends(shed_hash_load)])
+def create_employee(
     request: Request,
     manager_id: str = Path(..., description="Manager UUID"),
     username: str = Form(None),
     email: str = Form(None),
     password: str = Form(None),
     full_name: str = Form(None),
+    payload: Optional[dict] = Depends(json_payload),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -308,13 +326,7 @@ async def create_employee(
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only the manager can create their employees")
 
     # Support both JSON API clients and browser form submissions
-    payload = None
     content_type = request.headers.get("content-type", "")
-    if content_type.startswith("application/json"):
-        try:
-            payload = await request.json()
-        except Exception:
-            payload = None
 
     if payload:
         username = payload.get("username")
@@ -345,7 +357,6 @@ async def create_employee(
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email or username already exists")
         return templates.TemplateResponse("manager/create_employee.html", {"request": request, "current_user": current_user, "error": "Email or username already exists"})
 
-    from core.security import hash_password
     new_user = User(
         username=username.strip(),
         email=email.strip().lower(),
@@ -372,6 +383,8 @@ async def create_employee(
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
         return templates.TemplateResponse("manager/create_employee.html", {"request": request, "current_user": current_user, "error": str(e)})
 
+    invalidate_manager_cache(manager_uuid)
+
     # On browser form submission redirect back to dashboard
     if not content_type.startswith("application/json"):
         return RedirectResponse(url=f"/manager/dashboard", status_code=303)
@@ -390,14 +403,64 @@ async def create_employee(
     return JSONResponse(status_code=status.HTTP_201_CREATED, content=resp)
 
 
+@router.post("/{manager_id}/employees/import", summary="Onboard many employees at once", dependencies=[Depends(shed_hash_load)])
+def import_employees(
+    manager_id: str = Path(..., description="Manager UUID"),
+    atomic: bool = Query(False, description="Create nobody if any row is invalid"),
+    items: list = Depends(bulk_items("employees")),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """Create employees from a JSON list or CSV (username, email, password,
+    full_name). Invalid or already taken rows are reported by index and
+    skipped, unless `atomic=true`."""
+    manager_uuid = validate_uuid(manager_id)
+    if current_user.id != manager_uuid or current_user.role != UserRole.manager:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only the manager can create their employees")
+
+    accepted, errors = validate_employees(db, items)
+    if errors and (atomic or not accepted):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={"message": "No employees created", "errors": errors})
+
+    def progress(done: int, total: int) -> None:
+        logger.info("Employee import for manager %s: %d/%d passwords hashed", manager_uuid, done, total)
+
+    # end the transaction the uniqueness check opened: no pooled connection sits idle while hashing
+    db.rollback()
+    try:
+        with import_slot():
+            created = create_employees(db, manager_uuid, accepted, progress=progress)
+            db.commit()
+    except HTTPException:
+        raise
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email or username already exists")
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    invalidate_manager_cache(manager_uuid)
+    resp = {
+        "message": f"{len(created)} employees created" + (f", {len(errors)} skipped" if errors else ""),
+        "data": [
+            {"index": index, "uuid": user.id, "username": user.username, "email": user.email, "full_name": user.full_name}
+            for (index, _), user in zip(accepted, created)
+        ],
+        "errors": errors,
+    }
+    return JSONResponse(status_code=status.HTTP_201_CREATED, content=resp)
+
+
 @router.post("/{manager_id}/tasks", summary="Create a new task under manager")
-async def create_task_from_form(
+def create_task_from_form(
     request: Request,
     manager_id: str = Path(..., description="Manager UUID"),
     title: str = Form(None),
     description: str = Form(None),
     assigned_to: str = Form(None),
     due_date: str = Form(None),
+    payload: Optional[dict] = Depends(json_payload),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -407,12 +470,6 @@ async def create_task_from_form(
 
     # support both JSON payloads and form posts
     content_type = request.headers.get("content-type", "")
-    payload = None
-    if content_type.startswith("application/json"):
-        try:
-            payload = await request.json()
-        except Exception:
-            payload = None
 
     if payload:
         title = payload.get("title")
@@ -446,23 +503,21 @@ async def create_task_from_form(
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Can only assign task to your employees")
             return templates.TemplateResponse("manager/create_task.html", {"request": request, "current_user": current_user, "employees": employees, "error": "Can only assign task to your employees"})
 
-    from models.task import Task
-    from models.task_log import TaskLog
-    from datetime import datetime
     task = Task(
         title=title.strip(),
         description=description.strip(),
-        status="pending",
+        status=TaskStatus.pending,
         assigned_to=assigned_uuid,
         start_date=datetime.now(),
-        due_date=(due_date if due_date else None),
+        due_date=(datetime.strptime(due_date, "%Y-%m-%d").date() if due_date else None),
         created_by=manager_uuid,
     )
     try:
         db.add(task)
         db.flush()
-        task_log = TaskLog(task_id=task.id, status=task.status, created_at=datetime.now())
+        task_log = TaskLog(task_id=task.id, status=log.pending, created_at=datetime.now())
         db.add(task_log)
+        record_task_change(db, None, task_snapshot(task))
         db.commit()
         db.refresh(task)
     except Exception as e:
@@ -472,6 +527,8 @@ async def create_task_from_form(
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
         return templates.TemplateResponse("manager/create_task.html", {"request": request, "current_user": current_user, "employees": employees, "error": str(e)})
 
+    invalidate_task_lists(manager_uuid, task.assigned_to)
+
     if not content_type.startswith("application/json"):
         return RedirectResponse(url=f"/manager/dashboard", status_code=303)
 
@@ -481,7 +538,7 @@ async def create_task_from_form(
             "uuid": str(task.id),
             "title": task.title,
             "description": task.description,
-            "status": task.status,
+            "status": task.status.value,
             "assigned_to": str(task.assigned_to),
             "created_by": str(task.created_by),
         }
@@ -491,11 +548,13 @@ async def create_task_from_form(
 
 @router.get("/{manager_id}/employees")
 def list_employees(
+    request: Request,
     manager_id: str = Path(..., description="Manager UUID"),
     limit: int = Query(40, ge=1),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     manager_uuid = validate_uuid(manager_id)
 
@@ -505,24 +564,35 @@ def list_employees(
     if current_user.id != manager_uuid and current_user.role != UserRole.admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to view these employees")
 
-    employees = db.query(User).filter(
-        User.created_by == manager_uuid,
-        User.role == UserRole.employee,
-        User.is_active == True
-    ).order_by(User.username).limit(limit).offset(offset).all()
+    def build():
+        pager = KeysetPager(db, [User.username, User.id], direction="asc", cursor=cursor, limit=limit, offset=offset, scope="employees")
+        page = pager.page(pager.apply(db.query(User).filter(
+            User.created_by == manager_uuid,
+            User.role == UserRole.employee,
+            User.is_active == True
+        )).all())
+        employees = page.items
+
+        return {
+            "message": "Employees fetched successfully",
+            "data": [
+                {
+                    "uuid": e.id,
+                    "username": e.username,
+                    "email": e.email,
+                    "full_name": e.full_name,
+                    "role": "employee",
+                } for e in employees
+            ],
+            **page_response_fields(request, page),
+        }
 
-    resp = {
-        "message": "Employees fetched successfully",
-        "data": [
-            {
-                "uuid": str(e.id),
-                "username": e.username,
-                "email": e.email,
-                "full_name": e.full_name,
-                "role": "employee",
-            } for e in employees
-        ],
-    }
+    resp = get_cache().get_or_set(
+        request_cache_key(request, "manager", manager_uuid, "employees"),
+        build,
+        tags=[manager_employees_tag(manager_uuid)],
+        namespace="manager:employees",
+    )
     return JSONResponse(status_code=status.HTTP_200_OK, content=resp)
 
 
@@ -550,12 +620,10 @@ def get_employee(
 
     # fetch tasks assigned to this employee
     tasks = db.query(Task).filter(Task.assigned_to == employee_uuid).order_by(Task.created_at.desc()).all()
+    users = user_loader(db).prime(employee)
     tasks_data = []
     for t in tasks:
-        assigned_user = None
-        if t.assigned_to:
-            assigned_user = db.query(User).filter(User.id == t.assigned_to).first()
-        assigned_to_name = assigned_user.username if assigned_user else None
+        assigned_to_name = users.name(t.assigned_to)
         tasks_data.append({
             "id": t.id,
             "uuid": str(t.id),
@@ -593,13 +661,12 @@ def get_employee_noid(request: Request, employee_id: str, db: Session = Depends(
 
 
 
-@router.post("/employees/create-form", response_class=HTMLResponse)
+@router.post("/employees/create-form", response_class=HTMLResponse, dependencies=[Depends(shed_hash_load)])
 def create_employee_form_noid(request: Request, username: str = Form(...), email: str = Form(...), password: str = Form(...), full_name: str = Form(None), db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     # Same as create_employee_form but uses authenticated manager id
     if current_user.role != UserRole.manager:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
 
-    from core.security import hash_password
     if not username or not email or not password:
         return templates.TemplateResponse("manager/create_employee.html", {"request": request, "current_user": current_user, "error": "username, email and password are required"})
 
@@ -620,10 +687,11 @@ def create_employee_form_noid(request: Request, username: str = Form(...), email
         db.rollback()
         return templates.TemplateResponse("manager/create_employee.html", {"request": request, "current_user": current_user, "error": str(e)})
 
+    invalidate_manager_cache(current_user.id)
     return RedirectResponse(url=f"/manager/dashboard", status_code=303)
 
 
-@router.post("/{manager_id}/reset_password")
+@router.post("/{manager_id}/reset_password", dependencies=[Depends(password_reset_ip_limit), Depends(password_reset_account_limit), Depends(shed_hash_load)])
 def reset_manager_password(
     manager_id: str = Path(...),
     payload: dict = None,
@@ -656,9 +724,11 @@ def reset_manager_password(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Manager not found")
 
         manager_row.password_hash = hash_password(new_password)
+        bump_token_version(manager_row)
         db.add(manager_row)
         db.commit()
         db.refresh(manager_row)
+        invalidate_principal(manager_uuid)
     except OperationalError:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Database busy")
@@ -666,8 +736,7 @@ def reset_manager_password(
         db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not reset password")
 
-    # Invalidate caches and (optionally) revoke tokens via token_version bump (not implemented here)
-    # _invalidate_manager_cache(manager_uuid)
+    # Outstanding tokens were revoked by the token_version bump above; no cached list shows passwords
 
     resp = {"message": "Password updated successfully. Login again.", "data": {"uuid": str(manager_uuid)}}
     return JSONResponse(status_code=status.HTTP_200_OK, content=resp)
@@ -679,7 +748,7 @@ def deactivate_employee(
     employee_id: str = Path(...),
     # payload: dict = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     manager_uuid = validate_uuid(manager_id)
     employee_uuid = validate_uuid(employee_id)
@@ -702,13 +771,16 @@ def deactivate_employee(
 
     try:
         employee.is_active = False
+        bump_token_version(employee)
         db.add(employee)
         db.commit()
     except Exception:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to deactivate employee")
 
-    # _invalidate_manager_cache(manager_uuid)
+    invalidate_principal(employee_uuid)
+
+    invalidate_manager_cache(manager_uuid)
 
     resp = {
         "message": "Employee deactivated successfully",
@@ -722,7 +794,7 @@ def activate_employee(
     employee_id: str = Path(...),
     # payload: dict = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     manager_uuid = validate_uuid(manager_id)
     employee_uuid = validate_uuid(employee_id)
@@ -751,7 +823,9 @@ def activate_employee(
         db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to activate employee")
 
-    # _invalidate_manager_cache(manager_uuid)
+    invalidate_principal(employee_uuid)
+
+    invalidate_manager_cache(manager_uuid)
 
     resp = {
         "message": "Employee activated successfully",
@@ -766,22 +840,21 @@ def view_employees_page(request: Request, manager_id: str, db: Session = Depends
     if current_user.id != manager_uuid and current_user.role != UserRole.admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to view these employees")
 
-    employees = db.query(User).filter(
+    employees = db.query(User, UserTaskStats.total).outerjoin(UserTaskStats, UserTaskStats.user_id == User.id).filter(
         User.created_by == manager_uuid,
         User.role == UserRole.employee,
         User.is_active == True
     ).order_by(User.username).all()
 
     data = []
-    for e in employees:
-        tcount = db.query(Task).filter(Task.assigned_to == e.id).count()
+    for e, tcount in employees:
         data.append({
             "id": e.id,
             "uuid": str(e.id),
             "username": e.username,
             "email": e.email,
             "full_name": e.full_name,
-            "task_count": tcount,
+            "task_count": tcount or 0,
             "manager_id": e.created_by,
         })
 
@@ -830,6 +903,7 @@ def edit_task_noid(request: Request, task_id: str = Path(...), title: str = Form
             employees = db.query(User).filter(User.created_by == current_user.id, User.role == UserRole.employee, User.is_active == True).all()
             return templates.TemplateResponse("manager/edit_task.html", {"request": request, "current_user": current_user, "task": task, "employees": employees, "error": "Can only assign task to your employees"})
     
+    before = task_snapshot(task)
     task.title = title.strip()
     task.description = description.strip()
     task.due_date = datetime.strptime(due_date, "%Y-%m-%d") if due_date else None
@@ -850,6 +924,8 @@ def edit_task_noid(request: Request, task_id: str = Path(...), title: str = Form
         created_at=datetime.now()
     )
     db.add(log)
+    record_task_change(db, before, task_snapshot(task))
     db.commit()
+    invalidate_task_lists(task.created_by, before[0], task.assigned_to)
 
     return RedirectResponse(url="/manager/dashboard", status_code=303)
\ No newline at end of file
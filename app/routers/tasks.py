@@ -1,17 +1,28 @@
 from fastapi import APIRouter, Path, Depends, HTTPException, status, Query, Request, Form
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import JSONResponse, HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse
+from sqlalchemy import case, cast, func, insert, literal, select, update
 from sqlalchemy.exc import OperationalError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db import get_db
+from pydantic import ValidationError
+from app.core.config import settings
+from app.db import get_db, get_async_db
 from app.models.user import User, UserRole
 from app.models.task import Task, TaskStatus
 from app.models.task_log import TaskLog
 from app.models.task_log import TaskStatus as log
 from app.schemas.task import TaskCreate
-from app.core.security import get_current_user
+from app.core.security import get_current_user, get_current_principal, get_current_principal_async, Principal
+from app.core.templates import templates
+from app.core.responses import JSONResponse
 from app.utils.validators import validate_uuid
+from app.utils.task_stats import task_snapshot, record_task_change, record_task_changes
+from app.utils.loaders import user_loader
+from app.utils.pagination import KeysetPager, page_response_fields
+from app.utils.cache_utils import get_cache, cache_key, manager_tasks_tag, employee_tasks_tag, invalidate_task_lists
+from app.utils.request_utils import bulk_items, item_errors, request_etag, etag_matches, etag_headers, not_modified
 from datetime import datetime, date
+from typing import Optional
 import uuid
 
 
@@ -26,7 +37,157 @@ employee_tasks_router = APIRouter(
     tags=["Employee Tasks"]
 )
 
-templates = Jinja2Templates(directory="app/templates")
+
+
+# list fields -> column; `fields=` picks a subset and only those columns are selected
+TASK_LIST_FIELDS = {
+    "uuid": Task.id,
+    "title": Task.title,
+    "description": Task.description,
+    "status": Task.status,
+    "assigned_to": Task.assigned_to,
+    "start_date": Task.start_date,
+    "due_date": Task.due_date,
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+}
+# description is unbounded text; list views only send it when asked for
+DEFAULT_TASK_LIST_FIELDS = [f for f in TASK_LIST_FIELDS if f != "description"]
+
+# status values accepted from clients (forms and bulk transitions)
+TRANSITION_STATUSES = {
+    "pending": TaskStatus.pending,
+    "in-progress": TaskStatus.in_progress,
+    "in progress": TaskStatus.in_progress,
+    "in_progress": TaskStatus.in_progress,
+    "completed": TaskStatus.completed,
+}
+LOG_STATUSES = {
+    TaskStatus.pending: log.pending,
+    TaskStatus.in_progress: log.in_progress,
+    TaskStatus.completed: log.completed,
+}
+
+
+def task_list_fields(fields: Optional[str] = Query(None, description="Comma-separated fields, e.g. title,status,due_date")) -> list:
+    if not fields:
+        return DEFAULT_TASK_LIST_FIELDS
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in TASK_LIST_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields {unknown}; allowed: {list(TASK_LIST_FIELDS)}")
+    # uuid always comes back so rows stay addressable
+    return ["uuid"] + [f for f in dict.fromkeys(requested) if f != "uuid"]
+
+
+def _task_list_query(fields: list):
+    return select(*[TASK_LIST_FIELDS[f] for f in fields])
+
+
+def _task_list_version(scope):
+    # (row count, latest update): any insert, delete or update in the scope changes one of them
+    return select(func.count(), func.max(Task.updated_at)).where(scope)
+
+
+def _task_list_content(rows, fields: list, pagination: dict = None) -> dict:
+    # values stay typed (UUID, TaskStatus, date, datetime); the response serializes them
+    data = [dict(zip(fields, row if len(fields) > 1 else (row,))) for row in rows]
+    return {
+        "message": "Tasks fetched successfully",
+        "data": data,
+        **(pagination or {}),
+    }
+
+
+def _task_pager(db, scope: str, cursor: Optional[str], limit: int, offset: int) -> KeysetPager:
+    # newest first on (created_at, id); `offset` still works when no cursor is given
+    return KeysetPager(db, [Task.created_at, Task.id], direction="desc", cursor=cursor, limit=limit, offset=offset, scope=scope)
+
+def _apply_transitions(db: Session, items: list, scope, manager_uuid, atomic: bool) -> JSONResponse:
+    """Apply `{"task_id", "status"}` items to the tasks matching `scope`: the
+    rows are locked in id order, updated with one UPDATE ... WHERE id IN and
+    logged with one executemany. Bad items are reported by index."""
+    errors, wanted = [], {}
+    for index, item in enumerate(items):
+        item = item if isinstance(item, dict) else {}
+        try:
+            task_uuid = validate_uuid(str(item.get("task_id") or ""))
+        except HTTPException:
+            errors.append({"index": index, "errors": ["task_id: Invalid UUID format"]})
+            continue
+        new_status = TRANSITION_STATUSES.get(str(item.get("status") or "").strip().lower())
+        if new_status is None:
+            errors.append({"index": index, "errors": ["status: Invalid status value"]})
+        elif task_uuid in wanted:
+            errors.append({"index": index, "errors": ["task_id: Task given more than once"]})
+        else:
+            wanted[task_uuid] = (index, new_status)
+
+    try:
+        # a fixed lock order, so two overlapping bulk requests cannot deadlock
+        tasks = db.execute(
+            select(Task.id, Task.status, Task.assigned_to, Task.due_date)
+            .where(Task.id.in_(wanted), scope)
+            .order_by(Task.id)
+            .with_for_update()
+        ).all() if wanted else []
+        found = {t.id: t for t in tasks}
+
+        changes = {}
+        for task_uuid, (index, new_status) in wanted.items():
+            task = found.get(task_uuid)
+            if task is None:
+                errors.append({"index": index, "errors": ["task_id: Task not found"]})
+            elif task.status == TaskStatus.completed:
+                errors.append({"index": index, "errors": ["status: Completed task cannot be updated"]})
+            elif task.status == new_status:
+                errors.append({"index": index, "errors": [f"status: Task is already {new_status.value}"]})
+            else:
+                changes[task_uuid] = (index, task, new_status)
+        errors.sort(key=lambda e: e["index"])
+
+        if errors and (atomic or not changes):
+            db.rollback()
+            raise HTTPException(status_code=400, detail={"message": "No tasks updated", "errors": errors})
+
+        now = datetime.now()
+        new_status_of = {task_uuid: literal(new_status, Task.status.type) for task_uuid, (_, _, new_status) in changes.items()}
+        # CAST: Postgres would otherwise type the CASE as text, not the status enum
+        db.execute(
+            update(Task)
+            .where(Task.id.in_(new_status_of))
+            .values(status=cast(case(new_status_of, value=Task.id), Task.status.type))
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(insert(TaskLog), [
+            {"task_id": task_uuid, "status": LOG_STATUSES[new_status], "created_at": now}
+            for task_uuid, (_, _, new_status) in changes.items()
+        ])
+        record_task_changes(db, [
+            ((task.assigned_to, task.status, task.due_date), (task.assigned_to, new_status, task.due_date))
+            for _, task, new_status in changes.values()
+        ])
+        db.commit()
+    except HTTPException:
+        raise
+    except OperationalError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Database busy, try again")
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    invalidate_task_lists(manager_uuid, *{task.assigned_to for _, task, _ in changes.values()})
+    resp = {
+        "message": f"{len(changes)} tasks updated" + (f", {len(errors)} skipped" if errors else ""),
+        "data": [
+            {"index": index, "uuid": task.id, "previous_status": task.status, "status": new_status}
+            for index, task, new_status in sorted(changes.values(), key=lambda c: c[0])
+        ],
+        "errors": errors,
+    }
+    return JSONResponse(status_code=200, content=resp)
+
 
 # ----------------- Endpoints -----------------
 
@@ -36,7 +197,7 @@ def create_task(
     payload: TaskCreate,
     manager_id: str = Path(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     manager_uuid = validate_uuid(manager_id)
     if current_user.id != manager_uuid or current_user.role != UserRole.manager:
@@ -83,14 +244,14 @@ def create_task(
         db.flush()
         task_log = TaskLog(task_id=task.id, status=task.status, created_at=datetime.now())
         db.add(task_log)
+        record_task_change(db, None, task_snapshot(task))
         db.commit()
         db.refresh(task)
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
-    # Optional: invalidate Redis cache
-    # _invalidate_manager_cache(manager_uuid)
+    invalidate_task_lists(manager_uuid, assigned_uuid)
     resp={
         "message": "Task created successfully",
         "data": {
@@ -108,13 +269,119 @@ def create_task(
     return JSONResponse(status_code=201, content=resp)
 
 
+@manager_tasks_router.post("/batch")
+def create_task_batch(
+    manager_id: str = Path(...),
+    atomic: bool = Query(False, description="Create nothing if any item is invalid"),
+    items: list = Depends(bulk_items("tasks")),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """Create many tasks in one transaction from a JSON list or CSV
+    (title, description, assigned_to, due_date). Invalid items are reported
+    by index and skipped, unless `atomic=true`."""
+    manager_uuid = validate_uuid(manager_id)
+    if current_user.id != manager_uuid or current_user.role != UserRole.manager:
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    errors, valid = [], []
+    for index, item in enumerate(items):
+        try:
+            task = TaskCreate.model_validate(item)
+        except ValidationError as e:
+            errors.append({"index": index, "errors": item_errors(e)})
+            continue
+        if not task.description:
+            errors.append({"index": index, "errors": ["description: Field required"]})
+        elif task.assigned_to is None:
+            errors.append({"index": index, "errors": ["assigned_to: Field required"]})
+        else:
+            valid.append((index, task))
+
+    # every assignee checked in one query
+    wanted = {task.assigned_to for _, task in valid}
+    employees = set(db.scalars(select(User.id).where(
+        User.id.in_(wanted),
+        User.role == UserRole.employee,
+        User.created_by == manager_uuid,
+        User.is_active == True,
+    ))) if wanted else set()
+    accepted = []
+    for index, task in valid:
+        if task.assigned_to in employees:
+            accepted.append((index, task))
+        else:
+            errors.append({"index": index, "errors": ["assigned_to: Can only assign task to your employees"]})
+    errors.sort(key=lambda e: e["index"])
+
+    if errors and (atomic or not accepted):
+        raise HTTPException(status_code=400, detail={"message": "No tasks created", "errors": errors})
+
+    now = datetime.now()
+    rows = []
+    for _, task in accepted:
+        rows.append({
+            "title": task.title,
+            "description": task.description,
+            "status": TaskStatus.pending,
+            "assigned_to": task.assigned_to,
+            "start_date": now,
+            "due_date": task.due_date,
+            "created_by": manager_uuid,
+            "created_at": now,
+        })
+
+    try:
+        # one executemany each for tasks and their first log; RETURNING keeps the input order
+        created = db.execute(
+            insert(Task).returning(Task.id, Task.title, Task.status, Task.assigned_to, Task.due_date, sort_by_parameter_order=True),
+            rows,
+        ).all()
+        db.execute(insert(TaskLog), [{"task_id": t.id, "status": log.pending, "created_at": now} for t in created])
+        record_task_changes(db, [(None, (t.assigned_to, TaskStatus.pending, t.due_date)) for t in created])
+        db.commit()
+    except OperationalError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Database busy, try again")
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    invalidate_task_lists(manager_uuid, *{t.assigned_to for t in created})
+    resp = {
+        "message": f"{len(created)} tasks created" + (f", {len(errors)} skipped" if errors else ""),
+        "data": [
+            {"index": index, "uuid": t.id, "title": t.title, "status": t.status, "assigned_to": t.assigned_to, "due_date": t.due_date}
+            for (index, _), t in zip(accepted, created)
+        ],
+        "errors": errors,
+    }
+    return JSONResponse(status_code=201, content=resp)
+
+
+@manager_tasks_router.post("/transitions")
+def transition_manager_tasks(
+    manager_id: str = Path(...),
+    atomic: bool = Query(False, description="Update nothing if any item is invalid"),
+    items: list = Depends(bulk_items("transitions")),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """Change the status of many of the manager's tasks at once, from a JSON
+    list or CSV of (task_id, status)."""
+    manager_uuid = validate_uuid(manager_id)
+    if current_user.id != manager_uuid or current_user.role != UserRole.manager:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return _apply_transitions(db, items, Task.created_by == manager_uuid, manager_uuid, atomic)
+
+
 @manager_tasks_router.patch("/{task_id}")
 def update_task(
     manager_id: str = Path(...),
     task_id: str = Path(...),
     payload: dict = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     manager_uuid = validate_uuid(manager_id)
     task_uuid = validate_uuid(task_id)
@@ -135,6 +402,7 @@ def update_task(
     if task.status == TaskStatus.completed:
         raise HTTPException(status_code=400, detail="Completed task cannot be updated")
 
+    before = task_snapshot(task)
     if new_assigned:
         assigned_uuid = validate_uuid(new_assigned)
         if assigned_uuid != task.assigned_to:
@@ -170,6 +438,7 @@ def update_task(
         db.flush()
         task_log = TaskLog(task_id=task.id, status=log_status_map[task.status], created_at=datetime.now())
         db.add(task_log)
+        record_task_change(db, before, task_snapshot(task))
         db.commit()
         # db.refresh(task)
     except OperationalError:
@@ -179,7 +448,8 @@ def update_task(
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
-    # _invalidate_manager_cache(manager_uuid)
+    # a reassigned task leaves the old assignee's list too
+    invalidate_task_lists(manager_uuid, before[0], task.assigned_to)
 
     return JSONResponse(status_code=200, content={
         "message": "Task status updated successfully",
@@ -192,13 +462,15 @@ def update_task(
         }
     })
 
-@manager_tasks_router.get("")
 def list_manager_tasks(
+    request: Request,
     manager_id: str = Path(...),
     limit: int = Query(40, ge=1),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
+    fields: list = Depends(task_list_fields),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     manager_uuid = validate_uuid(manager_id)
 
@@ -208,26 +480,65 @@ def list_manager_tasks(
     if limit > 100:
         raise HTTPException(status_code=400, detail="limit exceeds maximum of 100")
 
-    tasks = db.query(Task).filter(Task.created_by == manager_uuid).order_by(Task.created_at.desc()).limit(limit).offset(offset).all()
-
-    data = [
-        {
-            "uuid": str(t.id),
-            "title": t.title,
-            "description": t.description,
-            "status": t.status.value,
-            "assigned_to": str(t.assigned_to),
-            "start_date": t.start_date.isoformat() if t.start_date else None,
-            "due_date": t.due_date.isoformat() if t.due_date else None,
-            "created_at": t.created_at.isoformat(),
-        }
-        for t in tasks
-    ]
+    scope = Task.created_by == manager_uuid
+    etag = request_etag(request, *db.execute(_task_list_version(scope)).one())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    def build():
+        pager = _task_pager(db, "manager-tasks", cursor, limit, offset)
+        page = pager.page(db.execute(pager.apply(_task_list_query(fields).where(scope))).all())
+        return _task_list_content(page.items, fields, page_response_fields(request, page))
+
+    # keyed by the ETag, so a cached body always belongs to the version it is sent with
+    content = get_cache().get_or_set(
+        cache_key("manager", manager_uuid, "tasks", etag.strip('"')),
+        build,
+        tags=[manager_tasks_tag(manager_uuid)],
+        namespace="manager:tasks",
+    )
+    return JSONResponse(status_code=200, content=content, headers=etag_headers(etag))
 
-    return JSONResponse(status_code=200, content={
-        "message": "Tasks fetched successfully",
-        "data": data
-    })
+
+async def list_manager_tasks_async(
+    request: Request,
+    manager_id: str = Path(...),
+    limit: int = Query(40, ge=1),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
+    fields: list = Depends(task_list_fields),
+    adb: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal_async),
+):
+    manager_uuid = validate_uuid(manager_id)
+
+    if current_user.id != manager_uuid or current_user.role != UserRole.manager:
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    if limit > 100:
+        raise HTTPException(status_code=400, detail="limit exceeds maximum of 100")
+
+    scope = Task.created_by == manager_uuid
+    etag = request_etag(request, *(await adb.execute(_task_list_version(scope))).one())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    async def build():
+        pager = _task_pager(adb, "manager-tasks", cursor, limit, offset)
+        result = await adb.execute(pager.apply(_task_list_query(fields).where(scope)))
+        page = pager.page(result.all())
+        return _task_list_content(page.items, fields, page_response_fields(request, page))
+
+    content = await get_cache().get_or_set_async(
+        cache_key("manager", manager_uuid, "tasks", etag.strip('"')),
+        build,
+        tags=[manager_tasks_tag(manager_uuid)],
+        namespace="manager:tasks",
+    )
+    return JSONResponse(status_code=200, content=content, headers=etag_headers(etag))
+
+
+manager_tasks_router.get("")(list_manager_tasks_async if settings.DB_ASYNC_READS else list_manager_tasks)
 
 
 @manager_tasks_router.get("/{task_id}", response_class=HTMLResponse)
@@ -249,17 +560,14 @@ def get_task(
 
     # Render a template for manager viewing a task
     # resolve assigned user display name
-    assigned_user = None
-    if task.assigned_to:
-        assigned_user = db.query(User).filter(User.id == task.assigned_to).first()
-    assigned_to_name = assigned_user.username if assigned_user else None
+    assigned_to_name = user_loader(db).prime(current_user).name(task.assigned_to)
     return templates.TemplateResponse("task_detail.html", {"request": request, "task": task, "assigned_to_name": assigned_to_name, "current_user": current_user})
 
 @manager_tasks_router.delete("/{task_id}")
 def delete_task(
     task_id: str = Path(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     task_uuid = validate_uuid(task_id)
 
@@ -271,14 +579,17 @@ def delete_task(
     if current_user.role != UserRole.manager and current_user.id != task.created_by:
         raise HTTPException(status_code=403, detail="Not authorized")
 
+    manager_uuid = task.created_by
     try:
+        before = task_snapshot(task)
         db.delete(task)
+        record_task_change(db, before, None)
         db.commit()
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
-    # _invalidate_manager_cache(manager_uuid)
+    invalidate_task_lists(manager_uuid, before[0])
 
     return JSONResponse(status_code=200, content={
         "message": "Task deleted successfully",
@@ -289,13 +600,31 @@ def delete_task(
 # -------- Employee's Task API -----------------
 
 
+@employee_tasks_router.post("/transitions")
+def transition_employee_tasks(
+    employee_id: str = Path(...),
+    atomic: bool = Query(False, description="Update nothing if any item is invalid"),
+    items: list = Depends(bulk_items("transitions")),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """Change the status of many of the employee's own tasks at once, from a
+    JSON list or CSV of (task_id, status)."""
+    employee_uuid = validate_uuid(employee_id)
+    if current_user.id != employee_uuid or current_user.role != UserRole.employee:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    manager_uuid = current_user.created_by
+    scope = (Task.assigned_to == employee_uuid) & (Task.created_by == manager_uuid)
+    return _apply_transitions(db, items, scope, manager_uuid, atomic)
+
+
 @employee_tasks_router.post("/{task_id}")
 def update_task(
     employee_id: str = Path(...),
     task_id: str = Path(...),
     status: str = Form(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     employee_uuid = validate_uuid(employee_id)
     task_uuid = validate_uuid(task_id)
@@ -306,8 +635,8 @@ def update_task(
     if status not in ["pending", "in-progress", "in progress", "completed"]:
         raise HTTPException(status_code=400, detail="Invalid status value")
 
-    employee = db.query(User).filter(User.id == employee_id, User.role == UserRole.employee).first()
-    manager_uuid = employee.created_by
+    # the employee's manager comes from the token claims; no user re-query needed
+    manager_uuid = current_user.created_by
     task = db.query(Task).filter(Task.id == task_uuid).with_for_update().first()
     if not task or task.created_by != manager_uuid:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -329,12 +658,14 @@ def update_task(
         "completed":TaskStatus.completed
     }
 
+    before = task_snapshot(task)
     task.status = status_map[status]
     try:
         db.add(task)
         db.flush()
         task_log = TaskLog(task_id=task.id, status=log_status_map[task.status], created_at=datetime.now())
         db.add(task_log)
+        record_task_change(db, before, task_snapshot(task))
         db.commit()
         # db.refresh(task)
     except OperationalError:
@@ -344,7 +675,7 @@ def update_task(
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
-    # _invalidate_manager_cache(manager_uuid)
+    invalidate_task_lists(manager_uuid, before[0])
 
     return RedirectResponse(url=f"/employee/dashboard", status_code=303)
 
@@ -367,19 +698,18 @@ def get_task(
         raise HTTPException(status_code=403, detail="Not authorized")
 
     # Render a template for employee viewing a task
-    assigned_user = None
-    if task.assigned_to:
-        assigned_user = db.query(User).filter(User.id == task.assigned_to).first()
-    assigned_to_name = assigned_user.username if assigned_user else None
+    assigned_to_name = user_loader(db).prime(current_user).name(task.assigned_to)
     return templates.TemplateResponse("task_detail.html", {"request": request, "task": task, "assigned_to_name": assigned_to_name, "current_user": current_user})
 
-@employee_tasks_router.get("")
 def list_employee_tasks(
+    request: Request,
     employee_id: str = Path(...),
     limit: int = Query(40, ge=1),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
+    fields: list = Depends(task_list_fields),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     employee_uuid = validate_uuid(employee_id)
 
@@ -389,26 +719,65 @@ def list_employee_tasks(
     if limit > 100:
         raise HTTPException(status_code=400, detail="limit exceeds maximum of 100")
 
-    tasks = db.query(Task).filter(Task.assigned_to == employee_uuid).order_by(Task.created_at.desc()).limit(limit).offset(offset).all()
-
-    data = [
-        {
-            "uuid": str(t.id),
-            "title": t.title,
-            "description": t.description,
-            "status": t.status.value,
-            "assigned_to": str(t.assigned_to),
-            "start_date": t.start_date.isoformat() if t.start_date else None,
-            "due_date": t.due_date.isoformat() if t.due_date else None,
-            "created_at": t.created_at.isoformat(),
-        }
-        for t in tasks
-    ]
+    scope = Task.assigned_to == employee_uuid
+    etag = request_etag(request, *db.execute(_task_list_version(scope)).one())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    def build():
+        pager = _task_pager(db, "employee-tasks", cursor, limit, offset)
+        page = pager.page(db.execute(pager.apply(_task_list_query(fields).where(scope))).all())
+        return _task_list_content(page.items, fields, page_response_fields(request, page))
+
+    # keyed by the ETag, so a cached body always belongs to the version it is sent with
+    content = get_cache().get_or_set(
+        cache_key("employee", employee_uuid, "tasks", etag.strip('"')),
+        build,
+        tags=[employee_tasks_tag(employee_uuid)],
+        namespace="employee:tasks",
+    )
+    return JSONResponse(status_code=200, content=content, headers=etag_headers(etag))
 
-    return JSONResponse(status_code=200, content={
-        "message": "Tasks fetched successfully",
-        "data": data
-    })
+
+async def list_employee_tasks_async(
+    request: Request,
+    employee_id: str = Path(...),
+    limit: int = Query(40, ge=1),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
+    fields: list = Depends(task_list_fields),
+    adb: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal_async),
+):
+    employee_uuid = validate_uuid(employee_id)
+
+    if current_user.id != employee_uuid or current_user.role != UserRole.employee:
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    if limit > 100:
+        raise HTTPException(status_code=400, detail="limit exceeds maximum of 100")
+
+    scope = Task.assigned_to == employee_uuid
+    etag = request_etag(request, *(await adb.execute(_task_list_version(scope))).one())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    async def build():
+        pager = _task_pager(adb, "employee-tasks", cursor, limit, offset)
+        result = await adb.execute(pager.apply(_task_list_query(fields).where(scope)))
+        page = pager.page(result.all())
+        return _task_list_content(page.items, fields, page_response_fields(request, page))
+
+    content = await get_cache().get_or_set_async(
+        cache_key("employee", employee_uuid, "tasks", etag.strip('"')),
+        build,
+        tags=[employee_tasks_tag(employee_uuid)],
+        namespace="employee:tasks",
+    )
+    return JSONResponse(status_code=200, content=content, headers=etag_headers(etag))
+
+
+employee_tasks_router.get("")(list_employee_tasks_async if settings.DB_ASYNC_READS else list_employee_tasks)
 
 @employee_tasks_router.get("/{task_id}/edit", response_class=HTMLResponse)
 def edit_task(
@@ -25,6 +25,14 @@ class UserCreate(UserBase):
     password: Annotated[str, Field(min_length=6, max_length=128, strip_whitespace=True)]  # incoming plain password
 
 
+# one row of a bulk employee import
+class EmployeeImport(BaseModel):
+    username: Annotated[str, Field(strip_whitespace=True, min_length=3, max_length=150)]
+    email: Annotated[EmailStr, Field(min_length=5, max_length=255, strip_whitespace=True)]
+    full_name: Optional[Annotated[str, Field(max_length=255)]] = None
+    password: Annotated[str, Field(min_length=6, max_length=128, strip_whitespace=True)]
+
+
 # ---------- Update ----------
 class UserUpdate(BaseModel):
     username: Optional[Annotated[str, Field(strip_whitespace=True, min_length=3, max_length=150)]] = None
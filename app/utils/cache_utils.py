@@ -0,0 +1,529 @@
+"""Read-through cache for JSON payloads, with tag-based invalidation.
+
+    cache = get_cache()
+    content = cache.get_or_set(
+        request_cache_key(request, "manager", manager_uuid, "employees"),
+        lambda: build_payload(),
+        tags=[manager_employees_tag(manager_uuid)],
+        namespace="manager:employees",
+    )
+
+Keys are namespaced strings (`manager:{id}:employees:<query hash>`). Values
+may hold anything the JSON responses serialize (UUIDs, dates, enums); they
+are stored encoded and come back as plain JSON types, so a caller can never
+mutate a cached value in place.
+
+Invalidation is by tag rather than by key: every tag has a random version
+token, each entry records the tokens of its tags when it was built, and
+`invalidate(tag)` just replaces the tag's token. Entries built before the
+invalidation then no longer match and are rebuilt on their next read. This
+also covers a write that commits while an entry is being built, because the
+tokens are read before the build starts. `tags` may be a callable taking the
+built value, for entries whose tags depend on what they contain.
+
+Concurrent misses on the same key are coalesced: one caller builds and the
+others in this process wait for its result. With a shared backend a short
+`lock:` key does the same across workers; waiters poll until the value shows
+up or CACHE_LOCK_TIMEOUT_SECONDS passes, then build it themselves.
+
+Backends: "memory" (per-process LRU + TTL; another worker's writes only
+reach it via the TTL), "redis" (REDIS_URL, shared) and "none". A failing
+backend is logged and treated as a miss; it never fails the request.
+"""
+import asyncio
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from typing import Callable, Iterable, Optional, Protocol, Union
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.responses import json_dumps, json_loads
+
+import logging
+logger = logging.getLogger(__name__)
+
+_MISS = object()
+
+
+class CacheBackend(Protocol):
+    shared: bool  # True when several processes see the same data
+
+    def get_many(self, keys: list) -> list:
+        """Raw values for `keys`, None where missing or expired."""
+
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        """Store `value`; `ttl=None` means no expiry."""
+
+    def add(self, key: str, value: bytes, ttl: Optional[float]) -> bool:
+        """Store `value` only if `key` is absent; return whether it was stored."""
+
+    def delete(self, key: str) -> None:
+        ...
+
+
+class MemoryBackend:
+    """Per-process LRU with a TTL per entry."""
+
+    shared = False
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[Optional[float], bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str, now: float):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at < now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: bytes, ttl: Optional[float], now: float) -> None:
+        self._entries[key] = (now + ttl if ttl is not None else None, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_many(self, keys: list) -> list:
+        now = time.monotonic()
+        with self._lock:
+            return [self._get(k, now) for k in keys]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        with self._lock:
+            self._set(key, value, ttl, time.monotonic())
+
+    def add(self, key: str, value: bytes, ttl: Optional[float]) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if self._get(key, now) is not None:
+                return False
+            self._set(key, value, ttl, now)
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """Shared backend over the Redis protocol (Redis, Valkey, KeyDB, ...)."""
+
+    shared = True
+
+    def __init__(self, url: str, prefix: str):
+        import redis  # optional dependency, only needed for CACHE_BACKEND=redis
+        self._client = redis.from_url(url, socket_timeout=1)
+        self.prefix = prefix
+
+    def get_many(self, keys: list) -> list:
+        return self._client.mget([self.prefix + k for k in keys])
+
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        self._client.set(self.prefix + key, value, px=int(ttl * 1000) if ttl is not None else None)
+
+    def add(self, key: str, value: bytes, ttl: Optional[float]) -> bool:
+        return bool(self._client.set(self.prefix + key, value, nx=True, px=int(ttl * 1000) if ttl is not None else None))
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self.prefix + key)
+
+
+class NullBackend:
+    """Caching switched off: nothing is stored, every read is a miss."""
+
+    shared = False
+
+    def get_many(self, keys: list) -> list:
+        return [None] * len(keys)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        pass
+
+    def add(self, key: str, value: bytes, ttl: Optional[float]) -> bool:
+        return True
+
+    def delete(self, key: str) -> None:
+        pass
+
+
+class CacheMetrics:
+    """Per-namespace counters, reported by GET /admin/cache/stats."""
+
+    FIELDS = ("hits", "misses", "stale", "coalesced", "builds", "errors")
+
+    def __init__(self):
+        self._counts = defaultdict(lambda: dict.fromkeys(self.FIELDS, 0))
+        self._lock = threading.Lock()
+
+    def incr(self, namespace: str, field: str) -> None:
+        with self._lock:
+            self._counts[namespace][field] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = {ns: dict(c) for ns, c in self._counts.items()}
+        for c in counts.values():
+            reads = c["hits"] + c["misses"]
+            c["hit_ratio"] = round(c["hits"] / reads, 4) if reads else None
+        return counts
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = _MISS
+
+
+def _tag_key(tag: str) -> str:
+    return f"tag:{tag}"
+
+
+def _decode(raw) -> str:
+    return raw.decode() if isinstance(raw, bytes) else raw
+
+
+class Cache:
+    def __init__(self, backend: CacheBackend, default_ttl: float, lock_timeout: float):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.lock_timeout = lock_timeout
+        self.metrics = CacheMetrics()
+        self._flights: dict = {}
+        self._flights_lock = threading.Lock()
+        self._async_flights: dict = {}
+
+    # ---------- backend steps (sync; the async path runs them in the threadpool for shared backends) ----------
+    def _lookup(self, key: str, namespace: str):
+        try:
+            raw = self.backend.get_many([key])[0]
+            if raw is None:
+                return _MISS
+            entry = json_loads(raw)
+            tags = list(entry["t"])
+            if tags:
+                current = self.backend.get_many([_tag_key(t) for t in tags])
+                if any(_decode(c) != entry["t"][t] for t, c in zip(tags, current)):
+                    self.metrics.incr(namespace, "stale")
+                    return _MISS
+            return entry["v"]
+        except Exception:
+            self.metrics.incr(namespace, "errors")
+            logger.warning("Cache read failed for %s", key, exc_info=True)
+            return _MISS
+
+    def _tag_tokens(self, tags: list) -> dict:
+        keys = [_tag_key(t) for t in tags]
+        tokens = {}
+        for tag, key, raw in zip(tags, keys, self.backend.get_many(keys)):
+            if raw is None:
+                # a tag seen for the first time gets a token now, so entries never match a missing one
+                token = uuid.uuid4().hex
+                if not self.backend.add(key, token.encode(), None):
+                    token = _decode(self.backend.get_many([key])[0]) or token
+                tokens[tag] = token
+            else:
+                tokens[tag] = _decode(raw)
+        return tokens
+
+    def _snapshot(self, tags, namespace: str):
+        if callable(tags):
+            return None
+        try:
+            return self._tag_tokens(list(tags))
+        except Exception:
+            self.metrics.incr(namespace, "errors")
+            logger.warning("Cache tag read failed", exc_info=True)
+            return None
+
+    def _store(self, key: str, value, tags, tokens: Optional[dict], ttl: Optional[float], namespace: str) -> None:
+        try:
+            if tokens is None:
+                tokens = self._tag_tokens(list(tags(value) if callable(tags) else tags))
+            entry = json_dumps({"t": tokens, "v": value})
+            self.backend.set(key, entry, ttl if ttl is not None else self.default_ttl)
+        except Exception:
+            self.metrics.incr(namespace, "errors")
+            logger.warning("Cache write failed for %s", key, exc_info=True)
+
+    def _acquire(self, key: str) -> bool:
+        # cross-process build lock; only meaningful for a shared backend
+        if not self.backend.shared:
+            return True
+        try:
+            return self.backend.add(f"lock:{key}", b"1", self.lock_timeout)
+        except Exception:
+            return True
+
+    def _release(self, key: str) -> None:
+        if self.backend.shared:
+            try:
+                self.backend.delete(f"lock:{key}")
+            except Exception:
+                pass
+
+    # ---------- public API ----------
+    def get_or_set(self, key: str, build: Callable[[], object], *, tags: Union[Iterable[str], Callable] = (),
+                   ttl: Optional[float] = None, namespace: Optional[str] = None):
+        namespace = namespace or key.split(":", 1)[0]
+        value = self._lookup(key, namespace)
+        if value is not _MISS:
+            self.metrics.incr(namespace, "hits")
+            return value
+        self.metrics.incr(namespace, "misses")
+
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            self.metrics.incr(namespace, "coalesced")
+            if flight.done.wait(self.lock_timeout) and flight.value is not _MISS:
+                return flight.value
+            return build()
+
+        try:
+            tokens = self._snapshot(tags, namespace)
+            acquired = self._acquire(key)
+            if not acquired:
+                # another worker is building it; wait for its result
+                self.metrics.incr(namespace, "coalesced")
+                deadline = time.monotonic() + self.lock_timeout
+                while time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    value = self._lookup(key, namespace)
+                    if value is not _MISS:
+                        flight.value = value
+                        return value
+            try:
+                self.metrics.incr(namespace, "builds")
+                value = build()
+                self._store(key, value, tags, tokens, ttl, namespace)
+            finally:
+                if acquired:
+                    self._release(key)
+            flight.value = value
+            return value
+        finally:
+            with self._flights_lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    async def get_or_set_async(self, key: str, build, *, tags: Union[Iterable[str], Callable] = (),
+                               ttl: Optional[float] = None, namespace: Optional[str] = None):
+        """`get_or_set` for async routes; `build` is a coroutine function."""
+        namespace = namespace or key.split(":", 1)[0]
+        value = await self._call(self._lookup, key, namespace)
+        if value is not _MISS:
+            self.metrics.incr(namespace, "hits")
+            return value
+        self.metrics.incr(namespace, "misses")
+
+        future = self._async_flights.get(key)
+        if future is not None:
+            self.metrics.incr(namespace, "coalesced")
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), self.lock_timeout)
+            except Exception:
+                return await build()
+
+        future = self._async_flights[key] = asyncio.get_running_loop().create_future()
+        try:
+            tokens = await self._call(self._snapshot, tags, namespace)
+            acquired = await self._call(self._acquire, key)
+            if not acquired:
+                self.metrics.incr(namespace, "coalesced")
+                deadline = time.monotonic() + self.lock_timeout
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(0.05)
+                    value = await self._call(self._lookup, key, namespace)
+                    if value is not _MISS:
+                        future.set_result(value)
+                        return value
+            try:
+                self.metrics.incr(namespace, "builds")
+                value = await build()
+                await self._call(self._store, key, value, tags, tokens, ttl, namespace)
+            finally:
+                if acquired:
+                    await self._call(self._release, key)
+            future.set_result(value)
+            return value
+        except BaseException as exc:
+            if not future.done():
+                future.set_exception(exc)
+                future.exception()  # retrieved here so an unawaited failure is not logged
+            raise
+        finally:
+            self._async_flights.pop(key, None)
+
+    def lookup(self, key: str, *, namespace: Optional[str] = None):
+        """The cached value, or None on a miss. For callers that build and store in separate steps."""
+        namespace = namespace or key.split(":", 1)[0]
+        value = self._lookup(key, namespace)
+        if value is _MISS:
+            self.metrics.incr(namespace, "misses")
+            return None
+        self.metrics.incr(namespace, "hits")
+        return value
+
+    def version(self, tags: Iterable[str], *, namespace: Optional[str] = None) -> Optional[dict]:
+        """Current tokens of `tags`; read before the data a later `store` is built from."""
+        return self._snapshot(list(tags), namespace or "version")
+
+    def store(self, key: str, value, *, tags: Iterable[str] = (), version: Optional[dict] = None,
+              ttl: Optional[float] = None, namespace: Optional[str] = None) -> None:
+        """Write `value` under the tag tokens in `version`; tags not in it get their current token."""
+        namespace = namespace or key.split(":", 1)[0]
+        tags = list(tags)
+        tokens = dict(version or {})
+        missing = [t for t in tags if t not in tokens]
+        if missing:
+            extra = self._snapshot(missing, namespace)
+            if extra is None:
+                return
+            tokens.update(extra)
+        self.metrics.incr(namespace, "builds")
+        self._store(key, value, tags, tokens, ttl, namespace)
+
+    async def _call(self, fn, *args):
+        # a network backend must not block the event loop
+        if self.backend.shared:
+            return await run_in_threadpool(fn, *args)
+        return fn(*args)
+
+    def invalidate(self, *tags: str) -> None:
+        """Mark every entry carrying any of `tags` as stale. Call after commit."""
+        for tag in tags:
+            try:
+                self.backend.set(_tag_key(tag), uuid.uuid4().hex.encode(), None)
+            except Exception:
+                # don't crash the request if cache invalidation fails; entries still expire by TTL
+                logger.warning("Cache invalidation failed for %s", tag, exc_info=True)
+
+    def delete(self, key: str) -> None:
+        try:
+            self.backend.delete(key)
+        except Exception:
+            logger.warning("Cache delete failed for %s", key, exc_info=True)
+
+    def stats(self) -> dict:
+        return {
+            "backend": type(self.backend).__name__,
+            "default_ttl_seconds": self.default_ttl,
+            "namespaces": self.metrics.snapshot(),
+        }
+
+
+_cache: Optional[Cache] = None
+_cache_lock = threading.Lock()
+
+
+def _make_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == "none":
+        return NullBackend()
+    if settings.CACHE_BACKEND == "redis":
+        try:
+            return RedisBackend(settings.REDIS_URL, settings.CACHE_KEY_PREFIX)
+        except Exception:
+            logger.exception("Redis cache backend unavailable, falling back to in-memory cache")
+    return MemoryBackend(settings.CACHE_MAX_ENTRIES)
+
+
+def get_cache() -> Cache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = Cache(_make_backend(), settings.CACHE_DEFAULT_TTL_SECONDS, settings.CACHE_LOCK_TIMEOUT_SECONDS)
+    return _cache
+
+
+def set_cache(cache: Cache) -> None:
+    """Swap the cache (e.g. a differently configured backend at startup)."""
+    global _cache
+    _cache = cache
+
+
+# ---------- Keys and tags ----------
+def cache_key(*parts) -> str:
+    return ":".join(str(p) for p in parts)
+
+
+def request_cache_key(request, *parts) -> str:
+    """`cache_key(*parts)` plus a digest of the request's query string and base URL.
+
+    The base URL is included because list payloads carry absolute page links.
+    """
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(f"{request.base_url}?{query}".encode()).hexdigest()[:16]
+    return cache_key(*parts, digest)
+
+
+def manager_employees_tag(manager_id) -> str:
+    return cache_key("manager", manager_id, "employees")
+
+
+def admin_managers_tag(admin_id) -> str:
+    return cache_key("admin", admin_id, "managers")
+
+
+def manager_tasks_tag(manager_id) -> str:
+    return cache_key("manager", manager_id, "tasks")
+
+
+def employee_tasks_tag(employee_id) -> str:
+    return cache_key("employee", employee_id, "tasks")
+
+
+def employee_time_logs_tag(employee_id) -> str:
+    return cache_key("employee", employee_id, "time_logs")
+
+
+def manager_profile_tag(manager_id) -> str:
+    return cache_key("manager", manager_id, "profile")
+
+
+def invalidate_manager_cache(manager_id) -> None:
+    """A manager's employee list changed (employee added, edited, (de)activated)."""
+    get_cache().invalidate(manager_employees_tag(manager_id))
+
+
+def invalidate_admin_cache(admin_id) -> None:
+    """An admin's manager list changed (manager added, edited, (de)activated)."""
+    get_cache().invalidate(admin_managers_tag(admin_id))
+
+
+def invalidate_task_lists(manager_id=None, *employee_ids) -> None:
+    """Tasks created by `manager_id` and/or assigned to `employee_ids` changed."""
+    tags = [employee_tasks_tag(e) for e in employee_ids if e is not None]
+    if manager_id is not None:
+        tags.append(manager_tasks_tag(manager_id))
+    get_cache().invalidate(*tags)
+
+
+def invalidate_manager_profile(manager_id) -> None:
+    """A manager's username or name changed (shown on their employees' dashboards)."""
+    get_cache().invalidate(manager_profile_tag(manager_id))
+
+
+def invalidate_time_logs(employee_id) -> None:
+    """An employee's time logs changed (logged, edited, deleted)."""
+    get_cache().invalidate(employee_time_logs_tag(employee_id))
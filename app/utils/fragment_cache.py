@@ -0,0 +1,116 @@
+"""Cached HTML fragments for the dashboards.
+
+A view declares the page's widgets and the cache tags each one depends on,
+loads whatever is still cached, and only queries for the stale ones:
+
+    fragments = Fragments("manager/dashboard", manager_id)
+    fragments.add("tasks", manager_tasks_tag(manager_id)).load()
+    tasks = _dashboard_tasks(db, manager_id) if fragments.stale("tasks") else None
+    return templates.TemplateResponse("manager/dashboard.html",
+                                      {"request": request, "fragments": fragments, "tasks": tasks},
+                                      background=BackgroundTask(fragments.save))
+
+and the template wraps each widget in a `cache` block:
+
+    {% cache "tasks" %} ... {% endcache %}
+
+A cached block is emitted as-is and its body (and the variables it uses) are
+never touched; a stale one renders normally and is written back by `save`
+after the response has been sent. Without `fragments` in the context, or for
+a name that was not added, the block just renders.
+
+Entries are keyed per page, owner and widget. Their version is the tokens of
+their tags (see cache_utils), read in `load` before any data is queried, so a
+write that commits while a widget is being rendered leaves it stale. Tags
+only known once the data is loaded (e.g. the admin's manager ids) can be
+attached with `tag`; those are versioned at `save` time.
+"""
+from typing import Optional
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.utils.cache_utils import cache_key, get_cache
+
+
+class Fragments:
+    def __init__(self, page: str, owner_id):
+        self.page = page
+        self.owner_id = owner_id
+        self._tags: dict = {}
+        self._versions: dict = {}
+        self._cached: dict = {}
+        self._rendered: dict = {}
+
+    def add(self, name: str, *tags: str) -> "Fragments":
+        self._tags[name] = list(tags)
+        return self
+
+    def tag(self, name: str, *tags: str) -> None:
+        """Attach tags discovered while building `name`'s data."""
+        self._tags[name].extend(t for t in tags if t not in self._tags[name])
+
+    def _key(self, name: str) -> str:
+        return cache_key("fragment", self.page, self.owner_id, name)
+
+    def _namespace(self, name: str) -> str:
+        return cache_key("fragment", self.page, name)
+
+    def load(self) -> "Fragments":
+        cache = get_cache()
+        for name, tags in self._tags.items():
+            html = cache.lookup(self._key(name), namespace=self._namespace(name))
+            if html is not None:
+                self._cached[name] = html
+            else:
+                self._versions[name] = cache.version(tags, namespace=self._namespace(name))
+        return self
+
+    async def load_async(self) -> "Fragments":
+        # a network backend must not block the event loop
+        if get_cache().backend.shared:
+            return await run_in_threadpool(self.load)
+        return self.load()
+
+    def stale(self, name: str) -> bool:
+        return name not in self._cached
+
+    def render(self, name: str, caller) -> Markup:
+        html = self._cached.get(name)
+        if html is not None:
+            return Markup(html)
+        html = caller()
+        if name in self._tags:
+            self._rendered[name] = str(html)
+        return html
+
+    def save(self, ttl: Optional[float] = None) -> None:
+        """Write back the fragments rendered on this request; run after the response."""
+        cache = get_cache()
+        ttl = ttl if ttl is not None else settings.FRAGMENT_CACHE_TTL_SECONDS
+        for name, html in self._rendered.items():
+            cache.store(self._key(name), html, tags=self._tags[name], version=self._versions.get(name),
+                        ttl=ttl, namespace=self._namespace(name))
+        self._rendered.clear()
+
+
+class FragmentCacheExtension(Extension):
+    """`{% cache "name" %}...{% endcache %}`, backed by the context's `fragments`."""
+
+    tags = {"cache"}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        name = parser.parse_expression()
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        call = self.call_method("_render", [name, nodes.ContextReference()])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render(self, name, context, caller):
+        fragments = context.get("fragments")
+        if fragments is None:
+            return caller()
+        return fragments.render(name, caller)
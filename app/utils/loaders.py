@@ -0,0 +1,73 @@
+"""Request-scoped batch loading of users by id.
+
+Pages that show names for a list of rows (assignee, creator, ...) used to
+run one `User` lookup per row. Instead, collect the ids first and resolve
+them together:
+
+    users = user_loader(db)
+    users.prime(current_user)
+    users.want(*(t.assigned_to for t in tasks))
+    for t in tasks:
+        name = users.name(t.assigned_to)
+
+`want()` only queues ids; the first `get()`/`name()` after it loads every
+queued id in a single `IN` query. The loader lives in `db.info`, so it is
+shared by everything that uses the same session during a request
+(including the sync session behind `AsyncSession.run_sync`).
+"""
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+
+
+class UserLoader:
+    def __init__(self, db: Session):
+        self.db = db
+        self._users = {}
+        self._pending = set()
+
+    def prime(self, *users: User) -> "UserLoader":
+        """Register users that are already loaded (e.g. the current user)."""
+        for user in users:
+            if user is not None:
+                self._users[user.id] = user
+                self._pending.discard(user.id)
+        return self
+
+    def want(self, *user_ids) -> "UserLoader":
+        """Queue ids for the next batch; None and known ids are ignored."""
+        self._pending.update(uid for uid in user_ids if uid is not None and uid not in self._users)
+        return self
+
+    def load(self) -> None:
+        if not self._pending:
+            return
+        ids = list(self._pending)
+        self._pending.clear()
+        for user in self.db.query(User).filter(User.id.in_(ids)).all():
+            self._users[user.id] = user
+        # remember misses so a deleted user is not queried again
+        for uid in ids:
+            self._users.setdefault(uid, None)
+
+    def get(self, user_id) -> Optional[User]:
+        if user_id is None:
+            return None
+        if user_id not in self._users:
+            self._pending.add(user_id)
+        self.load()
+        return self._users.get(user_id)
+
+    def name(self, user_id, default=None) -> Optional[str]:
+        user = self.get(user_id)
+        return user.username if user is not None else default
+
+
+def user_loader(db: Session) -> UserLoader:
+    """The loader for this session (one per request via get_db)."""
+    loader = db.info.get("user_loader")
+    if loader is None:
+        loader = db.info["user_loader"] = UserLoader(db)
+    return loader
@@ -0,0 +1,115 @@
+"""Bulk employee onboarding, shared by `POST /manager/{id}/employees/import`
+and `python script.py import-employees`.
+
+    accepted, errors = validate_employees(db, items)
+    created = create_employees(db, manager_id, accepted, progress=report)
+    db.commit()
+
+Items are dicts with username, email, password and optional full_name (a
+JSON list or CSV rows). Rows are validated first, then every username and
+email is checked against the users table in one query, the passwords of
+the rows left are hashed across a process pool (`hash_passwords`), and the
+users are written with one executemany. Rows that fail a check are
+returned as `{"index", "errors"}` and skipped; the caller commits and
+invalidates the manager's caches.
+
+Hashing can take minutes, so the endpoint ends the validation transaction
+before it (the unique constraints catch anything that races in between)
+and holds `import_slot()` while hashing: each import already uses every
+core, so a second one in the same process is turned away with 503.
+"""
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.security import hash_passwords
+from app.models.user import User, UserRole
+from app.schemas.user import EmployeeImport
+from app.utils.request_utils import item_errors
+
+
+_import_lock = threading.Lock()
+
+
+@contextmanager
+def import_slot():
+    """This process's single bulk-import slot; 503 when another import holds it."""
+    if not _import_lock.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Another employee import is running, try again shortly",
+            headers={"Retry-After": "5"},
+        )
+    try:
+        yield
+    finally:
+        _import_lock.release()
+
+
+def validate_employees(db: Session, items: list) -> tuple[list, list]:
+    """`([(index, EmployeeImport)], errors)` for rows that can be created as they are."""
+    errors, valid = [], []
+    usernames, emails = {}, {}
+    for index, item in enumerate(items):
+        try:
+            employee = EmployeeImport.model_validate(item)
+        except ValidationError as e:
+            errors.append({"index": index, "errors": item_errors(e)})
+            continue
+        username, email = employee.username.lower(), employee.email.lower()
+        if username in usernames or email in emails:
+            errors.append({"index": index, "errors": ["Username or email given more than once"]})
+            continue
+        usernames[username] = emails[email] = index
+        valid.append((index, employee))
+
+    # every username and email checked in one query
+    taken = set()
+    if valid:
+        for username, email in db.execute(
+            select(func.lower(User.username), func.lower(User.email)).where(or_(
+                func.lower(User.username).in_(usernames),
+                func.lower(User.email).in_(emails),
+            ))
+        ):
+            taken.update((usernames.get(username), emails.get(email)))
+    accepted = []
+    for index, employee in valid:
+        if index in taken:
+            errors.append({"index": index, "errors": ["Email or username already exists"]})
+        else:
+            accepted.append((index, employee))
+    errors.sort(key=lambda e: e["index"])
+    return accepted, errors
+
+
+def create_employees(db: Session, manager_id, accepted: list, workers: Optional[int] = None, progress=None) -> list:
+    """Hash and insert validated rows; returns the created users as rows, in input order. Caller commits."""
+    if not accepted:
+        return []
+    hashes = hash_passwords([employee.password for _, employee in accepted], workers=workers, progress=progress)
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "username": employee.username,
+            "email": employee.email.lower(),
+            "full_name": employee.full_name.strip() if employee.full_name else None,
+            "role": UserRole.employee,
+            "password_hash": password_hash,
+            "is_active": True,
+            "created_by": manager_id,
+            "created_at": now,
+        }
+        for (_, employee), password_hash in zip(accepted, hashes)
+    ]
+    return db.execute(
+        insert(User).returning(User.id, User.username, User.email, User.full_name, sort_by_parameter_order=True),
+        rows,
+    ).all()
+
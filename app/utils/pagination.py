@@ -1,9 +1,207 @@
-from fastapi import Query, HTTPException, status
+"""Pagination helpers.
+
+`get_pagination_params` is the original skip/limit dependency.
+
+`KeysetPager` pages by key instead of by offset: rows are ordered on one or
+more sort columns plus a unique tie-breaker (e.g. `(created_at, id)` or
+`(username, id)`), and the next page starts strictly after the last row
+returned. Deep pages cost the same as the first, and rows inserted while a
+client is paging do not shift it into skipping or repeating rows.
+
+    pager = KeysetPager(db, [Task.created_at, Task.id], direction="desc",
+                        cursor=cursor, limit=limit, offset=offset, scope="manager-tasks")
+    rows = db.execute(pager.apply(select(Task).where(...))).all()
+    page = pager.page(rows)   # page.items, page.next_cursor, page.prev_cursor
+
+Cursors are opaque: the boundary row's key values as JSON, base64url
+encoded and signed with an HMAC of JWT_SECRET_KEY, so a client can pass
+them back but not forge or edit them. A cursor only works with the scope
+and direction that issued it. Without a cursor, `offset` is still applied,
+so existing skip/offset clients keep working and also get cursors back.
+"""
+import base64
+import hashlib
+import hmac
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Query, HTTPException, Request, status
+from sqlalchemy import Date, DateTime, String, and_, asc, desc, or_, type_coerce
+
+from app.core.config import settings
 
 def get_pagination_params(
-    skip: int = Query(0, ge=0), 
+    skip: int = Query(0, ge=0),
     limit: int = Query(40, ge=1, le=100)
 ):
     if limit > 100:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Limit cannot exceed 100")
-    return {"skip": skip, "limit": limit}
\ No newline at end of file
+    return {"skip": skip, "limit": limit}
+
+
+# ---------- Signed cursors ----------
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(body: str) -> str:
+    digest = hmac.new(settings.JWT_SECRET_KEY.encode(), body.encode(), hashlib.sha256).digest()
+    return _b64encode(digest[:16])
+
+
+def _dump_value(value):
+    # tag typed values so they decode back to what the column compares against
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, UUID):
+        return ["u", str(value)]
+    return ["v", value]
+
+
+def _load_value(tagged):
+    tag, value = tagged
+    if tag == "dt":
+        return datetime.fromisoformat(value)
+    if tag == "d":
+        return date.fromisoformat(value)
+    if tag == "u":
+        return UUID(value)
+    return value
+
+
+def encode_cursor(payload: list) -> str:
+    body = _b64encode(json.dumps(payload, separators=(",", ":")).encode())
+    return f"{body}.{_sign(body)}"
+
+
+def decode_cursor(cursor: str) -> list:
+    body, _, signature = cursor.partition(".")
+    if not signature or not hmac.compare_digest(signature, _sign(body)):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    try:
+        payload = json.loads(_b64decode(body))
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    if not isinstance(payload, list):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return payload
+
+
+# ---------- Keyset pagination ----------
+def keyset_column(dialect_name: str, column):
+    """The expression to order and compare a key column on.
+
+    SQLite keeps timestamps as text, in a different format for server
+    defaults than for Python-supplied values; comparing the stored text
+    keeps keyset bounds consistent with the ORDER BY.
+    """
+    if dialect_name == "sqlite" and isinstance(column.type, (DateTime, Date)):
+        return type_coerce(column, String)
+    return column
+
+
+@dataclass
+class KeysetPage:
+    items: list
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+class KeysetPager:
+    """Keyset pagination over `keys` (sort columns, unique column last)."""
+
+    def __init__(self, db, keys: list, direction: str = "desc", cursor: Optional[str] = None,
+                 limit: int = 40, offset: int = 0, scope: str = ""):
+        if direction not in ("asc", "desc"):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="direction must be asc or desc")
+        dialect_name = db.get_bind().dialect.name
+        self.keys = [keyset_column(dialect_name, k) for k in keys]
+        self.direction = direction
+        self.limit = limit
+        self.offset = offset
+        self.scope = scope
+        self.backwards = False
+        self.after = None
+        if cursor:
+            payload = decode_cursor(cursor)
+            try:
+                cur_scope, cur_direction, way, values = payload
+                values = [_load_value(v) for v in values]
+            except (ValueError, TypeError):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+            if (cur_scope, cur_direction) != (scope, direction) or len(values) != len(keys) or way not in ("next", "prev"):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor does not match this list")
+            self.backwards = way == "prev"
+            self.after = values
+
+    def _seek(self, values, descending: bool):
+        # (k1, k2, ...) past (v1, v2, ...) in the scan order, spelled out so any backend can use the index
+        clauses = []
+        for i, (key, value) in enumerate(zip(self.keys, values)):
+            bound = key < value if descending else key > value
+            clauses.append(and_(*[k == v for k, v in zip(self.keys[:i], values[:i])], bound))
+        # the redundant bound on the leading key gives the planner an index range to seek to
+        first, value = self.keys[0], values[0]
+        return and_(first <= value if descending else first >= value, or_(*clauses))
+
+    def apply(self, stmt):
+        """Add key columns, the seek condition, ordering and limit to a Select or Query."""
+        self._width = len(stmt.column_descriptions)
+        stmt = stmt.add_columns(*[k.label(f"_keyset_{i}") for i, k in enumerate(self.keys)])
+        # a "prev" page is read in reverse from its cursor and flipped back afterwards
+        descending = (self.direction == "desc") != self.backwards
+        if self.after is not None:
+            stmt = stmt.where(self._seek(self.after, descending))
+        order = desc if descending else asc
+        stmt = stmt.order_by(*[order(k) for k in self.keys]).limit(self.limit + 1)
+        if self.after is None and self.offset:
+            stmt = stmt.offset(self.offset)
+        return stmt
+
+    def _cursor(self, way: str, row) -> str:
+        values = [_dump_value(v) for v in row[self._width:]]
+        return encode_cursor([self.scope, self.direction, way, values])
+
+    def page(self, rows) -> KeysetPage:
+        """Split fetched rows into items and the cursors either side of them."""
+        rows = list(rows)
+        more = len(rows) > self.limit
+        rows = rows[:self.limit]
+        if self.backwards:
+            rows.reverse()
+        items = [row[0] if self._width == 1 else tuple(row[:self._width]) for row in rows]
+        if not rows:
+            return KeysetPage(items=[])
+
+        # going forward there is a previous page whenever we did not start at the top;
+        # going backwards there is always a next page (the one we came from)
+        has_next = more if not self.backwards else True
+        has_prev = (self.after is not None or bool(self.offset)) if not self.backwards else more
+        return KeysetPage(
+            items=items,
+            next_cursor=self._cursor("next", rows[-1]) if has_next else None,
+            prev_cursor=self._cursor("prev", rows[0]) if has_prev else None,
+        )
+
+
+def page_links(request: Request, page: KeysetPage) -> dict:
+    """Absolute next/prev URLs: the current URL with `cursor` swapped and `offset` dropped."""
+    base = request.url.remove_query_params(["cursor", "offset", "skip"])
+    return {
+        "next": str(base.include_query_params(cursor=page.next_cursor)) if page.next_cursor else None,
+        "prev": str(base.include_query_params(cursor=page.prev_cursor)) if page.prev_cursor else None,
+    }
+
+
+def page_response_fields(request: Request, page: KeysetPage) -> dict:
+    """Pagination fields merged into a list endpoint's JSON body."""
+    return {"next_cursor": page.next_cursor, "prev_cursor": page.prev_cursor, "links": page_links(request, page)}
@@ -0,0 +1,111 @@
+import csv
+import hashlib
+import io
+from typing import Optional
+from fastapi import HTTPException, Request, Response
+from pydantic import ValidationError
+
+from app.core.config import settings
+
+
+async def json_payload(request: Request) -> Optional[dict]:
+    """Parsed JSON body for application/json requests, otherwise None.
+
+    Lets handlers that accept both JSON and form posts stay plain `def`
+    (run in the threadpool) instead of `async def` with blocking DB calls.
+    """
+    if not request.headers.get("content-type", "").startswith("application/json"):
+        return None
+    try:
+        payload = await request.json()
+    except Exception:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+async def bulk_payload(request: Request, key: str) -> Optional[list]:
+    """Items of a bulk request, or None when the body is neither JSON nor CSV.
+
+    JSON may be a list or an object holding the list under `key`. CSV needs a
+    header row; each line becomes a dict and blank cells become None.
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("application/json"):
+        try:
+            payload = await request.json()
+        except Exception:
+            return None
+        if isinstance(payload, dict):
+            payload = payload.get(key)
+        return payload if isinstance(payload, list) else None
+    if content_type.startswith(("text/csv", "application/csv")):
+        try:
+            body = (await request.body()).decode("utf-8-sig")
+        except UnicodeDecodeError:
+            return None
+        return csv_items(body)
+    return None
+
+
+def csv_items(text: str) -> list:
+    """CSV with a header row as a list of dicts; blank cells become None."""
+    return [
+        {name.strip(): (value.strip() or None) if value is not None else None for name, value in row.items() if name}
+        for row in csv.DictReader(io.StringIO(text))
+    ]
+
+
+def bulk_items(key: str):
+    """Dependency returning the items of a bulk request (see `bulk_payload`), capped at BULK_MAX_ITEMS."""
+    async def items(request: Request) -> list:
+        payload = await bulk_payload(request, key)
+        if payload is None:
+            raise HTTPException(status_code=400, detail=f"Send a JSON list (or {{\"{key}\": [...]}}) or text/csv with a header row")
+        if not payload:
+            raise HTTPException(status_code=400, detail=f"No {key} given")
+        if len(payload) > settings.BULK_MAX_ITEMS:
+            raise HTTPException(status_code=400, detail=f"At most {settings.BULK_MAX_ITEMS} {key} per request")
+        return payload
+    return items
+
+
+def item_errors(exc: ValidationError) -> list:
+    """Pydantic errors of one bulk item as "field: message" strings."""
+    return [f"{'.'.join(str(p) for p in err['loc']) or 'item'}: {err['msg']}" for err in exc.errors()]
+
+
+# ---------- Conditional GET ----------
+# Responses that must be revalidated on every use, by the caller's browser only
+ETAG_CACHE_CONTROL = "private, no-cache"
+
+
+def request_etag(request: Request, *version) -> str:
+    """Strong ETag for this URL's representation at a given collection version.
+
+    `version` is whatever identifies the state of the underlying rows (e.g.
+    row count and latest update time). The query string is part of the tag,
+    so each page and `fields=` projection gets its own.
+    """
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    raw = "|".join([str(request.base_url), request.url.path, query, *(str(v) for v in version)])
+    return '"' + hashlib.sha1(raw.encode()).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already names `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so a W/ prefix still matches
+    candidates = [c.strip().removeprefix("W/") for c in header.split(",")]
+    return etag in candidates
+
+
+def etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=etag_headers(etag))
@@ -0,0 +1,164 @@
+"""Per-user task counters (the `user_task_stats` table).
+
+Every route that creates, reassigns, updates or deletes a task snapshots
+the task before and after the change and calls `record_task_change()`
+before committing, so the counters move in the same transaction as the
+task. Dashboards then read one row per user instead of counting tasks.
+
+`overdue` is recounted from the tasks table (not moved by a delta)
+whenever one of a user's tasks changes, so a task that passes its due date
+untouched is only counted at that user's next change or the next
+rebuild. Run `python script.py rebuild-task-stats` nightly (or after any
+manual data fix) to bring every row back in line with the tasks table.
+"""
+from datetime import date, datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import case, delete, func, insert, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.task import Task, TaskStatus
+from app.models.task_log import TaskLog
+from app.models.task_stats import UserTaskStats
+
+COUNTERS = ("total", "pending", "in_progress", "completed", "overdue")
+
+
+def _as_status(value) -> TaskStatus:
+    # new Task objects may still hold the raw string they were built with
+    if isinstance(value, TaskStatus):
+        return value
+    try:
+        return TaskStatus[value]
+    except KeyError:
+        return TaskStatus(value)
+
+
+def _as_date(value) -> Optional[date]:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def task_snapshot(task: Optional[Task]):
+    """The parts of a task the counters depend on; take one before and after a change."""
+    if task is None:
+        return None
+    return (task.assigned_to, _as_status(task.status), _as_date(task.due_date))
+
+
+def record_task_change(db: Session, before, after) -> None:
+    """Apply the difference between two snapshots to the assignees' counters.
+
+    Pass `before=None` for a new task and `after=None` for a deleted one.
+    Flushes first; the caller commits.
+    """
+    record_task_changes(db, [(before, after)])
+
+
+def record_task_changes(db: Session, changes: Iterable) -> None:
+    """`record_task_change` for many `(before, after)` pairs: one UPDATE per affected user."""
+    db.flush()
+    deltas = {}
+    for before, after in changes:
+        for snapshot, sign in ((before, -1), (after, 1)):
+            if snapshot is None or snapshot[0] is None:
+                continue
+            user_id, task_status, _ = snapshot
+            delta = deltas.setdefault(user_id, dict.fromkeys(COUNTERS[:-1], 0))
+            delta["total"] += sign
+            delta[task_status.name] += sign
+
+    # fixed order so two reassignments between the same users cannot deadlock
+    for user_id in sorted(deltas, key=str):
+        values = {col: getattr(UserTaskStats, col) + n for col, n in deltas[user_id].items() if n}
+        # overdue is recounted, not moved by a delta: a task can go overdue without
+        # being touched, so the "before" snapshot says nothing about what was counted
+        values["overdue"] = _overdue_count(user_id)
+        values["last_activity_at"] = func.now()
+        result = db.execute(
+            update(UserTaskStats)
+            .where(UserTaskStats.user_id == user_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            _create_task_stats(db, user_id, values)
+
+
+def _create_task_stats(db: Session, user_id, values: dict) -> None:
+    # no row yet: count from the (already flushed) tasks. An upsert, because
+    # two first writes for the same user can both get here; the one that
+    # loses applies its delta to the row the other inserted.
+    upsert = (postgresql if db.get_bind().dialect.name == "postgresql" else sqlite).insert
+    counts = select(literal(user_id, UserTaskStats.user_id.type), *_task_counts(), func.now()).where(Task.assigned_to == user_id)
+    db.execute(
+        upsert(UserTaskStats)
+        .from_select(["user_id", *COUNTERS, "last_activity_at"], counts)
+        .on_conflict_do_update(index_elements=[UserTaskStats.user_id], set_=values)
+    )
+
+def _overdue_count(user_id):
+    # served by ix_tasks_assigned_to_status
+    return (
+        select(func.count())
+        .where(Task.assigned_to == user_id, Task.status != TaskStatus.completed, Task.due_date < date.today())
+        .scalar_subquery()
+    )
+
+
+def _task_counts() -> list:
+    # one aggregate row per group (or for the whole selection without GROUP BY), in COUNTERS order
+    today = date.today()
+    flags = (
+        Task.status == TaskStatus.pending,
+        Task.status == TaskStatus.in_progress,
+        Task.status == TaskStatus.completed,
+        (Task.due_date < today) & (Task.status != TaskStatus.completed),
+    )
+    return [func.count().label("total")] + [
+        func.coalesce(func.sum(case((flag, 1), else_=0)), 0).label(col)
+        for col, flag in zip(COUNTERS[1:], flags)
+    ]
+
+def rebuild_task_stats(db: Session, user_ids: Optional[Iterable] = None) -> int:
+    """Recompute counters from the tasks table, for some users or everyone.
+
+    Returns the number of rows written. The caller commits.
+    """
+    counts = (
+        select(Task.assigned_to.label("user_id"), *_task_counts())
+        .where(Task.assigned_to.isnot(None))
+        .group_by(Task.assigned_to)
+    )
+    activity = (
+        select(Task.assigned_to.label("user_id"), func.max(TaskLog.created_at).label("last_activity_at"))
+        .join(TaskLog, TaskLog.task_id == Task.id)
+        .where(Task.assigned_to.isnot(None))
+        .group_by(Task.assigned_to)
+    )
+    clear = delete(UserTaskStats)
+    if user_ids is not None:
+        user_ids = list(user_ids)
+        counts = counts.where(Task.assigned_to.in_(user_ids))
+        activity = activity.where(Task.assigned_to.in_(user_ids))
+        clear = clear.where(UserTaskStats.user_id.in_(user_ids))
+
+    counts = counts.subquery()
+    activity = activity.subquery()
+    source = select(
+        counts.c.user_id, counts.c.total, counts.c.pending, counts.c.in_progress,
+        counts.c.completed, counts.c.overdue, activity.c.last_activity_at,
+    ).outerjoin(activity, activity.c.user_id == counts.c.user_id)
+
+    db.execute(clear.execution_options(synchronize_session=False))
+    result = db.execute(insert(UserTaskStats).from_select(
+        ["user_id", *COUNTERS, "last_activity_at"], source,
+    ))
+    return result.rowcount
+
+
+def stats_dict(stats: Optional[UserTaskStats]) -> dict:
+    """Counters as a plain dict; users with no row yet have no tasks."""
+    data = {col: getattr(stats, col) if stats is not None else 0 for col in COUNTERS}
+    data["last_activity_at"] = stats.last_activity_at if stats is not None else None
+    return data
@@ -0,0 +1,150 @@
+# benchmarks/_common.py
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run against a throwaway SQLite database unless DATABASE_URL is
+already set, so they can be pointed at a real Postgres instance as well.
+"""
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+DEFAULT_DB_PATH = os.path.join(ROOT, "bench.db")
+SEED_BATCH = 20000
+
+
+def use_database(reset: bool = True) -> str:
+    """Point the app at the benchmark database. Call before importing `app`."""
+    os.environ.setdefault("DB_PROFILE", "bench")
+    # benchmarks measure database work; list_cache.py turns the response cache back on
+    os.environ.setdefault("CACHE_BACKEND", "none")
+    if "DATABASE_URL" not in os.environ:
+        if reset and os.path.exists(DEFAULT_DB_PATH):
+            os.remove(DEFAULT_DB_PATH)
+        os.environ["DATABASE_URL"] = f"sqlite:///{DEFAULT_DB_PATH}"
+    return os.environ["DATABASE_URL"]
+
+
+def create_schema():
+    from app.db import Base, engine
+    from app.models import user, task, task_log, time_log, task_stats  # noqa: F401 (register tables)
+    Base.metadata.create_all(bind=engine)
+
+
+def _uuid() -> uuid.UUID:
+    # SQLite gives the UUID columns NUMERIC affinity, so a hex string that parses
+    # as a number (e.g. "1234e567...") is stored as a REAL and cannot be read back.
+    # At a million rows that happens; skip those ids when seeding.
+    while True:
+        value = uuid.uuid4()
+        try:
+            float(value.hex)
+        except ValueError:
+            return value
+
+
+def seed_bulk(conn, tasks: int, managers: int, employees: int, time_logs: int = 0) -> dict:
+    """Bulk-insert an admin, managers, employees, tasks (one log each) and time logs.
+
+    Uses Core executemany in batches, so a million tasks is practical. Returns
+    the generated ids.
+    """
+    from sqlalchemy import insert
+    from app.models.user import User, UserRole
+    from app.models.task import Task, TaskStatus
+    from app.models.task_log import TaskLog, TaskStatus as LogStatus
+    from app.models.time_log import TimeLog
+
+    rng = random.Random(7)
+    now = datetime.now(timezone.utc)
+    admin_id = _uuid()
+    manager_ids = [_uuid() for _ in range(managers)]
+    employee_ids = [_uuid() for _ in range(employees)]
+    owner = {e: manager_ids[i % managers] for i, e in enumerate(employee_ids)}
+
+    users = [dict(id=admin_id, username="admin", email="admin@example.com", password_hash="x", role=UserRole.admin, is_active=True, created_by=None)]
+    users += [dict(id=m, username=f"mgr{i}", email=f"mgr{i}@example.com", password_hash="x", role=UserRole.manager, is_active=True, created_by=admin_id)
+              for i, m in enumerate(manager_ids)]
+    users += [dict(id=e, username=f"emp{i}", email=f"emp{i}@example.com", password_hash="x", role=UserRole.employee, is_active=i % 10 != 0, created_by=owner[e])
+              for i, e in enumerate(employee_ids)]
+    conn.execute(insert(User), users)
+
+    statuses = list(TaskStatus)
+    log_status = {TaskStatus.pending: LogStatus.pending, TaskStatus.in_progress: LogStatus.in_progress, TaskStatus.completed: LogStatus.completed}
+    task_ids = []
+    for start in range(0, tasks, SEED_BATCH):
+        task_rows, log_rows = [], []
+        for _ in range(min(SEED_BATCH, tasks - start)):
+            assignee = rng.choice(employee_ids)
+            created = now - timedelta(minutes=rng.randrange(60 * 24 * 365))
+            task_id = _uuid()
+            task_status = rng.choice(statuses)
+            task_rows.append(dict(id=task_id, title="Seeded task", description="x", status=task_status, assigned_to=assignee,
+                                  created_by=owner[assignee], created_at=created, due_date=created.date() + timedelta(days=14)))
+            log_rows.append(dict(task_id=task_id, status=log_status[task_status], created_at=created))
+            task_ids.append((task_id, assignee))
+        conn.execute(insert(Task), task_rows)
+        conn.execute(insert(TaskLog), log_rows)
+        print(f"  seeded {start + len(task_rows):,} tasks", end="\r", flush=True)
+    print()
+
+    for start in range(0, time_logs, SEED_BATCH):
+        rows = []
+        for _ in range(min(SEED_BATCH, time_logs - start)):
+            task_id, assignee = rng.choice(task_ids)
+            rows.append(dict(id=_uuid(), task_id=task_id, user_id=assignee, date=date.today() - timedelta(days=rng.randrange(365)), hours=2))
+        conn.execute(insert(TimeLog), rows)
+
+    # the routes maintain user_task_stats; bulk seeding bypasses them
+    from app.utils.task_stats import rebuild_task_stats
+    rebuild_task_stats(conn)
+    return {"admin_id": admin_id, "manager_ids": manager_ids, "employee_ids": employee_ids, "task_ids": [t for t, _ in task_ids]}
+
+
+def percentile(samples, pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def serve(extra_env: dict = None, workers: int = 1):
+    """Run the app under uvicorn in a subprocess and yield its base URL."""
+    port = free_port()
+    env = dict(os.environ, **(extra_env or {}))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        cwd=ROOT,
+        env=env,
+    )
+    try:
+        deadline = time.time() + 30
+        while time.time() < deadline:
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                    break
+            except OSError:
+                time.sleep(0.1)
+        else:
+            raise RuntimeError("uvicorn did not start")
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
@@ -0,0 +1,61 @@
+# benchmarks/admin_dashboard.py
+"""Admin dashboard cost as the data grows.
+
+Seeds the same managers and employees with increasing numbers of tasks
+(one task log each) and times GET /admin/dashboard in-process. It also
+times one "Load more" page of GET /admin/task-logs. The statement count
+should not change between sizes, and latency should stay roughly flat.
+
+    python benchmarks/admin_dashboard.py --tasks 1000,10000,100000
+"""
+import argparse
+import statistics
+import time
+
+from _common import use_database, create_schema, seed_bulk
+
+
+def timed_get(client, path: str, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(path)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return statistics.median(timings), int(response.headers["X-Query-Count"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", default="1000,10000,100000", help="comma-separated task counts")
+    parser.add_argument("--managers", type=int, default=50)
+    parser.add_argument("--employees", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    use_database()
+    from fastapi.testclient import TestClient
+    from app.db import Base, SessionLocal, engine
+    from app.models.user import User
+    from app.core.security import create_access_token, token_claims_for
+    import main as app_main
+
+    print(f"{'tasks':>10} {'dashboard':>12} {'queries':>8} {'log page':>10} {'queries':>8}")
+    for tasks in (int(n) for n in args.tasks.split(",")):
+        Base.metadata.drop_all(bind=engine)
+        create_schema()
+        with engine.begin() as conn:
+            seeded = seed_bulk(conn, tasks, args.managers, args.employees)
+        db = SessionLocal()
+        token = create_access_token(token_claims_for(db.get(User, seeded["admin_id"])))
+        db.close()
+
+        with TestClient(app_main.app) as client:
+            client.cookies.set("access_token", token)
+            dashboard_ms, dashboard_queries = timed_get(client, "/admin/dashboard", args.repeat)
+            logs_ms, logs_queries = timed_get(client, "/admin/task-logs?offset=50", args.repeat)
+        print(f"{tasks:>10,} {dashboard_ms:>9.1f} ms {dashboard_queries:>8} {logs_ms:>7.1f} ms {logs_queries:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/assets.py
+"""Bytes and requests for the JS/CSS linked from a dashboard.
+
+Builds the assets, renders /manager/dashboard, then fetches every linked
+asset as a first visit (identity vs gzip/br) and counts what a repeat visit
+still has to ask the server: with the old plain StaticFiles mounts every
+asset was revalidated (a 304 each); fingerprinted immutable URLs need none.
+
+    python benchmarks/assets.py --repeat 200
+"""
+import argparse
+import re
+import statistics
+import time
+
+from _common import use_database, create_schema, seed_bulk
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    use_database()
+    from fastapi.testclient import TestClient
+    from app.db import SessionLocal, engine
+    from app.models.user import User
+    from app.core.assets import build_assets
+    from app.core.security import create_access_token, token_claims_for
+    import main as app_main
+
+    create_schema()
+    with engine.begin() as conn:
+        seeded = seed_bulk(conn, 100, 1, 10)
+    db = SessionLocal()
+    token = create_access_token(token_claims_for(db.get(User, seeded["manager_ids"][0])))
+    db.close()
+    build_assets()
+
+    with TestClient(app_main.app) as client:
+        client.cookies.set("access_token", token)
+        page = client.get("/manager/dashboard").text
+        urls = re.findall(r'(?:src|href)="(/assets/[^"]+)"', page)
+
+        print(f"{'encoding':>10} {'bytes':>8} {'median/asset':>13}")
+        for encoding in ("identity", "gzip", "br, gzip"):
+            sent, timings = 0, []
+            for url in urls:
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    response = client.get(url, headers={"Accept-Encoding": encoding})
+                    timings.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+                sent += int(response.headers["content-length"])
+            print(f"{encoding:>10} {sent:>8,} {statistics.median(timings):>10.2f} ms")
+
+        immutable = sum("immutable" in client.get(url).headers.get("cache-control", "") for url in urls)
+        print(f"repeat visit: {len(urls)} revalidations before, {len(urls) - immutable} now")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# benchmarks/async_reads.py
+"""Sync vs async read path.
+
+Seeds one manager with employees and tasks, then drives concurrent reads of
+the manager/employee task lists and dashboards against two servers: one on
+the default threadpool + Session path and one with DB_ASYNC_READS=true.
+Reports throughput and latency percentiles for each.
+
+    python benchmarks/async_reads.py --requests 2000 --concurrency 100
+"""
+import argparse
+import asyncio
+import time
+
+from _common import use_database, create_schema, serve, percentile
+
+
+def seed(employees: int, tasks_per_employee: int):
+    from datetime import date, timedelta
+    from app.db import SessionLocal
+    from app.models.user import User, UserRole
+    from app.models.task import Task, TaskStatus
+    from app.core.security import create_access_token, token_claims_for
+
+    db = SessionLocal()
+    manager = User(username="bench_mgr", email="bench_mgr@example.com", password_hash="x", role=UserRole.manager)
+    db.add(manager)
+    db.flush()
+    staff = [
+        User(username=f"bench_emp{i}", email=f"bench_emp{i}@example.com", password_hash="x", role=UserRole.employee, created_by=manager.id)
+        for i in range(employees)
+    ]
+    db.add_all(staff)
+    db.flush()
+    statuses = list(TaskStatus)
+    for i, employee in enumerate(staff):
+        for j in range(tasks_per_employee):
+            db.add(Task(
+                title=f"Task {i}-{j}",
+                description="benchmark task",
+                status=statuses[j % len(statuses)],
+                assigned_to=employee.id,
+                created_by=manager.id,
+                start_date=date.today(),
+                due_date=date.today() + timedelta(days=j % 14),
+            ))
+    db.commit()
+    tokens = {
+        "manager": (str(manager.id), create_access_token(token_claims_for(manager))),
+        "employee": (str(staff[0].id), create_access_token(token_claims_for(staff[0]))),
+    }
+    db.close()
+    return tokens
+
+
+async def run(base_url: str, tokens: dict, requests: int, concurrency: int):
+    import httpx
+
+    manager_id, manager_token = tokens["manager"]
+    employee_id, employee_token = tokens["employee"]
+    targets = [
+        (f"/manager/{manager_id}/tasks", manager_token),
+        (f"/employee/{employee_id}/tasks", employee_token),
+        ("/manager/dashboard", manager_token),
+        ("/employee/dashboard", employee_token),
+    ]
+    latencies = []
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def hit(i: int):
+            path, token = targets[i % len(targets)]
+            async with semaphore:
+                start = time.perf_counter()
+                r = await client.get(path, cookies={"access_token": token})
+                r.raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        for path, token in targets:  # warm up
+            (await client.get(path, cookies={"access_token": token})).raise_for_status()
+        start = time.perf_counter()
+        await asyncio.gather(*(hit(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+    return requests / elapsed, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--employees", type=int, default=20)
+    parser.add_argument("--tasks-per-employee", type=int, default=25)
+    args = parser.parse_args()
+
+    use_database()
+    create_schema()
+    tokens = seed(args.employees, args.tasks_per_employee)
+    for label, flag in (("sync ", "false"), ("async", "true")):
+        with serve({"DB_ASYNC_READS": flag}) as base_url:
+            rps, latencies = asyncio.run(run(base_url, tokens, args.requests, args.concurrency))
+        print(f"{label}: {rps:7.1f} req/s  p50 {percentile(latencies, 50):.0f} ms  p99 {percentile(latencies, 99):.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
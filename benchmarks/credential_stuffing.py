@@ -0,0 +1,99 @@
+# benchmarks/credential_stuffing.py
+"""Credential-stuffing load test.
+
+An attacker hammers /auth/login from a handful of IPs with wrong passwords
+for many accounts, while legitimate users (one IP each) log in normally.
+Reports how many attacker requests reached bcrypt and the latency and
+success rate of the legitimate logins. Run with and without limits:
+
+    python benchmarks/credential_stuffing.py
+    python benchmarks/credential_stuffing.py --no-limit
+"""
+import argparse
+import asyncio
+import collections
+import time
+
+from _common import use_database, create_schema, serve, percentile
+
+PASSWORD = "Secret@123"
+
+
+def seed(users: int, victims: int):
+    from app.db import SessionLocal
+    from app.models.user import User, UserRole
+    from app.core.security import hash_password
+
+    db = SessionLocal()
+    password_hash = hash_password(PASSWORD)
+    for i in range(users):
+        db.add(User(username=f"user{i}", email=f"user{i}@example.com", password_hash=password_hash, role=UserRole.employee))
+    for i in range(victims):
+        db.add(User(username=f"victim{i}", email=f"victim{i}@example.com", password_hash=password_hash, role=UserRole.employee))
+    db.commit()
+    db.close()
+
+
+async def run(base_url: str, attack_requests: int, attack_ips: int, attack_concurrency: int, users: int, victims: int):
+    import httpx
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+        attack_status = collections.Counter()
+        legit_latency = []
+        legit_status = collections.Counter()
+        semaphore = asyncio.Semaphore(attack_concurrency)
+
+        async def attack(i: int):
+            async with semaphore:
+                r = await client.post(
+                    "/auth/login",
+                    json={"email": f"victim{i % victims}@example.com", "password": "Guess@1234"},
+                    headers={"X-Forwarded-For": f"203.0.113.{i % attack_ips}"},
+                )
+                attack_status[r.status_code] += 1
+
+        async def legit(i: int):
+            await asyncio.sleep(i * 0.05)
+            start = time.perf_counter()
+            r = await client.post(
+                "/auth/login",
+                json={"email": f"user{i}@example.com", "password": PASSWORD},
+                headers={"X-Forwarded-For": f"198.51.100.{i % 250}"},
+            )
+            legit_latency.append((time.perf_counter() - start) * 1000)
+            legit_status[r.status_code] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(attack(i) for i in range(attack_requests)),
+            *(legit(i) for i in range(users)),
+        )
+        elapsed = time.perf_counter() - start
+
+    reached_bcrypt = attack_status.get(401, 0)
+    print(f"duration:            {elapsed:.2f}s")
+    print(f"attacker responses:  {dict(attack_status)}  ({reached_bcrypt} reached bcrypt)")
+    print(f"legit responses:     {dict(legit_status)}")
+    print(f"legit login latency: p50 {percentile(legit_latency, 50):.0f} ms  p99 {percentile(legit_latency, 99):.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--attack-requests", type=int, default=500)
+    parser.add_argument("--attack-ips", type=int, default=5)
+    parser.add_argument("--attack-concurrency", type=int, default=100)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--victims", type=int, default=200)
+    parser.add_argument("--no-limit", action="store_true", help="disable rate limiting for comparison")
+    args = parser.parse_args()
+
+    use_database()
+    create_schema()
+    seed(args.users, args.victims)
+    env = {"RATE_LIMIT_TRUST_FORWARDED": "true", "RATE_LIMIT_ENABLED": "false" if args.no_limit else "true"}
+    with serve(env) as base_url:
+        asyncio.run(run(base_url, args.attack_requests, args.attack_ips, args.attack_concurrency, args.users, args.victims))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/dashboard_fragments.py
+"""Dashboard latency with and without the fragment cache.
+
+Renders each role's dashboard with CACHE_BACKEND=none, then with every
+widget cached, and with one widget invalidated before every load (the
+employee's time logs, all of a manager's widgets, or one of the admin's
+managers), which re-renders only the widgets carrying that tag.
+
+    python benchmarks/dashboard_fragments.py --tasks 20000 --repeat 100
+"""
+import argparse
+import os
+import statistics
+import time
+
+from _common import use_database, create_schema, seed_bulk
+
+
+def timed(client, token: str, path: str, repeat: int, before=None):
+    client.cookies.clear()
+    client.cookies.set("access_token", token)
+    timings, queries = [], 0
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        response = client.get(path)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        queries = int(response.headers.get("x-query-count", 0))
+    return statistics.median(timings), queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--managers", type=int, default=5)
+    parser.add_argument("--employees", type=int, default=200)
+    parser.add_argument("--time-logs", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    os.environ["CACHE_BACKEND"] = "memory"
+    use_database()
+    from fastapi.testclient import TestClient
+    from app.db import SessionLocal, engine
+    from app.models.user import User
+    from app.core.security import create_access_token, token_claims_for
+    from app.utils.cache_utils import (
+        Cache, MemoryBackend, NullBackend, get_cache, set_cache,
+        invalidate_task_lists, invalidate_time_logs,
+    )
+    import main as app_main
+
+    create_schema()
+    with engine.begin() as conn:
+        seeded = seed_bulk(conn, args.tasks, args.managers, args.employees, time_logs=args.time_logs)
+    manager_id = seeded["manager_ids"][0]
+    # an active employee of that manager (seed_bulk deactivates every tenth)
+    employee_id = next(e for i, e in enumerate(seeded["employee_ids"]) if i % args.managers == 0 and i % 10 != 0)
+    db = SessionLocal()
+    tokens = {uid: create_access_token(token_claims_for(db.get(User, uid))) for uid in (seeded["admin_id"], manager_id, employee_id)}
+    db.close()
+
+    pages = (
+        ("/admin/dashboard", seeded["admin_id"], lambda: invalidate_task_lists(manager_id)),
+        ("/manager/dashboard", manager_id, lambda: invalidate_task_lists(manager_id)),
+        ("/employee/dashboard", employee_id, lambda: invalidate_time_logs(employee_id)),
+    )
+    print(f"{'page':>20} {'no cache':>16} {'all cached':>16} {'one tag stale':>16}")
+    with TestClient(app_main.app) as client:
+        for path, user_id, invalidate in pages:
+            set_cache(Cache(NullBackend(), 60, 5))
+            uncached, q_uncached = timed(client, tokens[user_id], path, args.repeat)
+            set_cache(Cache(MemoryBackend(10000), 60, 5))
+            hit, q_hit = timed(client, tokens[user_id], path, args.repeat)
+            stale, q_stale = timed(client, tokens[user_id], path, args.repeat, before=invalidate)
+            print(f"{path:>20} {uncached:>7.2f} ms {q_uncached:>2} q {hit:>7.2f} ms {q_hit:>2} q {stale:>7.2f} ms {q_stale:>2} q")
+        print({ns: s["hit_ratio"] for ns, s in get_cache().stats()["namespaces"].items()})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# benchmarks/employee_import.py
+"""Onboarding N employees one request at a time vs one bulk import.
+
+Creates N employees through POST /manager/{id}/employees (one bcrypt hash
+per request on the shared hashing executor), then another N through
+POST /manager/{id}/employees/import with BULK_HASH_WORKERS=1 and with every
+core, and reports wall time, SQL statements (X-Query-Count) and what a
+5,000-employee import would take at the measured rate. Hashing dominates,
+so the bulk path scales with the number of cores.
+
+    python benchmarks/employee_import.py --employees 50
+"""
+import argparse
+import os
+import time
+
+from _common import use_database, create_schema, seed_bulk
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--employees", type=int, default=50)
+    args = parser.parse_args()
+
+    use_database()
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    from fastapi.testclient import TestClient
+    from app.core.config import settings
+    from app.db import SessionLocal, engine
+    from app.models.user import User
+    from app.core.security import create_access_token, token_claims_for
+    import main as app_main
+
+    create_schema()
+    with engine.begin() as conn:
+        seeded = seed_bulk(conn, 0, 1, 0)
+    manager_id = seeded["manager_ids"][0]
+    db = SessionLocal()
+    token = create_access_token(token_claims_for(db.get(User, manager_id)))
+    db.close()
+
+    def employees(prefix: str) -> list:
+        return [
+            {"username": f"{prefix}{i}", "email": f"{prefix}{i}@example.com", "password": "Secret@123", "full_name": f"Employee {i}"}
+            for i in range(args.employees)
+        ]
+
+    cores = os.cpu_count() or 1
+    print(f"{'path':>22} {'seconds':>8} {'statements':>11} {'5,000 employees':>16}")
+    with TestClient(app_main.app) as client:
+        client.cookies.set("access_token", token)
+
+        start, statements = time.perf_counter(), 0
+        for item in employees("single"):
+            response = client.post(f"/manager/{manager_id}/employees", json=item)
+            response.raise_for_status()
+            statements += int(response.headers.get("x-query-count", 0))
+        elapsed = time.perf_counter() - start
+        print(f"{'one by one':>22} {elapsed:>8.2f} {statements:>11,} {elapsed / args.employees * 5000:>14.0f} s")
+
+        for workers in sorted({1, cores}):
+            settings.BULK_HASH_WORKERS = workers
+            start = time.perf_counter()
+            response = client.post(f"/manager/{manager_id}/employees/import", json=employees(f"bulk{workers}_"))
+            response.raise_for_status()
+            elapsed = time.perf_counter() - start
+            label = f"import, {workers} process{'es' if workers > 1 else ''}"
+            print(f"{label:>22} {elapsed:>8.2f} {int(response.headers.get('x-query-count', 0)):>11,} {elapsed / args.employees * 5000:>14.0f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/etag_polls.py
+"""Polling GET /manager/{id}/tasks with and without If-None-Match.
+
+Seeds one manager with many tasks, then times an unconditional poll (full
+page, 200) against a conditional poll with the last ETag (304, only the
+count/max(updated_at) query runs).
+
+    python benchmarks/etag_polls.py --tasks 20000,100000
+"""
+import argparse
+import statistics
+import time
+
+from _common import use_database, create_schema, seed_bulk
+
+
+def timed(client, path: str, headers: dict, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(path, headers=headers)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", default="20000,100000", help="comma-separated task counts")
+    parser.add_argument("--employees", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    use_database()
+    from fastapi.testclient import TestClient
+    from app.db import Base, SessionLocal, engine
+    from app.models.user import User
+    from app.core.security import create_access_token, token_claims_for
+    import main as app_main
+
+    print(f"{'tasks':>8} {'200 poll':>10} {'304 poll':>10} {'KB saved':>9} {'queries 200/304':>16}")
+    for tasks in (int(n) for n in args.tasks.split(",")):
+        Base.metadata.drop_all(bind=engine)
+        create_schema()
+        with engine.begin() as conn:
+            seeded = seed_bulk(conn, tasks, 1, args.employees)
+        manager_id = seeded["manager_ids"][0]
+        db = SessionLocal()
+        token = create_access_token(token_claims_for(db.get(User, manager_id)))
+        db.close()
+
+        path = f"/manager/{manager_id}/tasks?limit={args.limit}"
+        with TestClient(app_main.app) as client:
+            client.cookies.set("access_token", token)
+            full_ms, full = timed(client, path, {}, args.repeat)
+            etag = full.headers["etag"]
+            cond_ms, cond = timed(client, path, {"If-None-Match": etag}, args.repeat)
+            assert cond.status_code == 304, cond.status_code
+        queries = f"{full.headers.get('x-query-count')}/{cond.headers.get('x-query-count')}"
+        print(f"{tasks:>8,} {full_ms:>7.2f} ms {cond_ms:>7.2f} ms {len(full.content) / 1024:>9.1f} {queries:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# benchmarks/exports.py
+"""Streaming export throughput and server memory.
+
+Seeds tasks at each size, starts a fresh uvicorn server and streams
+GET /exports/tasks (plain CSV, then gzip-ed NDJSON) chunk by chunk. Reports
+rows/s, bytes on the wire and the server's peak RSS (VmHWM, Linux only).
+The peak should stay about the same as the row count grows.
+
+    python benchmarks/exports.py --tasks 100000,500000
+"""
+import argparse
+import os
+import time
+
+from _common import use_database, create_schema, seed_bulk, serve
+
+
+def server_peak_rss_mb() -> float:
+    """Peak RSS of this process's child (the uvicorn server), in MB."""
+    for tid in os.listdir(f"/proc/{os.getpid()}/task"):
+        with open(f"/proc/{os.getpid()}/task/{tid}/children") as fh:
+            for pid in fh.read().split():
+                with open(f"/proc/{pid}/status") as status:
+                    for line in status:
+                        if line.startswith("VmHWM:"):
+                            return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def stream(base_url: str, token: str, params: dict, headers: dict):
+    import httpx
+
+    start = time.perf_counter()
+    sent = 0
+    with httpx.Client(base_url=base_url, cookies={"access_token": token}, timeout=None) as client:
+        with client.stream("GET", "/exports/tasks", params=params, headers=headers) as response:
+            response.raise_for_status()
+            for chunk in response.iter_raw():
+                sent += len(chunk)
+    return time.perf_counter() - start, sent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", default="100000,500000", help="comma-separated task counts")
+    parser.add_argument("--employees", type=int, default=200)
+    args = parser.parse_args()
+
+    use_database()
+    from app.db import Base, SessionLocal, engine
+    from app.models.user import User
+    from app.core.security import create_access_token, token_claims_for
+
+    print(f"{'tasks':>10} {'format':>12} {'seconds':>8} {'rows/s':>10} {'MB sent':>8} {'server peak':>12}")
+    for tasks in (int(n) for n in args.tasks.split(",")):
+        Base.metadata.drop_all(bind=engine)
+        create_schema()
+        with engine.begin() as conn:
+            seeded = seed_bulk(conn, tasks, 1, args.employees)
+        db = SessionLocal()
+        token = create_access_token(token_claims_for(db.get(User, seeded["manager_ids"][0])))
+        db.close()
+
+        for label, params, headers in (
+            ("csv", {"format": "csv"}, {"Accept-Encoding": "identity"}),
+            ("ndjson+gzip", {"format": "ndjson"}, {"Accept-Encoding": "gzip"}),
+        ):
+            # a fresh server per run so the peak belongs to this export alone
+            # SQLite mmap pages would count towards RSS, so turn mmap off here
+            with serve({"DB_ECHO": "false", "SLOW_QUERY_MS": "0", "SQLITE_MMAP_SIZE": "0"}) as base_url:
+                elapsed, sent = stream(base_url, token, params, headers)
+                peak = server_peak_rss_mb()
+            print(f"{tasks:>10,} {label:>12} {elapsed:>8.2f} {tasks / elapsed:>10,.0f} {sent / 1e6:>8.1f} {peak:>9.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
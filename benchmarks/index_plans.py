@@ -0,0 +1,109 @@
+# benchmarks/index_plans.py
+"""Query plans and latency before/after the 0003 index migration.
+
+Migrates a fresh database to revision 0002 (no secondary indexes), seeds it
+with managers, employees, tasks, task logs and time logs, then runs the
+queries the routers issue and prints each plan and its latency. It then
+upgrades to head (CONCURRENTLY on Postgres) and runs them again.
+
+    python benchmarks/index_plans.py                   # 1M tasks on SQLite
+    python benchmarks/index_plans.py --tasks 100000 --analyze
+    DATABASE_URL=postgresql+psycopg2://... python benchmarks/index_plans.py
+
+--analyze uses EXPLAIN ANALYZE on Postgres (ignored on SQLite).
+"""
+import argparse
+import os
+import statistics
+import time
+
+from sqlalchemy import select, func, text
+
+from _common import ROOT, use_database, seed_bulk
+
+
+def migrate(revision: str):
+    from alembic import command
+    from alembic.config import Config
+
+    command.upgrade(Config(os.path.join(ROOT, "alembic.ini")), revision)
+
+
+def router_queries(manager_id, employee_id, task_ids):
+    """The statements behind the manager/employee/admin pages, by name."""
+    from app.models.user import User, UserRole
+    from app.models.task import Task
+    from app.models.task_log import TaskLog
+    from app.models.time_log import TimeLog
+
+    return {
+        "manager task list": select(Task).where(Task.created_by == manager_id).order_by(Task.created_at.desc()).limit(50),
+        "employee task list": select(Task).where(Task.assigned_to == employee_id).order_by(Task.created_at.desc()),
+        "employee status counts": select(Task.status, func.count()).where(Task.assigned_to == employee_id).group_by(Task.status),
+        "admin recent tasks": select(Task).order_by(Task.created_at.desc()).limit(50),
+        "employee time logs": select(TimeLog).where(TimeLog.user_id == employee_id).order_by(TimeLog.date.desc()),
+        "task logs for tasks": select(TaskLog).where(TaskLog.task_id.in_(task_ids)).order_by(TaskLog.created_at.desc()),
+        "manager employees": select(User).where(User.created_by == manager_id, User.role == UserRole.employee, User.is_active == True),
+    }
+
+
+def explain(conn, stmt, analyze: bool) -> list:
+    sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    if conn.dialect.name == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) " if analyze else "EXPLAIN "
+    else:
+        prefix = "EXPLAIN QUERY PLAN "
+    # the plan text is the last column on both backends
+    return [row[-1] for row in conn.exec_driver_sql(prefix + sql)]
+
+
+def measure(conn, queries: dict, repeat: int, analyze: bool) -> dict:
+    results = {}
+    for name, stmt in queries.items():
+        plan = explain(conn, stmt, analyze)
+        conn.execute(stmt).fetchall()  # warm the cache
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            conn.execute(stmt).fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+        results[name] = (statistics.median(timings), plan)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--managers", type=int, default=200)
+    parser.add_argument("--employees", type=int, default=5000)
+    parser.add_argument("--time-logs", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--analyze", action="store_true", help="EXPLAIN ANALYZE on Postgres")
+    args = parser.parse_args()
+
+    use_database()
+    migrate("0002")
+    from app.db import engine
+
+    with engine.begin() as conn:
+        seeded = seed_bulk(conn, args.tasks, args.managers, args.employees, args.time_logs)
+        conn.execute(text("ANALYZE"))
+    queries = router_queries(seeded["manager_ids"][0], seeded["employee_ids"][1], seeded["task_ids"][:50])
+
+    with engine.connect() as conn:
+        before = measure(conn, queries, args.repeat, args.analyze)
+    migrate("head")
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    with engine.connect() as conn:
+        after = measure(conn, queries, args.repeat, args.analyze)
+
+    for name in queries:
+        (before_ms, before_plan), (after_ms, after_plan) = before[name], after[name]
+        print(f"\n{name}: {before_ms:.2f} ms -> {after_ms:.2f} ms ({before_ms / max(after_ms, 1e-6):.0f}x)")
+        print("  before: " + "\n          ".join(before_plan))
+        print("  after:  " + "\n          ".join(after_plan))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/json_responses.py
+"""Serializing a 100-row task list: stock JSONResponse vs the orjson default.
+
+Builds task rows as the list query returns them (UUID, TaskStatus, date,
+datetime) and times rendering one response body three ways: the old path
+(str()/.isoformat() per value into dicts, then the stdlib-json
+JSONResponse), the same dicts through app.core.responses.JSONResponse, and
+typed rows straight into it. No database is involved.
+
+    python benchmarks/json_responses.py --rows 100 --repeat 2000
+"""
+import argparse
+import statistics
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from _common import use_database
+
+FIELDS = ["uuid", "title", "status", "assigned_to", "start_date", "due_date", "created_at", "updated_at"]
+
+
+def typed_rows(n: int) -> list:
+    from app.models.task import TaskStatus
+
+    now = datetime.now(timezone.utc)
+    statuses = list(TaskStatus)
+    return [
+        (uuid.uuid4(), f"Task {i}", statuses[i % 3], uuid.uuid4(), None, date.today() + timedelta(days=i),
+         now - timedelta(minutes=i), now)
+        for i in range(n)
+    ]
+
+
+def hand_built(rows) -> list:
+    # what the handlers did before: stringify every typed value themselves
+    return [
+        {
+            "uuid": str(r[0]),
+            "title": r[1],
+            "status": r[2].value,
+            "assigned_to": str(r[3]),
+            "start_date": r[4].isoformat() if r[4] else None,
+            "due_date": r[5].isoformat() if r[5] else None,
+            "created_at": r[6].isoformat(),
+            "updated_at": r[7].isoformat(),
+        }
+        for r in rows
+    ]
+
+
+def timed(fn, repeat: int) -> tuple:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = fn()
+        timings.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(timings), len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    use_database()
+    from fastapi.responses import JSONResponse as StockJSONResponse
+    from app.core.responses import JSONResponse
+
+    rows = typed_rows(args.rows)
+    envelope = lambda data: {"message": "Tasks fetched successfully", "data": data, "next_cursor": None}
+    variants = (
+        ("stock, hand-built dicts", lambda: StockJSONResponse(envelope(hand_built(rows))).body),
+        ("orjson, hand-built dicts", lambda: JSONResponse(envelope(hand_built(rows))).body),
+        ("orjson, typed rows", lambda: JSONResponse(envelope([dict(zip(FIELDS, r)) for r in rows])).body),
+    )
+    bodies = {label: fn() for label, fn in variants}
+    assert len(set(bodies.values())) == 1, "all three paths must produce the same bytes"
+
+    print(f"{'path':>26} {'median':>10} {'bytes':>8}")
+    for label, fn in variants:
+        median, size = timed(fn, args.repeat)
+        print(f"{label:>26} {median:>7.1f} us {size:>8,}")
+
+
+if __name__ == "__main__":
+    main()
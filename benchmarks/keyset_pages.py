@@ -0,0 +1,73 @@
+# benchmarks/keyset_pages.py
+"""Offset vs cursor paging on GET /manager/{id}/tasks.
+
+Seeds one manager with many tasks and times the page at increasing depths:
+once with the old `offset` parameter, once by following `next_cursor`.
+Offset pages get slower the deeper they are; cursor pages should not.
+
+    python benchmarks/keyset_pages.py --tasks 100000 --depths 0,1000,10000,50000
+"""
+import argparse
+import statistics
+import time
+
+from _common import use_database, create_schema, seed_bulk
+
+
+def timed_get(client, path: str, params: dict, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(path, params=params)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return statistics.median(timings), response.json()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--employees", type=int, default=50)
+    parser.add_argument("--depths", default="0,1000,10000,50000", help="comma-separated row offsets to time")
+    parser.add_argument("--limit", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    use_database()
+    from fastapi.testclient import TestClient
+    from sqlalchemy import select
+    from app.db import SessionLocal, engine
+    from app.models.task import Task
+    from app.models.user import User
+    from app.core.security import create_access_token, token_claims_for
+    from app.utils.pagination import KeysetPager
+    import main as app_main
+
+    create_schema()
+    with engine.begin() as conn:
+        seeded = seed_bulk(conn, args.tasks, 1, args.employees)
+    manager_id = seeded["manager_ids"][0]
+    db = SessionLocal()
+    token = create_access_token(token_claims_for(db.get(User, manager_id)))
+    path = f"/manager/{manager_id}/tasks"
+
+    print(f"{'depth':>8} {'offset':>10} {'cursor':>10}")
+    with TestClient(app_main.app) as client:
+        client.cookies.set("access_token", token)
+        for depth in (int(d) for d in args.depths.split(",")):
+            if depth >= args.tasks:
+                continue
+            offset_ms, _ = timed_get(client, path, {"limit": args.limit, "offset": depth}, args.repeat)
+            # a cursor for the row just before `depth`, as a client paging from the top would hold
+            params = {"limit": args.limit}
+            if depth:
+                pager = KeysetPager(db, [Task.created_at, Task.id], direction="desc", limit=1, offset=depth - 1, scope="manager-tasks")
+                page = pager.page(db.execute(pager.apply(select(Task).where(Task.created_by == manager_id))).all())
+                params["cursor"] = page.next_cursor or page.prev_cursor
+            cursor_ms, _ = timed_get(client, path, params, args.repeat)
+            print(f"{depth:>8,} {offset_ms:>7.1f} ms {cursor_ms:>7.1f} ms")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# benchmarks/list_cache.py
+"""Cached vs uncached JSON list endpoints.
+
+Times the manager's task and employee lists with CACHE_BACKEND=none, then
+with the in-process cache (every read after the first is a hit), and once
+more with the cache invalidated before every read, which is the worst case.
+
+    python benchmarks/list_cache.py --tasks 20000 --repeat 200
+"""
+import argparse
+import os
+import statistics
+import time
+
+from _common import use_database, create_schema, seed_bulk
+
+
+def timed(client, path: str, repeat: int, before=None) -> float:
+    timings = []
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        client.get(path).raise_for_status()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--employees", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    os.environ["CACHE_BACKEND"] = "memory"
+    use_database()
+    from fastapi.testclient import TestClient
+    from app.db import SessionLocal, engine
+    from app.models.user import User
+    from app.core.security import create_access_token, token_claims_for
+    from app.utils.cache_utils import Cache, MemoryBackend, NullBackend, get_cache, set_cache, invalidate_task_lists, invalidate_manager_cache
+    import main as app_main
+
+    create_schema()
+    with engine.begin() as conn:
+        seeded = seed_bulk(conn, args.tasks, 1, args.employees)
+    manager_id = seeded["manager_ids"][0]
+    db = SessionLocal()
+    token = create_access_token(token_claims_for(db.get(User, manager_id)))
+    db.close()
+
+    pages = (
+        (f"/manager/{manager_id}/tasks?limit=100", lambda: invalidate_task_lists(manager_id)),
+        (f"/manager/{manager_id}/employees?limit=100", lambda: invalidate_manager_cache(manager_id)),
+    )
+    print(f"{'page':>28} {'no cache':>10} {'hit':>10} {'invalidated':>12}")
+    with TestClient(app_main.app) as client:
+        client.cookies.set("access_token", token)
+        for path, invalidate in pages:
+            set_cache(Cache(NullBackend(), 60, 5))
+            uncached = timed(client, path, args.repeat)
+            set_cache(Cache(MemoryBackend(10000), 60, 5))
+            hit = timed(client, path, args.repeat)
+            stale = timed(client, path, args.repeat, before=invalidate)
+            label = path.split("?")[0].replace(str(manager_id), "{id}")
+            print(f"{label:>28} {uncached:>7.2f} ms {hit:>7.2f} ms {stale:>9.2f} ms")
+        print(get_cache().stats()["namespaces"])
+
+
+if __name__ == "__main__":
+    main()
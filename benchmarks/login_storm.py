@@ -0,0 +1,90 @@
+# benchmarks/login_storm.py
+"""Login storm benchmark.
+
+Fires a burst of concurrent logins at a running app while polling an
+unrelated page (GET /auth/login, no DB or bcrypt work). Reports login
+throughput and the latency of the unrelated page, which shows whether
+password hashing is stalling the event loop.
+
+    python benchmarks/login_storm.py --logins 200 --concurrency 50
+    PASSWORD_HASH_WORKERS=8 python benchmarks/login_storm.py
+"""
+import argparse
+import asyncio
+import time
+
+from _common import use_database, create_schema, serve, percentile
+
+PASSWORD = "Secret@123"
+
+
+def seed(users: int):
+    from app.db import SessionLocal
+    from app.models.user import User, UserRole
+    from app.core.security import hash_password
+
+    db = SessionLocal()
+    password_hash = hash_password(PASSWORD)
+    for i in range(users):
+        db.add(User(username=f"storm{i}", email=f"storm{i}@example.com", password_hash=password_hash, role=UserRole.employee))
+    db.commit()
+    db.close()
+
+
+async def run(base_url: str, logins: int, concurrency: int, users: int):
+    import httpx
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        semaphore = asyncio.Semaphore(concurrency)
+        done = asyncio.Event()
+        probe_latencies = []
+
+        async def login(i: int):
+            async with semaphore:
+                r = await client.post("/auth/login", json={"email": f"storm{i % users}@example.com", "password": PASSWORD})
+                r.raise_for_status()
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                r = await client.get("/auth/login")
+                r.raise_for_status()
+                probe_latencies.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.01)
+
+        # warm up, then measure the probe alone as a baseline
+        await client.get("/auth/login")
+        baseline = []
+        for _ in range(50):
+            start = time.perf_counter()
+            await client.get("/auth/login")
+            baseline.append((time.perf_counter() - start) * 1000)
+
+        probe_task = asyncio.create_task(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*(login(i) for i in range(logins)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe_task
+
+    print(f"logins:              {logins} in {elapsed:.2f}s ({logins / elapsed:.1f}/s)")
+    print(f"probe baseline p50:  {percentile(baseline, 50):.1f} ms  p99: {percentile(baseline, 99):.1f} ms")
+    print(f"probe under storm:   p50 {percentile(probe_latencies, 50):.1f} ms  p99 {percentile(probe_latencies, 99):.1f} ms  (n={len(probe_latencies)})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--users", type=int, default=20)
+    args = parser.parse_args()
+
+    use_database()
+    create_schema()
+    seed(args.users)
+    with serve() as base_url:
+        asyncio.run(run(base_url, args.logins, args.concurrency, args.users))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# benchmarks/query_counts.py
+"""Statements per page at two data sizes.
+
+Seeds an admin, managers, employees, tasks, task logs and time logs, requests
+each page in-process and reads X-Query-Count. It then doubles the data and
+repeats. Pages whose count grows with the data run queries in a loop; the
+most repeated statement is shown for those.
+
+    python benchmarks/query_counts.py --employees 10 --tasks-per-employee 5
+    python benchmarks/query_counts.py --budget 12     # exit 1 if any page exceeds 12
+
+Pages listed in PINNED must stay at or under their statement count at both
+sizes; the script exits 1 otherwise, so it can run as a check in CI.
+"""
+import argparse
+import sys
+from datetime import date
+
+from _common import use_database, create_schema
+
+
+def seed(managers: int, employees: int, tasks_per_employee: int):
+    from app.db import SessionLocal
+    from app.models.user import User, UserRole
+    from app.models.task import Task, TaskStatus
+    from app.models.task_log import TaskLog, TaskStatus as LogStatus
+    from app.models.time_log import TimeLog
+    from app.core.security import create_access_token, token_claims_for
+
+    db = SessionLocal()
+    admin = User(username="admin", email="admin@example.com", password_hash="x", role=UserRole.admin)
+    db.add(admin)
+    db.flush()
+    manager_rows, employee_rows = [], []
+    for m in range(managers):
+        manager = User(username=f"mgr{m}", email=f"mgr{m}@example.com", password_hash="x", role=UserRole.manager, created_by=admin.id)
+        db.add(manager)
+        db.flush()
+        manager_rows.append(manager)
+        for e in range(employees):
+            employee = User(username=f"emp{m}_{e}", email=f"emp{m}_{e}@example.com", password_hash="x", role=UserRole.employee, created_by=manager.id)
+            db.add(employee)
+            db.flush()
+            employee_rows.append(employee)
+            for t in range(tasks_per_employee):
+                task = Task(title=f"T{m}-{e}-{t}", description="x", status=TaskStatus.pending, assigned_to=employee.id, created_by=manager.id)
+                db.add(task)
+                db.flush()
+                db.add(TaskLog(task_id=task.id, status=LogStatus.pending))
+                db.add(TimeLog(task_id=task.id, user_id=employee.id, date=date.today(), hours=1))
+    db.commit()
+    tokens = {
+        "admin": create_access_token(token_claims_for(admin)),
+        "manager": create_access_token(token_claims_for(manager_rows[0])),
+        "employee": create_access_token(token_claims_for(employee_rows[0])),
+    }
+    ids = {"manager": str(manager_rows[0].id), "employee": str(employee_rows[0].id)}
+    db.close()
+    return tokens, ids
+
+
+# statements allowed per page, at any data size
+PINNED = {
+    "/manager/dashboard": 4,
+    "/manager/{id}/employees/{id}": 3,
+    "/employee/dashboard": 7,
+}
+
+
+def pages(ids: dict):
+    return [
+        ("admin", "/admin/dashboard"),
+        ("admin", "/admin/managers"),
+        ("admin", "/admin/employees"),
+        ("admin", "/admin/tasks"),
+        ("manager", "/manager/dashboard"),
+        ("manager", f"/manager/{ids['manager']}/tasks"),
+        ("manager", f"/manager/{ids['manager']}/employees/{ids['employee']}"),
+        ("employee", "/employee/dashboard"),
+        ("employee", f"/employee/{ids['employee']}/tasks"),
+    ]
+
+
+def measure(client, tokens: dict, ids: dict) -> dict:
+    from app.core.query_stats import track_queries
+
+    counts = {}
+    for who, path in pages(ids):
+        client.cookies.clear()
+        client.cookies.set("access_token", tokens[who])
+        with track_queries() as stats:
+            response = client.get(path)
+        response.raise_for_status()
+        top = stats.repeated()
+        counts[path.replace(ids["manager"], "{id}").replace(ids["employee"], "{id}")] = (int(response.headers["X-Query-Count"]), top[0] if top else None)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--managers", type=int, default=2)
+    parser.add_argument("--employees", type=int, default=5, help="per manager")
+    parser.add_argument("--tasks-per-employee", type=int, default=4)
+    parser.add_argument("--budget", type=int, default=None, help="fail if any page at the larger size exceeds this many queries")
+    args = parser.parse_args()
+
+    use_database()
+    from fastapi.testclient import TestClient
+    from app.db import Base, engine
+    import main as app_main
+
+    results = []
+    for scale in (1, 2):
+        Base.metadata.drop_all(bind=engine)
+        create_schema()
+        tokens, ids = seed(args.managers * scale, args.employees * scale, args.tasks_per_employee)
+        with TestClient(app_main.app) as client:
+            results.append(measure(client, tokens, ids))
+
+    small, large = results
+    over_budget = False
+    for path, (count, _) in small.items():
+        large_count, top = large[path]
+        flag = "  <- grows with data" if large_count > count else ""
+        print(f"{path:32} {count:5} -> {large_count:5}{flag}")
+        if flag and top:
+            print(f"{'':32} most repeated ({top[1]}x): {top[0][:100]}")
+        if args.budget is not None and large_count > args.budget:
+            over_budget = True
+        pinned = PINNED.get(path)
+        if pinned is not None and max(count, large_count) > pinned:
+            print(f"{'':32} over its pinned budget of {pinned}")
+            over_budget = True
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
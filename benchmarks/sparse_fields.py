@@ -0,0 +1,66 @@
+# benchmarks/sparse_fields.py
+"""Payload size and latency of GET /manager/{id}/tasks by `fields=`.
+
+Seeds one manager's tasks with descriptions of realistic length, then times
+the list with the default fields (no description), with every field, and with
+a minimal mobile-style projection.
+
+    python benchmarks/sparse_fields.py --tasks 20000 --description-bytes 2000
+"""
+import argparse
+import statistics
+import time
+
+from _common import use_database, create_schema, seed_bulk
+
+VARIANTS = (
+    ("default", {}),
+    ("all fields", {"fields": "title,description,status,assigned_to,start_date,due_date,created_at"}),
+    ("title,status", {"fields": "title,status"}),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--employees", type=int, default=50)
+    parser.add_argument("--description-bytes", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    use_database()
+    from fastapi.testclient import TestClient
+    from sqlalchemy import update
+    from app.db import SessionLocal, engine
+    from app.models.task import Task
+    from app.models.user import User
+    from app.core.security import create_access_token, token_claims_for
+    import main as app_main
+
+    create_schema()
+    with engine.begin() as conn:
+        seeded = seed_bulk(conn, args.tasks, 1, args.employees)
+        conn.execute(update(Task).values(description="lorem ipsum " * (args.description_bytes // 12)))
+    manager_id = seeded["manager_ids"][0]
+    db = SessionLocal()
+    token = create_access_token(token_claims_for(db.get(User, manager_id)))
+    db.close()
+
+    print(f"{'fields':>14} {'median':>10} {'KB/page':>8}")
+    with TestClient(app_main.app) as client:
+        client.cookies.set("access_token", token)
+        client.get(f"/manager/{manager_id}/tasks").raise_for_status()  # warm up
+        for label, params in VARIANTS:
+            params = {"limit": args.limit, **params}
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                response = client.get(f"/manager/{manager_id}/tasks", params=params)
+                timings.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+            print(f"{label:>14} {statistics.median(timings):>7.1f} ms {len(response.content) / 1024:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/task_batch.py
+"""Creating N tasks one request at a time vs one batch request.
+
+Posts the same tasks to POST /manager/{id}/tasks once per task, then to
+POST /manager/{id}/tasks/batch as JSON and as CSV, and reports wall time and
+SQL statements (X-Query-Count) for each.
+
+    python benchmarks/task_batch.py --tasks 500
+"""
+import argparse
+import time
+
+from _common import use_database, create_schema, seed_bulk
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--employees", type=int, default=50)
+    args = parser.parse_args()
+
+    use_database()
+    from fastapi.testclient import TestClient
+    from app.db import SessionLocal, engine
+    from app.models.user import User
+    from app.core.security import create_access_token, token_claims_for
+    import main as app_main
+
+    create_schema()
+    with engine.begin() as conn:
+        seeded = seed_bulk(conn, 0, 1, args.employees)
+    manager_id = seeded["manager_ids"][0]
+    active = [e for i, e in enumerate(seeded["employee_ids"]) if i % 10 != 0]  # seed_bulk deactivates every tenth
+    db = SessionLocal()
+    token = create_access_token(token_claims_for(db.get(User, manager_id)))
+    db.close()
+
+    items = [
+        {"title": f"Batch task {i}", "description": "Imported", "assigned_to": str(active[i % len(active)]), "due_date": "2030-01-01"}
+        for i in range(args.tasks)
+    ]
+    csv_body = "title,description,assigned_to,due_date\n" + "".join(
+        f"{t['title']},{t['description']},{t['assigned_to']},{t['due_date']}\n" for t in items
+    )
+
+    print(f"{'path':>16} {'seconds':>8} {'statements':>11}")
+    with TestClient(app_main.app) as client:
+        client.cookies.set("access_token", token)
+
+        start, statements = time.perf_counter(), 0
+        for item in items:
+            response = client.post(f"/manager/{manager_id}/tasks", json=item)
+            response.raise_for_status()
+            statements += int(response.headers.get("x-query-count", 0))
+        print(f"{'one by one':>16} {time.perf_counter() - start:>8.2f} {statements:>11,}")
+
+        for label, kwargs in (
+            ("batch json", {"json": {"tasks": items}}),
+            ("batch csv", {"content": csv_body, "headers": {"content-type": "text/csv"}}),
+        ):
+            start = time.perf_counter()
+            response = client.post(f"/manager/{manager_id}/tasks/batch", **kwargs)
+            response.raise_for_status()
+            print(f"{label:>16} {time.perf_counter() - start:>8.2f} {int(response.headers.get('x-query-count', 0)):>11,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# benchmarks/task_explorer.py
+"""Admin task explorer page cost as the data grows.
+
+For each dataset size, times the first page of GET /admin/tasks/data and
+then a page deep into the result, reached by following the cursor. It also
+times a page filtered by one manager and status. With keyset pagination a
+deep page should cost about the same as the first.
+
+    python benchmarks/task_explorer.py --tasks 10000,100000 --depth 40
+"""
+import argparse
+import statistics
+import time
+
+from _common import use_database, create_schema, seed_bulk
+
+
+def timed_get(client, path: str, params: dict, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(path, params=params)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return statistics.median(timings), response.json()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", default="10000,100000", help="comma-separated task counts")
+    parser.add_argument("--managers", type=int, default=50)
+    parser.add_argument("--employees", type=int, default=500)
+    parser.add_argument("--depth", type=int, default=40, help="pages to follow before timing the deep page")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    use_database()
+    from fastapi.testclient import TestClient
+    from app.db import Base, SessionLocal, engine
+    from app.models.user import User
+    from app.core.security import create_access_token, token_claims_for
+    import main as app_main
+
+    print(f"{'tasks':>10} {'first page':>12} {'page ' + str(args.depth):>12} {'filtered':>12}")
+    for tasks in (int(n) for n in args.tasks.split(",")):
+        Base.metadata.drop_all(bind=engine)
+        create_schema()
+        with engine.begin() as conn:
+            seeded = seed_bulk(conn, tasks, args.managers, args.employees)
+        db = SessionLocal()
+        token = create_access_token(token_claims_for(db.get(User, seeded["admin_id"])))
+        db.close()
+
+        with TestClient(app_main.app) as client:
+            client.cookies.set("access_token", token)
+            first_ms, page = timed_get(client, "/admin/tasks/data", {}, args.repeat)
+            for _ in range(args.depth - 1):
+                page = client.get("/admin/tasks/data", params={"cursor": page["next_cursor"]}).json()
+            deep_ms, _ = timed_get(client, "/admin/tasks/data", {"cursor": page["next_cursor"]}, args.repeat)
+            filtered_ms, _ = timed_get(client, "/admin/tasks/data", {"manager_id": str(seeded["manager_ids"][0]), "status": "pending"}, args.repeat)
+        print(f"{tasks:>10,} {first_ms:>9.1f} ms {deep_ms:>9.1f} ms {filtered_ms:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
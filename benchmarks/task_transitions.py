@@ -0,0 +1,72 @@
+# benchmarks/task_transitions.py
+"""Changing the status of N tasks one request at a time vs one bulk request.
+
+Moves the same number of pending tasks to "in progress" through
+POST /employee/{id}/tasks/{task_id} (the dashboard form, one task per
+request), then another set through POST /manager/{id}/tasks/transitions,
+and reports wall time and SQL statements (X-Query-Count) for each.
+
+    python benchmarks/task_transitions.py --tasks 500
+"""
+import argparse
+import time
+
+from _common import use_database, create_schema, seed_bulk
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=500)
+    args = parser.parse_args()
+
+    use_database()
+    from fastapi.testclient import TestClient
+    from sqlalchemy import select
+    from app.db import SessionLocal, engine
+    from app.models.task import Task, TaskStatus
+    from app.models.user import User
+    from app.core.security import create_access_token, token_claims_for
+    import main as app_main
+
+    create_schema()
+    with engine.begin() as conn:
+        seeded = seed_bulk(conn, 0, 1, 2)
+    manager_id = seeded["manager_ids"][0]
+    employee_id = seeded["employee_ids"][1]  # seed_bulk deactivates every tenth, starting with the first
+    db = SessionLocal()
+    manager_token = create_access_token(token_claims_for(db.get(User, manager_id)))
+    employee_token = create_access_token(token_claims_for(db.get(User, employee_id)))
+    db.close()
+
+    print(f"{'path':>16} {'seconds':>8} {'statements':>11}")
+    with TestClient(app_main.app) as client:
+        client.cookies.set("access_token", manager_token)
+        items = [{"title": f"Task {i}", "description": "d", "assigned_to": str(employee_id)} for i in range(2 * args.tasks)]
+        for start in range(0, len(items), 1000):
+            client.post(f"/manager/{manager_id}/tasks/batch", json=items[start:start + 1000]).raise_for_status()
+        with SessionLocal() as db:
+            task_ids = list(db.scalars(select(Task.id).where(Task.status == TaskStatus.pending)))
+        one_by_one, bulk = task_ids[:args.tasks], task_ids[args.tasks:]
+
+        client.cookies.clear()
+        client.cookies.set("access_token", employee_token)
+        start, statements = time.perf_counter(), 0
+        for task_id in one_by_one:
+            response = client.post(f"/employee/{employee_id}/tasks/{task_id}", data={"status": "in progress"}, follow_redirects=False)
+            assert response.status_code == 303, response.text
+            statements += int(response.headers.get("x-query-count", 0))
+        print(f"{'one by one':>16} {time.perf_counter() - start:>8.2f} {statements:>11,}")
+
+        client.cookies.clear()
+        client.cookies.set("access_token", manager_token)
+        start = time.perf_counter()
+        response = client.post(
+            f"/manager/{manager_id}/tasks/transitions",
+            json=[{"task_id": str(task_id), "status": "in progress"} for task_id in bulk],
+        )
+        response.raise_for_status()
+        print(f"{'bulk':>16} {time.perf_counter() - start:>8.2f} {int(response.headers.get('x-query-count', 0)):>11,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# benchmarks/templates.py
+"""Startup and first-render latency of the shared Jinja2 environment.
+
+Each configuration runs in a fresh interpreter, which imports the app
+(startup) and then renders every page in app/templates/ once (first render,
+which includes compiling the template unless it was precompiled):
+
+  no bytecode cache      compile from source on first render
+  bytecode cache, cold   same, and write .cache files
+  bytecode cache, warm   load the files written by the previous run
+  warm + precompile      TEMPLATE_PRECOMPILE=true: all loading happens at startup
+
+Pages are rendered without real data (undefined variables render empty), so
+the numbers are template overhead, not query time.
+
+    python benchmarks/templates.py --repeat 5
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from _common import ROOT, use_database
+
+
+def child():
+    start = time.perf_counter()
+    use_database(reset=False)
+    import main  # noqa: F401 (the whole app, as uvicorn would import it)
+    from app.core.config import settings
+    from app.core.templates import templates, precompile_templates
+    if settings.TEMPLATE_PRECOMPILE:
+        precompile_templates()
+    startup_ms = (time.perf_counter() - start) * 1000
+
+    from jinja2 import ChainableUndefined
+    env = templates.env
+    env.undefined = ChainableUndefined  # render with an empty context
+
+    class FakeRequest:
+        def url_for(self, *args, **kwargs):
+            return "/"
+
+    renders = {}
+    for name in env.list_templates(filter_func=lambda n: n.endswith(".html")):
+        start = time.perf_counter()
+        template = env.get_template(name)
+        try:
+            template.render({"request": FakeRequest()})
+        except Exception:
+            pass  # e.g. |tojson on an undefined value; the load/compile time is still counted
+        renders[name] = (time.perf_counter() - start) * 1000
+    print(json.dumps({"startup_ms": startup_ms, "renders": renders}))
+
+
+def run(env_overrides: dict) -> dict:
+    env = dict(os.environ, DB_ECHO="false", **env_overrides)
+    out = subprocess.run([sys.executable, __file__, "--child"], env=env, cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--repeat", type=int, default=5, help="fresh processes per configuration")
+    args = parser.parse_args()
+    if args.child:
+        return child()
+
+    use_database()  # create the throwaway database once so children do not race on it
+    cache_dir = tempfile.mkdtemp(prefix="jinja-bench-")
+    configs = [
+        ("no bytecode cache", {"TEMPLATE_BYTECODE_CACHE_DIR": "", "TEMPLATE_PRECOMPILE": "false"}, False),
+        ("bytecode cache, cold", {"TEMPLATE_BYTECODE_CACHE_DIR": cache_dir, "TEMPLATE_PRECOMPILE": "false"}, True),
+        ("bytecode cache, warm", {"TEMPLATE_BYTECODE_CACHE_DIR": cache_dir, "TEMPLATE_PRECOMPILE": "false"}, False),
+        ("warm + precompile", {"TEMPLATE_BYTECODE_CACHE_DIR": cache_dir, "TEMPLATE_PRECOMPILE": "true"}, False),
+    ]
+    print(f"{'configuration':>22} {'startup':>10} {'1st render: sum':>16} {'median':>8} {'max':>8}  slowest page")
+    try:
+        for label, overrides, clear_first in configs:
+            results = []
+            for _ in range(args.repeat):
+                if clear_first:
+                    shutil.rmtree(cache_dir, ignore_errors=True)
+                results.append(run(overrides))
+            startup = statistics.median(r["startup_ms"] for r in results)
+            per_page = {name: statistics.median(r["renders"][name] for r in results) for name in results[0]["renders"]}
+            slowest = max(per_page, key=per_page.get)
+            print(f"{label:>22} {startup:>7.0f} ms {sum(per_page.values()):>13.1f} ms {statistics.median(per_page.values()):>5.2f} ms "
+                  f"{per_page[slowest]:>5.2f} ms  {slowest}")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
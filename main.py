@@ -1,22 +1,35 @@
 from fastapi import FastAPI, APIRouter, Request, Depends
 from typing import Optional
-from fastapi.templating import Jinja2Templates
+from contextlib import asynccontextmanager
 from fastapi.responses import HTMLResponse
 import logging
-from fastapi.staticfiles import StaticFiles
-from app.routers import auth, manager, tasks, admin, employee
+from app.routers import auth, manager, tasks, admin, employee, exports
 from app.db import Base, engine, get_db
-from app.core.security import get_optional_user
+from app.core.security import get_optional_user, shutdown_hash_executor
+from app.core.query_stats import query_stats_middleware
+from app.core.config import settings
+from app.core.templates import templates, precompile_templates
+from app.core.assets import AssetFiles, get_assets
+from app.core.responses import JSONResponse
 from sqlalchemy.orm import Session
 from app.models.user import User
 
-app = FastAPI(title="Task Management System API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.TEMPLATE_PRECOMPILE:
+        precompile_templates()
+    yield
+    shutdown_hash_executor()
+
+app = FastAPI(title="Task Management System API", lifespan=lifespan, default_response_class=JSONResponse)
 
-templates = Jinja2Templates(directory="app/templates")
 
 # Basic logging setup to help local debugging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
 
+# statement count / DB time per request (Server-Timing, X-Query-Count)
+app.middleware("http")(query_stats_middleware)
+
 # include routers
 app.include_router(auth.router)
 app.include_router(manager.router)
@@ -24,10 +37,10 @@ app.include_router(admin.router)
 app.include_router(employee.router)
 app.include_router(tasks.manager_tasks_router)
 app.include_router(tasks.employee_tasks_router)
+app.include_router(exports.router)
 
-# Serve static JS/CSS from templates folders so frontend assets are available
-app.mount("/js", StaticFiles(directory="app/templates/js"), name="js")
-app.mount("/css", StaticFiles(directory="app/templates/css"), name="css")
+# Fingerprinted JS/CSS built from the templates folders (templates link them via asset_url)
+app.mount(settings.ASSET_URL_PREFIX, AssetFiles(directory=get_assets().build_dir), name="assets")
 
 @app.get("/", response_class=HTMLResponse)
 def root(request: Request, db: Session = Depends(get_db), current_user: Optional[User] = Depends(get_optional_user)):
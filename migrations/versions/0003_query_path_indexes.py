@@ -0,0 +1,52 @@
+"""indexes for the router query paths
+
+On Postgres the indexes are built CONCURRENTLY outside the migration
+transaction, so large tables stay writable while they build. If a
+concurrent build fails it leaves an INVALID index behind; drop it and
+re-run the upgrade.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# (name, table, columns)
+INDEXES = [
+    ("ix_tasks_created_by_created_at", "tasks", ["created_by", "created_at"]),
+    ("ix_tasks_assigned_to_created_at", "tasks", ["assigned_to", "created_at"]),
+    ("ix_tasks_assigned_to_status", "tasks", ["assigned_to", "status"]),
+    ("ix_tasks_created_at", "tasks", ["created_at"]),
+    ("ix_time_logs_user_id_date", "time_logs", ["user_id", "date"]),
+    ("ix_task_logs_task_id_created_at", "task_logs", ["task_id", "created_at"]),
+    ("ix_users_created_by_role_is_active", "users", ["created_by", "role", "is_active"]),
+]
+
+
+def _is_postgres():
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade():
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade():
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
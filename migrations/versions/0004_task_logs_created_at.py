@@ -0,0 +1,31 @@
+"""task_logs.created_at index for the admin dashboard history
+
+The dashboard reads the newest task logs across all of an admin's tasks;
+this index lets that query walk newest-first and stop after one page.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index("ix_task_logs_created_at", "task_logs", ["created_at"], postgresql_concurrently=True, if_not_exists=True)
+    else:
+        op.create_index("ix_task_logs_created_at", "task_logs", ["created_at"], if_not_exists=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index("ix_task_logs_created_at", table_name="task_logs", postgresql_concurrently=True, if_exists=True)
+    else:
+        op.drop_index("ix_task_logs_created_at", table_name="task_logs", if_exists=True)
@@ -0,0 +1,49 @@
+"""user_task_stats table for dashboard counts
+
+One row of task counters per assignee, maintained by the task routes
+(app/utils/task_stats.py). Existing tasks are counted into it here; the
+same counts can be recomputed later with `python script.py rebuild-task-stats`.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "user_task_stats",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("total", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("pending", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("in_progress", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("completed", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("overdue", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_activity_at", sa.DateTime(timezone=True)),
+    )
+    op.execute("""
+        INSERT INTO user_task_stats (user_id, total, pending, in_progress, completed, overdue, last_activity_at)
+        SELECT t.assigned_to,
+               COUNT(*),
+               SUM(CASE WHEN t.status = 'pending' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN t.status = 'in_progress' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN t.status = 'completed' THEN 1 ELSE 0 END),
+               SUM(CASE WHEN t.due_date < CURRENT_DATE AND t.status <> 'completed' THEN 1 ELSE 0 END),
+               (SELECT MAX(l.created_at) FROM task_logs l JOIN tasks t2 ON t2.id = l.task_id
+                 WHERE t2.assigned_to = t.assigned_to)
+          FROM tasks t
+         WHERE t.assigned_to IS NOT NULL
+         GROUP BY t.assigned_to
+    """)
+
+
+def downgrade():
+    op.drop_table("user_task_stats")
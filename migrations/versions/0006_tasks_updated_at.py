@@ -0,0 +1,54 @@
+"""tasks.updated_at
+
+Existing rows start with updated_at = created_at. The (created_by, updated_at)
+and (assigned_to, updated_at) indexes let the task list ETag query (row count
+plus latest update) run from the index alone. On Postgres they are built
+CONCURRENTLY, as in 0003.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_tasks_created_by_updated_at", "tasks", ["created_by", "updated_at"]),
+    ("ix_tasks_assigned_to_updated_at", "tasks", ["assigned_to", "updated_at"]),
+]
+
+
+def _is_postgres():
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade():
+    op.add_column("tasks", sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE tasks SET updated_at = created_at")
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.alter_column("updated_at", existing_type=sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now())
+
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade():
+    if _is_postgres():
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("updated_at")
@@ -1,17 +1,29 @@
 # script.py
 import sys
 from getpass import getpass
+import os
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 from datetime import datetime
 import uuid
+from alembic import command
+from alembic.config import Config
 from app.db import Base, engine, get_db
-from app.models import user, task, task_log, time_log
+from app.models import user, task, task_log, time_log, task_stats  # noqa: F401 (register tables)
 from app.models.user import User, UserRole
 from app.core.security import hash_password
 
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini")
+
 def create_tables():
-    print("📦 Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    print("📦 Running database migrations...")
+    config = Config(ALEMBIC_INI)
+    tables = inspect(engine).get_table_names()
+    if "users" in tables and "alembic_version" not in tables:
+        # database created by create_all before migrations existed
+        print("⚠️  Existing schema found, stamping it at the initial revision.")
+        command.stamp(config, "0001")
+    command.upgrade(config, "head")
     print("✅ Tables created successfully.")
 
 def create_superuser():
@@ -48,6 +60,76 @@ def create_superuser():
     db.commit()
     print("✅ Superuser created successfully.")
 
+def rebuild_task_stats():
+    from app.utils.task_stats import rebuild_task_stats as rebuild
+    db: Session = next(get_db())
+    print("🔄 Rebuilding per-user task stats...")
+    rows = rebuild(db)
+    db.commit()
+    print(f"✅ Task stats rebuilt for {rows} users.")
+
+def build_assets():
+    from app.core.assets import build_assets as build
+    from app.core.config import settings
+    print("🎨 Fingerprinting and compressing JS/CSS...")
+    manifest = build()
+    print(f"✅ {len(manifest)} assets written to {settings.ASSET_BUILD_DIR}.")
+
+def import_employees(manager=None, path=None, workers=None):
+    import json
+    from app.utils.cache_utils import invalidate_manager_cache
+    from app.utils.onboarding import validate_employees, create_employees
+    from app.utils.request_utils import csv_items
+
+    if not manager or not path:
+        print("❌ Usage: python script.py import-employees <manager email or id> <file.csv|file.json> [workers]")
+        sys.exit(1)
+    db: Session = next(get_db())
+    try:
+        manager_filter = User.id == uuid.UUID(manager)
+    except ValueError:
+        manager_filter = User.email == manager.strip().lower()
+    manager_user = db.query(User).filter(manager_filter, User.role == UserRole.manager).first()
+    if not manager_user:
+        print(f"❌ No manager found for {manager}.")
+        sys.exit(1)
+
+    is_json = path.lower().endswith(".json")
+    with open(path, encoding="utf-8-sig") as fh:
+        if is_json:
+            items = json.load(fh)
+            items = items.get("employees", []) if isinstance(items, dict) else items
+        else:
+            items = csv_items(fh.read())
+
+    print(f"👥 Checking {len(items)} employees for {manager_user.email}...")
+    accepted, errors = validate_employees(db, items)
+    first_row = 1 if is_json else 2  # CSV line 1 is the header
+    for error in errors:
+        print(f"⚠️  Row {error['index'] + first_row} skipped: {'; '.join(error['errors'])}")
+
+    db.rollback()  # no transaction held open while hashing
+    started = datetime.now()
+    def progress(done, total):
+        print(f"\r🔐 Hashing passwords: {done}/{total}", end="\n" if done == total else "", flush=True)
+    created = create_employees(db, manager_user.id, accepted, workers=int(workers) if workers else None, progress=progress)
+    db.commit()
+    invalidate_manager_cache(manager_user.id)
+    seconds = (datetime.now() - started).total_seconds()
+    print(f"✅ {len(created)} employees created in {seconds:.1f}s, {len(errors)} skipped.")
+
+COMMANDS = {
+    "rebuild-task-stats": rebuild_task_stats,
+    "build-assets": build_assets,
+    "import-employees": import_employees,
+}
+
 if __name__ == "__main__":
-    create_tables()
-    create_superuser()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        if sys.argv[1] not in COMMANDS:
+            print(f"❌ Unknown command: {sys.argv[1]} (available: {', '.join(COMMANDS)})")
+            sys.exit(1)
+        COMMANDS[sys.argv[1]](*sys.argv[2:])
+    else:
+        create_tables()
+        create_superuser()
\ No newline at end of file